@@ -38,8 +38,12 @@ modules = [
 
     # ----------------------- Regression List --------------------------
     'scripts/aerodynamics/aerodynamics.py', 
+    'scripts/aerodynamics/vortex_lattice_influence.py', 
+    'scripts/aerodynamics/vortex_lattice_training.py', 
     'scripts/airfoil_import/airfoil_import_test.py',    
+    'scripts/airfoil_import/airfoil_polars_cache.py',    
     'scripts/atmosphere/atmosphere.py',
+    'scripts/atmosphere/atmosphere_lookup_table.py',
     'scripts/atmosphere/constant_temperature.py',
     'scripts/AVL/test_AVL.py',
     'scripts/B737/mission_B737.py',
@@ -48,6 +52,7 @@ modules = [
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',    
     'scripts/concorde/concorde.py',
+    'scripts/data_access/data_access.py',
     'scripts/DC_10_noise/DC_10_noise.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
@@ -69,17 +74,30 @@ modules = [
     'scripts/motor/motor_test.py',     
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py', 
+    'scripts/noise_optimization/noise_footprint.py', 
+    'scripts/noise_optimization/noise_levels.py', 
     'scripts/optimization_packages/optimization_packages.py',    
+    'scripts/optimization_packages/batch_evaluation.py',    
+    'scripts/optimization_packages/evaluation_cache.py',    
+    'scripts/optimization_packages/alias_accessors.py',    
+    'scripts/optimization_packages/particle_swarm.py',    
     'scripts/payload_range/payload_range.py', 
     'scripts/plots/plot_test.py',    
     'scripts/propeller/propeller_test.py',
+    'scripts/propeller/rotor_inflow.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
     'scripts/ramjet_network/ramjet_network.py',
+    'scripts/ramjet_network/mach_number_solvers.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',   
     'scripts/segments/segment_test.py',     
+    'scripts/segments/parallel_segments.py',
+    'scripts/segments/packed_conditions.py',
+    'scripts/segments/packing_plan.py',
+    'scripts/segments/solver_jacobian.py',
+    'scripts/segments/warm_start.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
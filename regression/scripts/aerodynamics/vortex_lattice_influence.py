@@ -0,0 +1,198 @@
+# vortex_lattice_influence.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Runs the vortex lattice with and without the influence cache and the memory budget, and checks
+    the results against each other. Also checks the trailing leg sums and the Mach cone matrix
+    against the loops they replaced.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM, influence_memory
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution import compute_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import \
+     compute_induced_velocity_matrix, compute_wake_independent_influence, apply_wake_angle, \
+     sum_downstream_legs, compute_mach_cone_matrix
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    trailing_legs()
+    mach_cone(vehicle)
+    wake_angle(vehicle)
+
+    # subsonic and supersonic conditions, some of them repeated for the cache
+    aoa  = np.array([[2.],[-1.],[4.],[2.],[6.],[2.]]) * np.pi/180.
+    mach = np.array([[0.3],[0.6],[0.8],[0.3],[1.4],[2.0]])
+
+    reference = run_VLM(vehicle,aoa,mach,settings_setup())
+
+    # the influence cache, evaluated twice to use the stored matrices and factorizations
+    settings = settings_setup()
+    settings.use_influence_cache = True
+    for i in range(2):
+        check('cached',reference,run_VLM(vehicle,aoa,mach,settings))
+
+    # a memory budget for a few conditions at a time, for a single condition and for a few rows
+    n_cp = compute_vortex_distribution(vehicle,settings_setup()).n_cp
+    for budget in [influence_memory(4,n_cp,n_cp),influence_memory(1,n_cp,n_cp),influence_memory(1,7,n_cp)]:
+        settings = settings_setup()
+        settings.influence_memory_budget = budget
+        check('blocked',reference,run_VLM(vehicle,aoa,mach,settings))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Induced Velocity Matrix
+# ----------------------------------------------------------------------
+
+def trailing_legs():
+
+    n_cw = 4
+    C_AB = np.random.RandomState(0).rand(2,3,5*n_cw,3)
+
+    new = sum_downstream_legs(C_AB,n_cw)
+    old = reference_downstream_legs(C_AB,n_cw)
+
+    assert np.max(np.abs(new-old)) < 1e-14
+
+    return
+
+def mach_cone(vehicle):
+
+    VD   = compute_vortex_distribution(vehicle,settings_setup())
+    mach = np.array([[1.2],[1.6],[2.5]])
+
+    # the control points along the rows, as in compute_wake_independent_influence
+    XC = np.atleast_3d(VD.XC/np.sqrt(mach**2-1))
+    YC = np.atleast_3d(VD.YC*np.ones_like(mach))
+    ZC = np.atleast_3d(VD.ZC*np.ones_like(mach))
+
+    shape = (len(mach),VD.n_cp,VD.n_cp,3)
+    new   = compute_mach_cone_matrix(XC,YC,ZC,np.ones(shape),mach)
+    old   = reference_mach_cone_matrix(XC,YC,ZC,np.ones(shape),mach)
+
+    assert np.any(new == 0.)
+    assert np.all(new == old)
+
+    # a block of rows
+    rows = slice(5,12)
+    assert np.all(compute_mach_cone_matrix(XC,YC,ZC,np.ones((len(mach),7,VD.n_cp,3)),mach,rows) == old[:,rows])
+
+    return
+
+def wake_angle(vehicle):
+
+    settings = settings_setup()
+    VD       = compute_vortex_distribution(vehicle,settings)
+    n_sw     = settings.number_panels_spanwise
+    n_cw     = settings.number_panels_chordwise
+    mach     = np.array([[0.5],[1.5]])
+
+    # the wake independent parts are the same for any wake angle
+    C_0, DW_0, W, MCM = compute_wake_independent_influence(VD,n_sw,n_cw,mach.copy())
+    for theta_w in [np.array([[0.],[0.]]),np.array([[0.1],[-0.05]])]:
+        C_mn, DW_mn = compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach.copy())
+        C_wk, DW_wk = apply_wake_angle(C_0,DW_0,W,theta_w)
+        assert np.all(C_mn  == C_wk)
+        assert np.all(DW_mn == DW_wk)
+        assert np.all(VD.MCM == MCM)
+
+        # the rows in blocks
+        rows = slice(10,30)
+        C_r, DW_r = compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach.copy(),rows)
+        assert np.max(np.abs(C_r  - C_mn[:,rows]))  < 1e-12
+        assert np.max(np.abs(DW_r - DW_mn[:,rows])) < 1e-12
+
+    return
+
+# ----------------------------------------------------------------------
+#   Reference Loops
+# ----------------------------------------------------------------------
+
+def reference_downstream_legs(C_AB,n_cw):
+    """ the trailing leg sums as they were computed before sum_downstream_legs """
+
+    n_cp    = np.shape(C_AB)[2]
+    on_wing = np.zeros_like(C_AB)
+    for n in range(n_cp):
+        n_te_p = (n_cw-(n+1)%n_cw)
+        if (n+1)%n_cw != 0:
+            on_wing[:,:,n,:] = np.sum(C_AB[:,:,n+1:n+n_te_p,:],axis=2)
+
+    return on_wing
+
+def reference_mach_cone_matrix(XC,YC,ZC,MCM,mach):
+    """ the Mach cone matrix as it was computed one Mach number at a time """
+
+    for m_idx in range(len(mach)):
+        XC_sub = XC[m_idx,:]
+        YC_sub = YC[m_idx,:]
+        ZC_sub = ZC[m_idx,:]
+        ones   = np.ones((1,len(XC_sub)))
+
+        del_x = XC_sub*ones - XC_sub.T
+        del_y = YC_sub*ones - YC_sub.T
+        del_z = ZC_sub*ones - ZC_sub.T
+
+        c     = np.arcsin(1/mach[m_idx])
+        flag  = -c*del_x**2 + del_y**2 + del_z**2
+        idxs  = np.where(flag > 0.0)
+        MCM[m_idx,idxs[0],idxs[1]] = [0.0, 0.0, 0.0]
+
+    return MCM
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def settings_setup():
+
+    settings = Data()
+    settings.number_panels_spanwise    = 6
+    settings.number_panels_chordwise   = 3
+    settings.use_surrogate             = True
+    settings.include_slipstream_effect = False
+    settings.use_influence_cache       = False
+    settings.influence_cache_size      = 16
+    settings.influence_memory_budget   = None
+
+    return settings
+
+def run_VLM(vehicle,aoa,mach,settings):
+
+    conditions = Data()
+    conditions.aerodynamics = Data()
+    conditions.freestream   = Data()
+    conditions.aerodynamics.angle_of_attack = aoa.copy()
+    conditions.freestream.mach_number       = mach.copy()
+    conditions.freestream.velocity          = np.zeros_like(mach)
+
+    return VLM(conditions,settings,vehicle)
+
+def check(name,reference,results):
+
+    error = max([np.max(np.abs(a-b)/np.maximum(np.abs(a),1.)) for a, b in zip(reference,results)])
+    print(name,error)
+    assert error < 1e-10, name
+
+    return
+
+if __name__ == '__main__':
+    main()
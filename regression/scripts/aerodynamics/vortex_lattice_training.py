@@ -0,0 +1,180 @@
+# vortex_lattice_training.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Builds the vortex lattice surrogate on an adaptive training grid and checks the training data
+    against the vortex lattice. Also checks that the training data cache on disk gives the same
+    surrogate, and that a change of the geometry does not use the cached training data.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Aerodynamics.Vortex_Lattice import calculate_VLM, leave_one_out_error
+
+import numpy as np
+import warnings
+import tempfile
+import shutil
+import os
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    leave_one_out()
+
+    directory = tempfile.mkdtemp()
+    try:
+        training_cache(directory)
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Adaptive Training and the Cache
+# ----------------------------------------------------------------------
+
+def training_cache(directory):
+
+    # the adaptive grid
+    vehicle  = vehicle_setup()
+    analysis = analysis_setup(vehicle,directory)
+    cache_file = analysis.training_cache_file()
+    analysis.initialize(True,False,None,None,False)
+
+    training  = analysis.training
+    AoA       = training.angle_of_attack[:,0]
+    Mach      = training.Mach[:,0]
+    n_sub     = np.sum(Mach<1.)
+    print('Adaptive grid:',len(AoA),'angles of attack,',n_sub,'subsonic and',len(Mach)-n_sub,'supersonic Mach numbers')
+
+    assert len(AoA)*len(Mach) <= training.maximum_evaluations
+    assert len(AoA) > training.initial_points or len(Mach) > 2*training.initial_points
+    assert np.all(np.diff(AoA) > 0.) and np.all(np.diff(Mach[:n_sub]) > 0.) and np.all(np.diff(Mach[n_sub:]) > 0.)
+    assert AoA[0] == -5.*Units.deg and AoA[-1] == 12.*Units.deg
+
+    # the training data is the vortex lattice on the grid
+    CL, CDi = run_VLM(analysis,AoA,Mach)
+    assert np.max(np.abs(CL[:,:n_sub]  - training.lift_coefficient_sub)) < 1e-12
+    assert np.max(np.abs(CL[:,n_sub:]  - training.lift_coefficient_sup)) < 1e-12
+    assert np.max(np.abs(CDi[:,:n_sub] - training.drag_coefficient_sub)) < 1e-12
+    assert np.max(np.abs(CDi[:,n_sub:] - training.drag_coefficient_sup)) < 1e-12
+
+    # the cache file was written, named by the training inputs before the grid was refined
+    assert os.path.isfile(cache_file)
+    assert os.listdir(directory) == [os.path.basename(cache_file)]
+
+    # the same vehicle loads the training data instead of sampling it
+    cached = analysis_setup(vehicle_setup(),directory)
+    cached.sample_training = no_sampling
+    cached.initialize(True,False,None,None,False)
+
+    for key in ['angle_of_attack','Mach','lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+        assert np.all(cached.training[key] == training[key]), key
+    for key in ['wing_lift_coefficient_sub','wing_lift_coefficient_sup','wing_drag_coefficient_sub','wing_drag_coefficient_sup']:
+        for wing in vehicle.wings.keys():
+            assert np.all(cached.training[key][wing] == training[key][wing]), key
+
+    # and gives the same surrogate
+    assert np.all(evaluate_surrogate(cached) == evaluate_surrogate(analysis))
+
+    # a changed geometry or panel count is not found in the cache
+    swept = vehicle_setup()
+    swept.wings.main_wing.sweeps.quarter_chord = 30. * Units.deg
+    refined = analysis_setup(vehicle_setup(),directory)
+    refined.settings.number_panels_spanwise = 6
+    for other in [analysis_setup(swept,directory),refined]:
+        assert other.training_cache_file() != cache_file
+        assert not other.load_training(other.training_cache_file())
+
+    # an unreadable file is a miss with a warning
+    with open(cache_file,'wb') as file:
+        file.write(b'not a training cache')
+    other = analysis_setup(vehicle_setup(),directory)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        assert not other.load_training(cache_file)
+    assert len(caught) == 1 and 'training data cache' in str(caught[0].message)
+
+    return
+
+def leave_one_out():
+
+    x = np.linspace(0.,1.,6)
+    y = np.linspace(0.,2.,5)
+    X, Y = np.meshgrid(x,y,indexing='ij')
+
+    # a cubic is fitted exactly with a line left out
+    cubic = X**3 - 2.*X*Y + Y**2
+    for axis, n in [(0,len(x)),(1,len(y))]:
+        for i in range(1,n-1):
+            assert leave_one_out_error(x,y,cubic,i,axis) < 1e-10
+
+    # a kink is not
+    kink = np.abs(X - x[2])
+    assert leave_one_out_error(x,y,kink,2,0) > 1e-2
+
+    # constant data has no error
+    assert leave_one_out_error(x,y,np.ones_like(X),2,0) == 0.
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def analysis_setup(vehicle,directory):
+
+    analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    analysis.geometry = vehicle
+    analysis.settings.number_panels_spanwise    = 5
+    analysis.settings.number_panels_chordwise   = 2
+    analysis.settings.surrogate_cache_directory = directory
+    analysis.training.adaptive                  = True
+    analysis.training.maximum_evaluations       = 60
+
+    return analysis
+
+def run_VLM(analysis,AoA,Mach):
+
+    AoAs  = np.atleast_2d(np.tile(AoA,len(Mach))).T
+    Machs = np.atleast_2d(np.repeat(Mach,len(AoA))).T
+
+    conditions = Data()
+    conditions.aerodynamics = Data()
+    conditions.freestream   = Data()
+    conditions.aerodynamics.angle_of_attack = AoAs
+    conditions.freestream.mach_number       = Machs
+    conditions.freestream.velocity          = np.zeros_like(Machs)
+
+    CL, CDi = calculate_VLM(conditions,analysis.settings,analysis.geometry)[:2]
+
+    return np.reshape(CL,(len(Mach),len(AoA))).T, np.reshape(CDi,(len(Mach),len(AoA))).T
+
+def evaluate_surrogate(analysis):
+
+    state = Data()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.conditions.aerodynamics.angle_of_attack = np.array([[0.],[3.],[7.],[1.]]) * Units.deg
+    state.conditions.freestream.mach_number       = np.array([[0.2],[0.7],[1.1],[2.2]])
+    analysis.evaluate_surrogate(state,analysis.settings,analysis.geometry)
+
+    return np.hstack((state.conditions.aerodynamics.lift_coefficient,
+                      state.conditions.aerodynamics.drag_breakdown.induced.inviscid))
+
+def no_sampling():
+    raise AssertionError('the training data should have been loaded from the cache')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# airfoil_polars_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Computes the AERODAS polars of two airfoils with and without the airfoil cache of
+    compute_airfoil_polars, and checks that the results are the same. Also checks that a
+    modified file is read again and that the returned polars are copies.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import compute_airfoil_polars
+
+import numpy as np
+import importlib
+import tempfile
+import shutil
+import os
+
+# the module, the package exports the function under the same name
+polars_module = importlib.import_module(compute_airfoil_polars.__module__)
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+    try:
+        airfoil_cache(directory)
+    finally:
+        polars_module.airfoil_cache_size = 0
+        polars_module.airfoil_file_cache.clear()
+        polars_module.airfoil_table_cache.clear()
+        shutil.rmtree(directory)
+
+    return
+
+def airfoil_cache(directory):
+
+    # copies of the files that can be modified
+    for name in ['airfoil_geometry_1.txt','airfoil_geometry_2.txt','airfoil_polar_1.txt','airfoil_polar_2.txt']:
+        shutil.copy(name,directory)
+    a_geo = [os.path.join(directory,'airfoil_geometry_1.txt'),os.path.join(directory,'airfoil_geometry_2.txt')]
+    a_pol = [os.path.join(directory,'airfoil_polar_1.txt'),os.path.join(directory,'airfoil_polar_2.txt')]
+
+    blades = [blade_setup(0.6),blade_setup(0.9)]
+
+    # the cache is off by default
+    assert polars_module.airfoil_cache_size == 0
+    uncached = [compute_airfoil_polars(blade,a_geo,a_pol) for blade in blades]
+    assert len(polars_module.airfoil_file_cache) == 0
+    assert len(polars_module.airfoil_table_cache) == 0
+
+    # the same polars from the cache, on the first and on the repeated calls
+    polars_module.airfoil_cache_size = 4
+    for i in range(2):
+        for blade, reference in zip(blades,uncached):
+            check(compute_airfoil_polars(blade,a_geo,a_pol),reference)
+    assert len(polars_module.airfoil_file_cache)  == 1
+    assert len(polars_module.airfoil_table_cache) == 2
+
+    # the polars returned are copies of the cached tables
+    polars = compute_airfoil_polars(blades[0],a_geo,a_pol)
+    polars.lift_coefficients[:] = 0.
+    check(compute_airfoil_polars(blades[0],a_geo,a_pol),uncached[0])
+
+    # a modified file is read again, like without the cache
+    with open(a_pol[0]) as file:
+        lines = file.readlines()
+    with open(a_pol[0],'w') as file:
+        file.writelines(modify_polar(lines))
+    stat = os.stat(a_pol[0])
+    os.utime(a_pol[0],ns=(stat.st_atime_ns,stat.st_mtime_ns + 10**9))
+
+    polars_module.airfoil_cache_size = 0
+    modified = compute_airfoil_polars(blades[0],a_geo,a_pol)
+    assert np.any(modified.lift_coefficients != uncached[0].lift_coefficients)
+
+    polars_module.airfoil_cache_size = 4
+    check(compute_airfoil_polars(blades[0],a_geo,a_pol),modified)
+
+    # the least recently used entries are dropped
+    polars_module.airfoil_cache_size = 1
+    compute_airfoil_polars(blades[1],a_geo,a_pol)
+    assert len(polars_module.airfoil_file_cache)  == 1
+    assert len(polars_module.airfoil_table_cache) == 1
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def blade_setup(tip_radius):
+
+    blade = Data()
+    blade.hub_radius         = 0.1
+    blade.tip_radius         = tip_radius
+    blade.chord_distribution = np.linspace(0.12,0.06,10)
+
+    return blade
+
+def modify_polar(lines):
+    """ scales the lift coefficients of the polar table by 1.1, in the columns of the file """
+
+    modified = lines[:12]
+    for line in lines[12:]:
+        modified.append(line[:10] + '%7.4f' % (1.1*float(line[10:17])) + line[17:])
+
+    return modified
+
+def check(polars,reference):
+
+    for key in ['lift_coefficients','drag_coefficients','angle_of_attacks','thickness_to_chord']:
+        assert np.all(np.array(polars[key]) == np.array(reference[key])), key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# atmosphere_lookup_table.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Computes the US Standard 1976 atmosphere with the binary search of its layers and with the
+    lookup table, and checks them against the loop over the layers that the model used before.
+    The binary search gives the same values, the lookup table is within 6e-8 of them.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    gas        = atmosphere.fluid_properties
+    Rad        = atmosphere.planet.mean_radius
+
+    # geometric altitudes over the whole model, below and above it, and a random set
+    z = np.hstack((np.linspace(-3.,90.,9301)*Units.km,
+                   np.random.RandomState(1).uniform(-2.,86.,2000)*Units.km))
+    z = np.atleast_2d(z).T
+
+    for temperature_deviation in [0.,15.]:
+        for var_gamma in [False,True]:
+            conditions = atmosphere.compute_values(z,temperature_deviation,var_gamma)
+
+            # the same values as the loop over the layers
+            zs   = clip_altitude(atmosphere,z/(1 + z/Rad))
+            p, T = reference_standard_values(atmosphere,zs)
+            T    = T + temperature_deviation
+            assert np.all(conditions.pressure          == p)
+            assert np.all(conditions.temperature       == T)
+            assert np.all(conditions.density           == gas.compute_density(T,p))
+            assert np.all(conditions.speed_of_sound    == gas.compute_speed_of_sound(T,p,var_gamma))
+            assert np.all(conditions.dynamic_viscosity == gas.compute_absolute_viscosity(T))
+
+    # geopotential altitudes on and next to the breaks
+    z_breaks = np.asarray(atmosphere.breaks.altitude)
+    zs       = np.atleast_2d(np.hstack((z_breaks,np.nextafter(z_breaks,-np.inf)[1:],
+                                        np.nextafter(z_breaks,np.inf)[:-1]))).T
+    p, T     = atmosphere.compute_standard_values(zs)
+    p_ref, T_ref = reference_standard_values(atmosphere,zs)
+    assert np.all(p == p_ref) and np.all(T == T_ref)
+
+    # the lookup table is off by default and close to the exact values
+    assert not atmosphere.use_lookup_table
+    exact = atmosphere.compute_values(z)
+    atmosphere.use_lookup_table = True
+    for resolution in [10.,1.,100.]:
+        atmosphere.lookup_table_resolution = resolution * Units.m
+        table   = atmosphere.compute_values(z)
+        p_error = np.max(np.abs(table.pressure/exact.pressure - 1.))
+        T_error = np.max(np.abs(table.temperature/exact.temperature - 1.))
+        print('lookup table resolution %5.1f m  pressure error %8.2e  temperature error %8.2e' % \
+              (resolution,p_error,T_error))
+        assert len(atmosphere._lookup_table.altitude) >= (z_breaks[-1] - z_breaks[0])/resolution
+        assert T_error < 1e-12
+        if resolution <= 10.:
+            assert p_error < 6e-8
+        else:
+            assert p_error < 1e-5
+
+    # and rebuilt when the breaks change
+    atmosphere.lookup_table_resolution = 10. * Units.m
+    atmosphere.breaks.temperature = np.array(atmosphere.breaks.temperature) + 10.
+    atmosphere.use_lookup_table   = False
+    warm_exact = atmosphere.compute_values(z)
+    atmosphere.use_lookup_table   = True
+    warm_table = atmosphere.compute_values(z)
+    assert np.max(np.abs(warm_table.temperature/warm_exact.temperature - 1.)) < 1e-12
+    assert np.max(np.abs(warm_table.pressure/warm_exact.pressure - 1.)) < 6e-8
+
+    return
+
+# ----------------------------------------------------------------------
+#   Reference Model
+# ----------------------------------------------------------------------
+
+def clip_altitude(atmosphere,zs):
+
+    zs = np.array(zs)
+    zs[zs < atmosphere.breaks.altitude[0]]  = atmosphere.breaks.altitude[0]
+    zs[zs > atmosphere.breaks.altitude[-1]] = atmosphere.breaks.altitude[-1]
+
+    return zs
+
+def reference_standard_values(atmosphere,zs):
+    """ the standard day as US_Standard_1976.compute_values found it before, a loop over the layers """
+
+    grav   = atmosphere.planet.sea_level_gravity
+    R      = atmosphere.fluid_properties.gas_specific_constant
+    breaks = atmosphere.breaks
+
+    zeros = np.zeros_like(zs)
+    p     = zeros * 0.0
+    z0    = zeros * 0.0
+    T0    = zeros * 0.0
+    p0    = zeros * 0.0
+    alpha = zeros * 0.0
+
+    for i in range( len(breaks.altitude)-1 ):
+        i_inside = (zs >= breaks.altitude[i]) & (zs <= breaks.altitude[i+1])
+        z0[ i_inside ]    = breaks.altitude[i]
+        T0[ i_inside ]    = breaks.temperature[i]
+        p0[ i_inside ]    = breaks.pressure[i]
+        alpha[ i_inside ] = -(breaks.temperature[i+1] - breaks.temperature[i])/ \
+                             (breaks.altitude[i+1]    - breaks.altitude[i])
+
+    dz = zs-z0
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+
+    T = T0 - dz*alpha
+
+    return p, T
+
+if __name__ == '__main__':
+    main()
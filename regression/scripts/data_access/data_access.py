@@ -0,0 +1,274 @@
+# data_access.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Micro-benchmarks of attribute style access on Data() and DataOrdered(). Each access pattern is
+    timed on the current classes and on subclasses that restore the exception driven access path
+    the classes used before, and the results of both are checked to be the same. Key reads must
+    not be slower than on the previous access path, beyond the noise of the timings.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, DataOrdered
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics
+
+import numpy as np
+import time
+
+dictgetitem  = dict.__getitem__
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#   Previous Access Path
+# ----------------------------------------------------------------------
+
+class Legacy_Data(Data):
+    """ Data() with the access path that tries the dict and catches the exception """
+
+    def __getattribute__(self, k):
+        try:
+            return dictgetitem(self,k)
+        except:
+            return objgetattrib(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            objgetattrib(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+    def __delattr__(self, k):
+        try:
+            objgetattrib(self, k)
+        except:
+            del self[k]
+        else:
+            object.__delattr__(self, k)
+
+    def update(self,other):
+        for k,v in other.items():
+            if k.startswith('_'):
+                continue
+            try:
+                self[k].update(v)
+            except:
+                self[k] = v
+        return
+
+    def get_bases(self):
+        klass = self.__class__
+        klasses = []
+        while klass:
+            if issubclass(klass,Data):
+                klasses.append(klass)
+                klass = klass.__base__
+            else:
+                klass = None
+        return klasses
+
+class Legacy_DataOrdered(DataOrdered):
+    """ DataOrdered() with the access path that looks up attributes through super() and hasattr """
+
+    def __getitem__(self,k):
+        if not (isinstance(k,int) or isinstance(k,np.int64)):
+            return super(DataOrdered,self).__getattribute__(k)
+        else:
+            return super(DataOrdered,self).__getattribute__(self.keys()[k])
+
+    def __setattr__(self, key, value):
+        if not hasattr(self,key) and not hasattr(self.__class__,key):
+            root = dict.__getitem__(self,'_root')
+            last = root[0]
+            map  = dict.__getitem__(self,'_map')
+            last[1] = root[0] = map[key] = [last, root, key]
+        object.__setattr__(self,key, value)
+
+    def __setitem__(self,k,v):
+        self.__setattr__(k,v)
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    number = 20000
+
+    # the largest slowdown of key reads that is taken as noise of the timings
+    key_read_tolerance = 1.15
+
+    # the access patterns
+    benchmarks = [
+        ('Data key read'             , read_keys             ),
+        ('Data method lookup'        , lookup_methods        ),
+        ('Data key write'            , write_keys            ),
+        ('Data new key write'        , write_new_keys        ),
+        ('Data instantiation'        , instantiate           ),
+        ('DataOrdered item read'     , read_ordered_items    ),
+        ('DataOrdered key write'     , write_ordered_keys    ),
+    ]
+
+    print('%-28s %12s %12s %9s' % ('benchmark','legacy [us]','current [us]','speedup'))
+
+    for name, benchmark in benchmarks:
+
+        # the same results from both access paths
+        legacy_result  = benchmark(True ,10)
+        current_result = benchmark(False,10)
+        check(legacy_result,current_result,name)
+
+        legacy_time, current_time = best_times(benchmark,number)
+
+        print('%-28s %12.3f %12.3f %9.2f' % (name, legacy_time*1e6/number, current_time*1e6/number,
+                                             legacy_time/current_time))
+
+        if benchmark is read_keys:
+            assert current_time < key_read_tolerance*legacy_time, name
+
+    # keys shadow methods on either access path
+    for klass in [Data,Legacy_Data]:
+        data = klass()
+        data['update'] = 1.
+        assert data.update == 1.
+
+    # class attributes stay on the instance
+    conditions = Aerodynamics()
+    conditions._size = 3
+    conditions.lift_coefficient = np.ones((3,1))
+    assert not '_size' in conditions
+    assert conditions._size == 3
+    assert 'lift_coefficient' in conditions
+
+    # attributes added to a class after it was used are found, like on the previous access path
+    class Late_Data(Data):
+        pass
+
+    for klass in [Late_Data,Legacy_Data]:
+        data = klass()
+        data.first = 1.
+        klass.late = None
+        data.late  = 2.
+        assert not 'late' in data
+        assert data.late == 2.
+        del data.late
+        del klass.late
+        data.late = 3.
+        assert 'late' in data
+        del data.late
+        assert not 'late' in data
+
+    return
+
+# ----------------------------------------------------------------------
+#   Benchmarks
+# ----------------------------------------------------------------------
+
+def make_data(legacy):
+    klass = Legacy_Data if legacy else Data
+    data  = klass()
+    data.freestream = klass()
+    data.freestream.velocity = np.array([[200.]])
+    data.freestream.density  = np.array([[0.4]])
+    data.tag = 'conditions'
+
+    return data
+
+def make_ordered(legacy):
+    klass = Legacy_DataOrdered if legacy else DataOrdered
+    data  = klass()
+    data.first  = 1.
+    data.second = 2.
+    data.third  = 3.
+
+    return data
+
+def read_keys(legacy,number):
+    data  = make_data(legacy)
+    total = 0.
+    for i in range(number):
+        freestream = data.freestream
+        total += freestream.velocity[0,0]*freestream.density[0,0]
+
+    return total
+
+def lookup_methods(legacy,number):
+    data = make_data(legacy)
+    for i in range(number):
+        data.keys
+        data.items
+        data.get
+
+    return sorted(data.keys())
+
+def write_keys(legacy,number):
+    data = make_data(legacy)
+    for i in range(number):
+        data.freestream.velocity = i
+        data.tag = 'conditions'
+
+    return data.freestream.velocity
+
+def write_new_keys(legacy,number):
+    klass = Legacy_Data if legacy else Data
+    for i in range(number):
+        data = klass()
+        data.a = i
+        data.b = i
+
+    return sorted(data.items())
+
+def instantiate(legacy,number):
+    klass = Legacy_Data if legacy else Data
+    for i in range(number):
+        data = klass(a=1.,b=2.)
+
+    return sorted(data.items())
+
+def read_ordered_items(legacy,number):
+    data  = make_ordered(legacy)
+    total = 0.
+    for i in range(number):
+        total += data['first'] + data[1] + data.third
+
+    return total
+
+def write_ordered_keys(legacy,number):
+    data = make_ordered(legacy)
+    for i in range(number):
+        data.first  = i
+        data['second'] = i
+
+    return data.items()
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def best_times(benchmark,number,repeat=9):
+    """ the best times of both access paths, timed in turns so both see the same load """
+
+    times = {True:[], False:[]}
+    for i in range(repeat):
+        for legacy in [True,False]:
+            t0 = time.perf_counter()
+            benchmark(legacy,number)
+            times[legacy].append(time.perf_counter() - t0)
+
+    return min(times[True]), min(times[False])
+
+def check(a,b,name):
+    if isinstance(a,float):
+        assert a == b, name
+    else:
+        assert str(a) == str(b), name
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Computes the noise footprint of an approach at a few microphones and checks it against the
+    levels of one microphone at a time, for several chunk sizes and without the engine noise
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
+from SUAVE.Methods.Noise.Fidelity_One import noise_footprint
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+
+import numpy as np
+
+import Analyses
+import Missions
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    config, analyses, noise_segment = approach_setup()
+
+    # microphones around the ground track of the approach
+    x = noise_segment.conditions.frames.inertial.position_vector[:,0]
+    microphone_locations = np.array([[ x.min()        , 0. ,    0. ],
+                                     [ x.mean()       , 0. , -300. ],
+                                     [ x.mean()       , 0. ,  300. ],
+                                     [ x.max()        , 0. ,  800. ],
+                                     [ x.max() + 500. , 0. ,    0. ]])
+
+    # one microphone at a time
+    turbofan = config.propulsors['turbofan']
+    single   = Data()
+    single.airframe_EPNL = np.zeros(len(microphone_locations))
+    single.engine_EPNL   = np.zeros(len(microphone_locations))
+    for i, microphone in enumerate(microphone_locations):
+        noise_counterplot(noise_segment,analyses,config,microphone)
+        single.airframe_EPNL[i] = noise_airframe_Fink(config,analyses,noise_segment)[0]
+        single.engine_EPNL[i]   = noise_SAE(turbofan,noise_segment,config,analyses)[0]
+
+    geometry = [noise_segment.dist,noise_segment.theta,noise_segment.phi]
+
+    # all of the microphones, in chunks of several sizes
+    for chunk_size in [1,3,32]:
+        footprint = noise_footprint(config,analyses,noise_segment,microphone_locations,chunk_size)
+
+        print('Footprint EPNL, chunk size',chunk_size)
+        print(footprint.EPNL)
+
+        assert np.all(np.abs(footprint.airframe.EPNL - single.airframe_EPNL) < 1e-8)
+        assert np.all(np.abs(footprint.engine.EPNL   - single.engine_EPNL)   < 1e-8)
+
+        # the geometry of the segment is left as it was
+        for before, after in zip(geometry,[noise_segment.dist,noise_segment.theta,noise_segment.phi]):
+            assert after is before
+
+    # without the engine noise
+    footprint = noise_footprint(config,analyses,noise_segment,microphone_locations,engine_flag=0)
+    assert np.all(footprint.engine.EPNL == 0.)
+    assert np.all(np.abs(footprint.EPNL - single.airframe_EPNL) < 1e-8)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def approach_setup():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = Analyses.setup(configs)
+    mission  = Missions.landing_mission_setup(analyses)
+
+    # the flap areas for the airframe noise
+    for config in configs:
+        for wing in config.wings:
+            wing_planform(wing)
+
+    configs.finalize()
+    analyses.finalize()
+
+    analyses.landing.weights.evaluate()
+    analyses.landing.noise.settings.approach = 1
+
+    results = mission.evaluate()
+
+    return configs.landing, analyses.landing, results.segments.descent
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# noise_levels.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Computes the SAE engine noise and the Fink airframe noise of an approach at a few microphones
+    and checks the EPNL, the SENEL and the sound pressure level histories against reference values
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot, dbA_noise, senel_noise
+
+import numpy as np
+
+from noise_footprint import approach_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    config, analyses, noise_segment = approach_setup()
+    turbofan = config.propulsors['turbofan']
+
+    # under the start of the approach, beside its middle and past its end
+    x = noise_segment.conditions.frames.inertial.position_vector[:,0]
+    microphone_locations = np.array([[ x.min()        , 0. ,    0. ],
+                                     [ x.mean()       , 0. , -300. ],
+                                     [ x.max() + 500. , 0. ,    0. ]])
+
+    # EPNL, SENEL and the sum of the SPL history, per microphone
+    engine_reference   = np.array([[ 57.24693717721067 , 51.45810342855833  , -47243.16564633945 ],
+                                   [ 61.94841515504763 , 54.67685884715239  ,  35282.87598864942 ],
+                                   [ 86.35149923171467 , 80.77142566613122  , 111765.6493111515  ]])
+    airframe_reference = np.array([[ 87.78143512929346 , 78.92089775174854  , 131312.44095602867 ],
+                                   [ 96.44225583008156 , 87.02801497669513  , 166014.84966386296 ],
+                                   [ 73.28699835786247 , 66.47258423295948  ,  88559.40318135492 ]])
+
+    for i, microphone in enumerate(microphone_locations):
+        noise_counterplot(noise_segment,analyses,config,microphone)
+        engine   = noise_SAE(turbofan,noise_segment,config,analyses)
+        airframe = noise_airframe_Fink(config,analyses,noise_segment)
+
+        # the engine SENEL comes from the maximum dBA of every time step
+        assert engine[2] == senel_noise(np.max(dbA_noise(engine[1]),axis=-1)), i
+
+        engine   = np.array([engine[0]  ,engine[2]  ,np.sum(engine[1])])
+        airframe = np.array([airframe[0],airframe[2],np.sum(airframe[1])])
+        print('microphone',i,'engine EPNL, SENEL, SPL sum',engine,'airframe',airframe)
+
+        assert np.all(np.abs(engine[:2]   - engine_reference[i,:2])   < 1e-8), i
+        assert np.all(np.abs(airframe[:2] - airframe_reference[i,:2]) < 1e-8), i
+        assert np.abs(engine[2]/engine_reference[i,2] - 1.)     < 1e-10, i
+        assert np.abs(airframe[2]/airframe_reference[i,2] - 1.) < 1e-10, i
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+# alias_accessors.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Sets and gets values through the aliases of an optimization problem with set_values and
+    get_values, which compile the aliases into accessors, and checks them against the alias
+    lookups they replaced. Covers paths with an asterisk, lists of paths, integer indices and
+    the expansion of an asterisk after the keys under it change.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Optimization import helper_functions as help_fun
+
+import numpy as np
+from copy import deepcopy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    aliases = [
+        [ 'span'       , 'vehicle_configurations.base.wings.main_wing.spans.projected'              ],
+        [ 'area'       , 'vehicle_configurations.*.wings.main_wing.areas.reference'                  ],
+        [ 'sweep'      , ['vehicle_configurations.base.wings.main_wing.sweeps.quarter_chord',
+                          'vehicle_configurations.*.wings.horizontal_stabilizer.sweeps.quarter_chord'] ],
+        [ 'x_wing'     , 'vehicle_configurations.base.wings.main_wing.origin[0][0]'                   ],
+        [ 'z_tail'     , ['summary.tail_heights[1]',
+                          'vehicle_configurations.*.wings.horizontal_stabilizer.origin[0][2]']        ],
+        [ 'fuel_burn'  , 'summary.fuel_burn'                                                          ],
+        [ 'last_range' , 'summary.ranges[-1]'                                                         ],
+        [ 'total_range', 'summary.ranges.sum()'                                                       ],
+    ]
+
+    inputs = np.array([
+        [ 'span'   , 34.  , (  30. ,  40. ) , 1. , Units.m     ],
+        [ 'area'   , 125. , ( 100. , 150. ) , 1. , Units.m**2  ],
+        [ 'sweep'  , 25.  , (  15. ,  35. ) , 1. , Units.deg   ],
+        [ 'x_wing' , 13.  , (  12. ,  14. ) , 1. , Units.m     ],
+        [ 'z_tail' , 2.   , (   1. ,   3. ) , 1. , Units.m     ],
+    ],dtype=object)
+
+    # aliases with an asterisk can only be set, a list of paths is read from its first path
+    outputs = np.array([
+        [ 'span'        , 1. , Units.m   ],
+        [ 'sweep'       , 1. , Units.deg ],
+        [ 'x_wing'      , 1. , Units.m   ],
+        [ 'z_tail'      , 1. , Units.m   ],
+        [ 'fuel_burn'   , 1. , Units.kg  ],
+        [ 'last_range'  , 1. , Units.m   ],
+        [ 'total_range' , 1. , Units.m   ],
+    ],dtype=object)
+
+    nexus     = nexus_setup()
+    reference = deepcopy(nexus)
+
+    # set the inputs, twice with different values so the expansions are reused
+    for scale in [1.,1.1]:
+        values = help_fun.convert_values(scale_inputs(inputs,scale))
+        help_fun.set_values(nexus,inputs,values,aliases)
+        reference_set_values(reference,inputs,values,aliases)
+        check_equal(nexus,reference,'nexus')
+
+        result = help_fun.get_values(nexus,outputs,aliases)
+        assert np.all(result == reference_get_values(reference,outputs,aliases))
+        assert np.all(result[:4] == values[[0,2,3,4]])
+
+    # the paths with an asterisk are expanded again after the keys under it change
+    for configs in [nexus.vehicle_configurations,reference.vehicle_configurations]:
+        configs.landing = deepcopy(configs.takeoff)
+        del configs.cruise
+    values = help_fun.convert_values(scale_inputs(inputs,0.9))
+    help_fun.set_values(nexus,inputs,values,aliases)
+    reference_set_values(reference,inputs,values,aliases)
+    check_equal(nexus,reference,'nexus')
+    assert nexus.vehicle_configurations.landing.wings.main_wing.areas.reference == values[1]
+    assert 'cruise' not in nexus.vehicle_configurations
+
+    # and again when a key is replaced by a new one at the same place
+    for configs in [nexus.vehicle_configurations,reference.vehicle_configurations]:
+        configs.approach = deepcopy(configs.landing)
+        del configs.landing
+    values = help_fun.convert_values(scale_inputs(inputs,1.05))
+    help_fun.set_values(nexus,inputs,values,aliases)
+    reference_set_values(reference,inputs,values,aliases)
+    check_equal(nexus,reference,'nexus')
+    assert nexus.vehicle_configurations.approach.wings.horizontal_stabilizer.origin[0][2] == values[4]
+
+    # equal aliases compile to the same accessors
+    assert help_fun.compile_aliases(aliases) is help_fun.compile_aliases(deepcopy(aliases))
+    assert help_fun.compile_aliases(aliases) is not help_fun.compile_aliases(aliases[:-1])
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def nexus_setup():
+
+    nexus = Data()
+    nexus.vehicle_configurations = Data()
+    for tag in ['base','cruise','takeoff']:
+        config = Data()
+        config.wings = Data()
+        for wing_tag in ['main_wing','horizontal_stabilizer']:
+            wing = Data()
+            wing.spans  = Data()
+            wing.areas  = Data()
+            wing.sweeps = Data()
+            wing.spans.projected     = 30.
+            wing.areas.reference     = 100.
+            wing.sweeps.quarter_chord = 0.
+            wing.origin              = [[10.,0.,1.]]
+            config.wings[wing_tag]   = wing
+        nexus.vehicle_configurations[tag] = config
+
+    nexus.summary = Data()
+    nexus.summary.fuel_burn    = 5000.
+    nexus.summary.ranges       = np.array([100.,200.,300.])
+    nexus.summary.tail_heights = np.array([1.,2.,3.])
+
+    return nexus
+
+def scale_inputs(inputs,scale):
+
+    inputs = inputs.copy()
+    inputs[:,1] = inputs[:,1]*scale
+
+    return inputs
+
+def check_equal(data,reference,path):
+
+    if isinstance(reference,Data):
+        assert list(data.keys()) == list(reference.keys()), path
+        for key in reference.keys():
+            check_equal(data[key],reference[key],path + '.' + key)
+    else:
+        assert np.all(np.array(data) == np.array(reference)), path
+
+    return
+
+# ----------------------------------------------------------------------
+#   Reference Alias Lookups
+# ----------------------------------------------------------------------
+
+def reference_set_values(dictionary,input_dictionary,converted_values,aliases):
+    """ set_values as it looked every alias up before the aliases were compiled """
+
+    provided_names = input_dictionary[:,0]
+
+    pointer = []
+    for ii in range(0,len(provided_names)):
+        for jj in range(0,len(aliases)):
+            if provided_names[ii] == aliases[jj][0]:
+                pointer.append(aliases[jj][1])
+
+    for ii in range(0,len(pointer)):
+        pointers = pointer[ii]
+        if isinstance(pointers,str):
+            pointers = [pointers]
+        for string in pointers:
+            if '*' in string:
+                for newstring in reference_find_a_star(dictionary,string):
+                    dictionary.deep_set(newstring,converted_values[ii])
+            else:
+                dictionary.deep_set(string,converted_values[ii])
+
+    return dictionary
+
+def reference_find_a_star(dictionary,string):
+
+    splitstring = string.split('.')
+    for ii in range(0,len(splitstring)):
+        if '*' in splitstring[ii]:
+            if ii==0:
+                newkeys = dictionary.keys()
+            elif ii !=0:
+                strtoeval = 'dictionary.'+'.'.join(splitstring[0:ii])+'.keys()'
+                newkeys = list(eval(strtoeval))
+            lastindex   = ii
+
+    newstrings = []
+    for ii in range(0,len(newkeys)):
+        newstrings.append('.'.join(splitstring[0:lastindex])+'.'+newkeys[ii]+'.'+'.'.join(splitstring[lastindex+1:]))
+
+    return newstrings
+
+def reference_get_values(dictionary,outputs,aliases):
+
+    npoutputs    = np.array(outputs)
+    output_names = npoutputs[:,0]
+
+    pointer = []
+    for ii in range(0,len(output_names)):
+        for jj in range(0,len(aliases)):
+            if output_names[ii] == aliases[jj][0]:
+                pointer.append(aliases[jj][1])
+
+    values = np.zeros(len(outputs))
+    for ii in range(0,len(outputs)):
+        # a list of paths could not be read before, the compiled getters read the first path
+        path = pointer[ii] if isinstance(pointer[ii],str) else pointer[ii][0]
+        values[ii] = eval('dictionary.'+path)
+
+    return values
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# batch_evaluation.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Evaluates many design points with Nexus.evaluate_batch and Nexus.finite_difference, one after
+    the other and over a pool of worker processes, and checks them against the objective, the
+    constraints and the finite differences of serial calls to Nexus.objective and
+    Nexus.all_constraints.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+from optimization_packages import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    X = np.array([[ 1.  , 1.  ],
+                  [-0.5 , 1.5 ],
+                  [ 0.25,-1.  ],
+                  [ 2.  , 0.  ],
+                  [-1.75, 0.5 ]])
+
+    # the objective and the constraints one design point at a time
+    serial = problem_setup(1)
+    obj_ref = np.array([serial.objective(x) for x in X]).reshape(len(X))
+    con_ref = np.array([serial.all_constraints(x) for x in X])
+
+    for number_of_processes in [1,2]:
+        problem = problem_setup(number_of_processes)
+        try:
+            # the batch of design points
+            obj, con = problem.evaluate_batch(X)
+            assert np.all(obj == obj_ref), number_of_processes
+            assert np.all(con == con_ref), number_of_processes
+            assert problem.evaluation_count == len(X), number_of_processes
+
+            # the workers take the fidelity level of the nexus
+            problem.fidelity_level = 2
+            obj, con = problem.evaluate_batch(X)
+            assert np.all(obj == 2.*obj_ref), number_of_processes
+            assert np.all(con[:,:3] == con_ref[:,:3]), number_of_processes
+            assert np.all(con[:,3]  == 2.*con_ref[:,3]), number_of_processes
+            problem.fidelity_level = 1
+
+            # finite differences, against perturbing one input at a time
+            for x in X[:3]:
+                grad_obj, jac_con = problem.finite_difference(x,diff_interval=1e-6)
+                grad_ref, jac_ref = reference_finite_difference(serial,x,1e-6)
+                print('processes',number_of_processes,'x',x,'gradient',grad_obj)
+                assert np.all(grad_obj == grad_ref), number_of_processes
+                assert np.all(jac_con  == jac_ref), number_of_processes
+
+                # and the analytic gradient of x1**2 + x2**2
+                assert np.max(np.abs(grad_obj - 2.*x)) < 1e-5
+
+            # the pool is kept between the calls until it is closed
+            if number_of_processes > 1:
+                pool = problem.process_pool.pool
+                assert pool is not None
+                problem.evaluate_batch(X)
+                assert problem.process_pool.pool is pool
+                problem.close_pool()
+                assert problem.process_pool.pool is None
+        finally:
+            problem.close_pool()
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def problem_setup(number_of_processes):
+
+    problem = setup('batch_evaluation')
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x2' , '>',   1., 1., Units.less],
+        [ 'x2' , '<',   2., 1., Units.less],
+        [ 'y'  , '<',   5., 1., Units.less],
+    ])
+    problem.procedure.fidelity = scale_by_fidelity
+    problem.number_of_processes = number_of_processes
+
+    return problem
+
+def scale_by_fidelity(nexus):
+
+    nexus.obj = nexus.obj*nexus.fidelity_level
+
+    return nexus
+
+def reference_finite_difference(problem,x,diff_interval):
+    """ the finite differences of serial evaluations, one input perturbed at a time """
+
+    obj = problem.objective(x)
+    con = problem.all_constraints(x)
+
+    grad_obj = np.zeros(len(x))
+    jac_con  = np.zeros((len(con),len(x)))
+    for i in range(len(x)):
+        x_step       = np.array(x,dtype=float)
+        x_step[i]   += diff_interval
+        grad_obj[i]  = (problem.objective(x_step) - obj)/diff_interval
+        jac_con[:,i] = (problem.all_constraints(x_step) - con)/diff_interval
+
+    return grad_obj, jac_con
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# evaluation_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Runs an optimization problem through a sequence of design points that comes back to earlier
+    ones, with the evaluation cache of the nexus on, and checks that the restored objective,
+    constraints and summary are the same as those of a fresh evaluation. Also checks the cache
+    with entries spilled to a directory, and that nothing is counted while the cache is off.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import tempfile
+import shutil
+import os
+
+from optimization_packages import setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    X = np.array([[ 1.  , 1.  ],
+                  [-0.5 , 1.5 ],
+                  [ 1.  , 1.  ],
+                  [ 0.25,-1.  ],
+                  [-0.5 , 1.5 ],
+                  [ 0.25,-1.  ],
+                  [ 1.  , 1.  ]])
+
+    # the cache is off by default and counts nothing, the last inputs are still not run again
+    problem = problem_setup()
+    assert problem.evaluation_cache.size == 0
+    for x in X:
+        outputs(problem,x)
+    assert problem.evaluation_count == len(X)
+    assert problem.evaluation_cache.hits == 0 and problem.evaluation_cache.misses == 0
+    assert len(problem.evaluation_cache.entries) == 0
+
+    # cached evaluations give the same outputs as fresh ones
+    problem = problem_setup()
+    problem.evaluation_cache.size = 3
+    check_cache(problem,X)
+    assert problem.evaluation_count == 3
+    assert problem.evaluation_cache.misses == 3
+
+    # entries dropped from a cache of one are read back from the directory
+    directory = tempfile.mkdtemp()
+    try:
+        problem = problem_setup()
+        problem.evaluation_cache.size      = 1
+        problem.evaluation_cache.directory = directory
+        check_cache(problem,X)
+        assert problem.evaluation_count == 3
+        assert len(os.listdir(directory)) == 3
+    finally:
+        shutil.rmtree(directory)
+
+    # a change of the fidelity level is a different evaluation
+    problem = problem_setup()
+    problem.evaluation_cache.size = 3
+    outputs(problem,X[0])
+    problem.fidelity_level = 2
+    fidelity_2 = outputs(problem,X[0])
+    assert problem.evaluation_count == 2
+    assert fidelity_2.objective == 2.*outputs(problem_setup(),X[0]).objective
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def problem_setup():
+
+    problem = setup('evaluation_cache')
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x2' , '=',   1., 1., Units.less],
+        [ 'g'  , '<',   1., 1., Units.less],
+        [ 'y'  , '<',   5., 1., Units.less],
+    ])
+    problem.optimization_problem.aliases.append([ 'g' , 'summary.g' ])
+    problem.procedure.summary = summarize
+
+    return problem
+
+def summarize(nexus):
+
+    x1 = nexus.vehicle_configurations.base.x1
+    x2 = nexus.vehicle_configurations.base.x2
+
+    nexus.obj       = nexus.obj*nexus.fidelity_level
+    nexus.summary.g = x1*x2
+
+    return nexus
+
+def outputs(problem,x):
+
+    output = Data()
+    output.objective             = problem.objective(x)
+    output.all_constraints       = problem.all_constraints(x)
+    output.inequality_constraint = problem.inequality_constraint(x)
+    output.equality_constraint   = problem.equality_constraint(x)
+    output.summary_g             = problem.summary.g
+
+    return output
+
+def check_cache(problem,X):
+    """ the outputs of each design point against a fresh nexus """
+
+    cache = problem.evaluation_cache
+    for i, x in enumerate(X):
+        count  = problem.evaluation_count
+        hits   = cache.hits
+        cached = outputs(problem,x)
+        fresh  = outputs(problem_setup(),x)
+
+        # the first time a point is seen it is run, afterwards it is restored
+        first = not any(np.all(x == X[j]) for j in range(i))
+        assert (problem.evaluation_count == count + 1) == first, i
+
+        # the outputs after the first are read from the last inputs
+        assert cache.hits == hits + 3 + (not first), i
+
+        for key in fresh.keys():
+            assert np.all(cached[key] == fresh[key]), (i,key)
+
+    return
+
+if __name__ == '__main__':
+    main()
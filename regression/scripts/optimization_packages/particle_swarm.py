@@ -0,0 +1,115 @@
+# particle_swarm.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Runs the vectorized particle swarm optimization on a constrained test problem and checks that
+    a seed gives the same search every time, and that the search is the same with the particles
+    evaluated one after the other, over a pool of processes, or as a batch.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Optimization.Package_Setups.particle_swarm_optimization import particle_swarm_optimization, \
+     Particle_Function, evaluate_population
+
+import numpy as np
+import multiprocessing
+import pickle
+import warnings
+import os
+import sys
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    lb = np.array([-2.,-1.])
+    ub = np.array([ 2., 3.])
+
+    serial   = search(lb,ub,seed=3)
+    repeated = search(lb,ub,seed=3)
+    other    = search(lb,ub,seed=4)
+    pooled   = search(lb,ub,seed=3,number_of_processes=2)
+    batch    = search(lb,ub,seed=3,f_batch=batch_function)
+    print('best design',serial[0],'objective',serial[1])
+
+    # a seed gives the same search, another one a different search
+    assert np.all(repeated[0] == serial[0]) and repeated[1] == serial[1]
+    assert np.any(other[0] != serial[0])
+
+    # the particles give the same search however they are evaluated
+    assert np.all(pooled[0] == serial[0]) and pooled[1] == serial[1]
+    assert np.all(batch[0]  == serial[0]) and batch[1]  == serial[1]
+
+    # the pool of the search is closed
+    assert len(multiprocessing.active_children()) == 0
+
+    # the constrained minimum of the Rosenbrock function inside the disc is near (0.79,0.62)
+    assert np.sum(serial[0]**2) <= 1.
+    assert np.max(np.abs(serial[0] - [0.786,0.618])) < 5e-2
+
+    # spawned processes take the pickled functions, or the particles are evaluated here
+    start_method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method('spawn',force=True)
+    try:
+        spawned = search(lb,ub,seed=3,number_of_processes=2)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            unpicklable = search(lb,ub,seed=3,number_of_processes=2,function=lambda x: objective(x))
+    finally:
+        multiprocessing.set_start_method(start_method,force=True)
+    assert np.all(spawned[0]     == serial[0]) and spawned[1]     == serial[1]
+    assert np.all(unpicklable[0] == serial[0]) and unpicklable[1] == serial[1]
+    assert len(caught) == 1 and 'pickled' in str(caught[0].message)
+
+    # the particle function can be pickled for processes that are not forked
+    particle = Particle_Function(objective,[],constraints,(),{})
+    X        = np.array([[0.5,0.5],[1.,1.]])
+    copied   = pickle.loads(pickle.dumps(particle))
+    for outputs in [evaluate_population(particle,X),evaluate_population(copied,X)]:
+        assert np.all(outputs[0] == [objective(x) for x in X])
+        assert np.all(outputs[1] == [constraints(x) for x in X])
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def search(lb,ub,seed,number_of_processes=1,f_batch=None,function=None):
+
+    if function is None:
+        function = objective
+
+    # suppress the stopping printout
+    sys.stdout = open(os.devnull,'w')
+    try:
+        outputs = particle_swarm_optimization(function, lb, ub, f_ieqcons=constraints, swarmsize=40,
+                                              maxiter=60, minstep=1e-8, minfunc=1e-10, vectorized=True,
+                                              f_batch=f_batch, number_of_processes=number_of_processes,
+                                              seed=seed)
+    finally:
+        sys.stdout.close()
+        sys.stdout = sys.__stdout__
+
+    return outputs
+
+def objective(x):
+
+    return (1.-x[0])**2 + 100.*(x[1]-x[0]**2)**2
+
+def constraints(x):
+
+    return np.array([1. - x[0]**2 - x[1]**2])
+
+def batch_function(X):
+
+    return np.array([objective(x) for x in X]), np.array([constraints(x) for x in X])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# rotor_inflow.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Solves the momentum theory inflow of a rotor near hover and in forward flight for many
+    control points at once with rotor_forward_flight_inflow, and checks the results against
+    fsolve on one control point at a time, as the rotor solved them before.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Propulsion import rotor_forward_flight_inflow
+
+import numpy as np
+from scipy.optimize import fsolve
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    for Vh in [5.,12.,25.]:
+
+        # near hover, and forward flight with climb and descent
+        hover   = velocity_grid(np.linspace(-2.,2.,9)  ,np.linspace(-1.,1.,5))
+        forward = velocity_grid(np.linspace(-60.,80.,29),np.linspace(-40.,40.,17))
+
+        for name, V_inf in [('hover',hover),('forward',forward)]:
+
+            t0 = time.time()
+            vi = rotor_forward_flight_inflow(V_inf,Vh)
+            t1 = time.time()
+            reference, converged = reference_inflow(V_inf,Vh)
+            t2 = time.time()
+
+            # the same inflow wherever fsolve converges, within the tolerance of fsolve
+            error = np.max(np.abs(vi - reference)[converged]/Vh)
+            print('%-8s Vh = %5.1f  points %4d  fsolve failures %3d  error %8.2e  batched %7.4f s  fsolve %7.4f s' % \
+                  (name,Vh,len(vi),np.sum(np.logical_not(converged)),error,t1-t0,t2-t1))
+            assert error < 1e-8, (name,Vh)
+
+            # where fsolve fails, either a root of the momentum equation or the fsolve fallback
+            failed   = np.logical_not(converged)
+            residual = vi[failed] - Vh**2/np.sqrt(V_inf[failed,2]**2 + (V_inf[failed,0] + vi[failed])**2)
+            root     = np.abs(residual) < 1e-9*Vh
+            assert np.all(np.logical_or(root,vi[failed] == reference[failed])), (name,Vh)
+
+    # a single control point
+    V_inf = np.array([30.,0.,-4.])
+    vi    = rotor_forward_flight_inflow(V_inf,12.)
+    assert np.shape(vi) == (1,)
+    assert np.abs(vi[0] - reference_inflow(np.atleast_2d(V_inf),12.)[0][0]) < 1e-8*12.
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def velocity_grid(Vx,Vz):
+
+    Vx, Vz = np.meshgrid(Vx,Vz)
+    Vx     = Vx.flatten()
+    Vz     = Vz.flatten()
+
+    # the forward velocity is never exactly zero in forward flight
+    Vx[Vx == 0.] = 1e-3
+
+    return np.vstack((Vx,np.zeros_like(Vx),Vz)).T
+
+def reference_inflow(V_thrust,Vh):
+    """ the forward flight inflow as the rotor solved it before, one control point at a time """
+
+    vi        = np.zeros(len(V_thrust))
+    converged = np.zeros(len(V_thrust),dtype=bool)
+    for i in range(len(V_thrust)):
+        V_inf = V_thrust[i]
+        func  = lambda vi: vi - (Vh**2)/(np.sqrt(((-V_inf[2])**2 + (V_inf[0] + vi)**2)))
+        vi_initial_guess = V_inf[0]
+        solution, info, ier, msg = fsolve(func,vi_initial_guess,full_output=1)
+        vi[i]        = solution[0]
+        converged[i] = ier == 1
+
+    return vi, converged
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# mach_number_solvers.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Solves the compressible flow relations of fm_solver, rayleigh, exit_Mach_shock and mach_area
+    for many points at once, and checks the Mach numbers against fsolve on one point at a time,
+    as the functions solved them before. Also checks the shapes of the results.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Propulsion.fm_solver import fm_solver
+from SUAVE.Methods.Propulsion.rayleigh import rayleigh
+from SUAVE.Methods.Propulsion.nozzle_calculations import exit_Mach_shock, mach_area
+
+import numpy as np
+from scipy.optimize import fsolve
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n     = 40
+    gamma = np.linspace(1.2,1.4,n)
+
+    # subsonic and supersonic inlet Mach numbers
+    M0  = np.hstack((np.linspace(0.2,0.9,n//2),np.linspace(1.2,3.,n//2)))
+    AR  = np.linspace(1.05,3.,n)
+    Pr  = np.linspace(1.5,3.,n)
+
+    # heating up to 80% of the stagnation temperature ratio that chokes the flow
+    TtR_choke = (1.+gamma*M0*M0)**2./((2.*(1.+gamma)*M0*M0)*(1.+(gamma-1.)/2.*M0*M0))
+    TtR       = 1. + 0.8*(TtR_choke - 1.)
+
+    cases = [('fm_solver'      , lambda *x: fm_solver(x[0],x[1],x[2])          , reference_fm_solver       , [AR,M0,gamma]),
+             ('rayleigh'       , lambda *x: rayleigh(x[2],x[1],x[0])[0]        , reference_rayleigh        , [TtR,M0,gamma]),
+             ('exit_Mach_shock', lambda *x: exit_Mach_shock(x[0],x[2],x[1],1.) , reference_exit_Mach_shock , [AR,Pr,gamma]),
+             ('mach_area sub'  , lambda *x: mach_area(x[0],x[2],True)          , reference_mach_area_sub   , [AR,None,gamma]),
+             ('mach_area sup'  , lambda *x: mach_area(x[0],x[2],False)         , reference_mach_area_sup   , [AR,None,gamma])]
+
+    for name, solver, reference, inputs in cases:
+
+        # one point at a time with fsolve
+        M_ref = np.zeros(n)
+        for i in range(n):
+            M_ref[i] = reference(*[None if x is None else x[i] for x in inputs])
+
+        # vectors, the same shape as with fsolve
+        M = solver(*inputs)
+        error = np.max(np.abs(M - M_ref)/M_ref)
+        print('%-16s %8.2e' % (name,error))
+        assert np.shape(M) == (n,), name
+        assert error < 1e-10, name
+
+        # columns of control points give a column
+        columns = [None if x is None else np.atleast_2d(x).T for x in inputs]
+        M_col   = solver(*columns)
+        assert np.shape(M_col) == (n,1), name
+        assert np.all(M_col[:,0] == M), name
+
+        # a single point gives one element
+        M_one = solver(*[None if x is None else x[:1] for x in inputs])
+        assert np.shape(M_one) == (1,), name
+        assert M_one[0] == M[0], name
+
+    return
+
+# ----------------------------------------------------------------------
+#   Reference Solutions
+# ----------------------------------------------------------------------
+
+def reference_fm_solver(area_ratio, M0, gamma):
+    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
+    M1_guess = 0.1 if M0 < 1.0 else 1.1
+
+    return fsolve(func,M1_guess,factor=0.1,xtol=1e-12)[0]
+
+def reference_rayleigh(TtR, M0, gamma):
+    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
+    M1_guess = .01 if M0 <= 1.0 else 1.1
+
+    return fsolve(func,M1_guess,factor=0.1,xtol=1e-12)[0]
+
+def reference_exit_Mach_shock(area_ratio, Pt_out, gamma):
+    func = lambda Me : (Pt_out/1.)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
+
+    return fsolve(func,0.1,xtol=1e-12)[0]
+
+def reference_mach_area(area_ratio, gamma, subsonic):
+    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))
+    Me_initial_guess = 0.01 if subsonic else 2.0
+
+    return fsolve(func,Me_initial_guess,factor=0.1,xtol=1e-12)[0]
+
+def reference_mach_area_sub(area_ratio, unused, gamma):
+    return reference_mach_area(area_ratio,gamma,True)
+
+def reference_mach_area_sup(area_ratio, unused, gamma):
+    return reference_mach_area(area_ratio,gamma,False)
+
+if __name__ == '__main__':
+    main()
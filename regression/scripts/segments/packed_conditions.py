@@ -0,0 +1,194 @@
+# packed_conditions.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Evaluates a mission with the conditions of the segments packed into one buffer and checks
+    that the results are the same as with the usual arrays
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    packed_arrays()
+
+    # the same mission with and without packing
+    plain  = full_setup(False)
+    packed = full_setup(True)
+
+    plain.evaluate()
+    packed.evaluate()
+
+    # the conditions of the segments were packed, a container merges them into plain arrays
+    assert packed.segments.climb.state.conditions._buffer is not None
+    for segment in packed.segments.vary_cruise.segments.values():
+        assert segment.state.conditions._buffer is not None, segment.tag
+
+    errors = compare_segments(plain,packed)
+    print('Errors:')
+    print(errors)
+    for k,v in errors.items():
+        assert(v<1e-10),k
+
+    return
+
+# ----------------------------------------------------------------------
+#   Packed Arrays
+# ----------------------------------------------------------------------
+
+def packed_arrays():
+
+    conditions = Conditions()
+    conditions.frames = Conditions()
+    conditions.mass   = np.ones((4,1))
+    conditions.frames.velocity = np.zeros((4,3))
+    conditions.expand_rows(4)
+
+    buffer = conditions.pack()
+    assert buffer.shape == (4,4)
+
+    # writing into an array writes into the buffer
+    conditions.frames.velocity[:,0] = 2.
+    assert np.all(buffer[:,0] == 2.)
+
+    # setting a new array leaves the old one alone
+    old = conditions.mass
+    conditions.mass = old * 5.
+    assert np.all(old == 1.)
+    assert np.all(conditions.mass == 5.)
+    assert np.all(buffer[:,3] == 1.)
+
+    # and the new array is not part of the buffer any more
+    conditions.mass[:,0] = 3.
+    assert np.all(buffer[:,3] == 1.)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Compare Segments
+# ----------------------------------------------------------------------
+
+def compare_segments(plain,packed,errors=None,prefix=''):
+
+    if errors is None:
+        errors = Data()
+
+    for tag, segment in plain.segments.items():
+        other = packed.segments[tag]
+
+        a = segment.state.conditions.pack_array('vector')
+        b = other.state.conditions.pack_array('vector')
+        errors[prefix + tag] = np.max(np.abs(a-b)/np.maximum(np.abs(a),1.))
+
+        # the segments of a container segment
+        if 'segments' in segment:
+            compare_segments(segment,other,errors,prefix + tag + '_')
+
+    return errors
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def full_setup(pack_conditions):
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+    mission  = mission_setup(analyses,pack_conditions)
+
+    configs.finalize()
+    analyses.finalize()
+
+    return mission
+
+def mission_setup(analyses,pack_conditions):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points = 4
+    base_segment.state.numerics.pack_conditions = pack_conditions
+    base_segment.process.iterate.conditions.stability      = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability   = SUAVE.Methods.skip
+
+    # ------------------------------------------------------------------
+    #   Climb Segment
+    # ------------------------------------------------------------------
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Container Segment
+    # ------------------------------------------------------------------
+
+    vary_cruise = SUAVE.Analyses.Mission.Vary_Cruise.Given_Weight()
+    vary_cruise.tag = 'vary_cruise'
+    vary_cruise.cruise_tag = 'cruise'
+    vary_cruise.target_landing_weight = analyses.base.weights.vehicle.mass_properties.operating_empty
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.cruise )
+    segment.altitude_start = 5.0   * Units.km
+    segment.altitude_end   = 8.0   * Units.km
+    segment.air_speed      = 190.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    vary_cruise.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = 4000.00 * Units.km
+    vary_cruise.append_segment(segment)
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    vary_cruise.append_segment(segment)
+
+    mission.append_segment(vary_cruise)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
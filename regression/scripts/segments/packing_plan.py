@@ -0,0 +1,206 @@
+# packing_plan.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Converges a mission with the packing plans of converge_root and with the pack_array and
+    unpack_array calls the solver used before, and checks that the results are the same. Also
+    checks that copied and pickled packing plans work.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data, Packing_Plan
+from SUAVE.Core.Arrays import array_type
+from SUAVE.Methods.Missions.Segments.Common.Sub_Segments import Process_Pool
+
+import numpy as np
+import scipy.optimize
+import pickle
+import copy
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    copied_plans()
+
+    # the same mission with the packing plans and with pack_array
+    planned   = full_setup()
+    reference = full_setup()
+    for segment in reference.segments.values():
+        segment.process.converge.converge_root = reference_converge_root
+
+    planned.evaluate()
+    reference.evaluate()
+
+    for tag, segment in planned.segments.items():
+        assert '_packing_plans' in segment.state, tag
+        assert not '_packing_plans' in reference.segments[tag].state, tag
+
+    errors = Data()
+    for tag, segment in reference.segments.items():
+        a = segment.state.conditions.pack_array('vector')
+        b = planned.segments[tag].state.conditions.pack_array('vector')
+        errors[tag] = np.max(np.abs(a-b)/np.maximum(np.abs(a),1.))
+
+    print('Errors:')
+    print(errors)
+    for k,v in errors.items():
+        assert(v<1e-12),k
+
+    return
+
+# ----------------------------------------------------------------------
+#   Copied Plans
+# ----------------------------------------------------------------------
+
+def copied_plans():
+
+    data = Data()
+    data.a = np.arange(6.).reshape((3,2))
+    data.b = 2.
+    data.c = Data()
+    data.c.d = np.ones((3,1))
+
+    plan = Packing_Plan(data)
+    vector = data.pack_array('vector')
+    assert np.all(plan.pack(data) == vector)
+
+    # copies and pickles of every protocol start empty and recompile on their first use
+    copies = [copy.copy(plan),copy.deepcopy(plan)]
+    for protocol in range(pickle.HIGHEST_PROTOCOL+1):
+        copies.append(pickle.loads(pickle.dumps(plan,protocol)))
+
+    for other in copies:
+        assert np.all(other.pack(data) == vector)
+        other.unpack(data,vector*2.)
+        assert np.all(data.pack_array('vector') == vector*2.)
+        other.unpack(data,vector)
+
+    # the pool holder of a mission starts without a pool
+    for protocol in range(pickle.HIGHEST_PROTOCOL+1):
+        pool = pickle.loads(pickle.dumps(Process_Pool(),protocol))
+        assert pool.pool is None
+
+    return
+
+# ----------------------------------------------------------------------
+#   Reference Solver
+# ----------------------------------------------------------------------
+
+def reference_converge_root(segment):
+    """ converge_root as it was before the packing plans """
+
+    unknowns = segment.state.unknowns.pack_array()
+
+    unknowns,infodict,ier,msg = scipy.optimize.fsolve( reference_iterate,
+                                                       unknowns,
+                                                       args = segment,
+                                                       xtol = segment.state.numerics.tolerance_solution,
+                                                       maxfev = segment.state.numerics.max_evaluations,
+                                                       full_output = 1)
+
+    segment.state.numerics.converged = ier == 1
+    segment.converged = ier == 1
+
+    return
+
+def reference_iterate(unknowns, segment):
+
+    if isinstance(unknowns,array_type):
+        segment.state.unknowns.unpack_array(unknowns)
+    else:
+        segment.state.unknowns = unknowns
+
+    segment.process.iterate(segment)
+
+    residuals = segment.state.residuals.pack_array()
+
+    return residuals
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def full_setup():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+    mission  = mission_setup(analyses)
+
+    configs.finalize()
+    analyses.finalize()
+
+    return mission
+
+def mission_setup(analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points = 4
+    base_segment.process.iterate.conditions.stability      = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability   = SUAVE.Methods.skip
+
+    # ------------------------------------------------------------------
+    #   Climb Segment
+    # ------------------------------------------------------------------
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment
+    # ------------------------------------------------------------------
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 200.0 * Units['m/s']
+    segment.distance   = 1000.0 * Units.km
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Descent Segment
+    # ------------------------------------------------------------------
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+# parallel_segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Evaluates a mission with independent segments, one of them a container segment, in a pool of
+    worker processes and checks that the results are the same as evaluating it one by one
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the same mission one by one and in parallel
+    serial   = full_setup()
+    parallel = full_setup()
+    parallel.settings.number_of_processes = 2
+
+    serial.evaluate()
+    parallel.evaluate()
+
+    # the initials links are kept
+    segments = parallel.segments
+    assert segments.climb_2.state.initials is segments.climb_1.state
+    assert segments.vary_cruise.state.initials is segments.climb_1.state
+    assert segments.cruise_2.state.initials is segments.climb_1.state
+    assert segments.descent.state.initials is segments.cruise_2.state
+    assert segments.climb_2.conditions is segments.climb_2.state.conditions
+
+    errors = compare_segments(serial,parallel)
+    print('Errors:')
+    print(errors)
+    for k,v in errors.items():
+        assert(v<1e-8),k
+
+    # the pool is kept for the next evaluation
+    pool = parallel.process_pool.pool
+    serial.evaluate()
+    parallel.evaluate()
+    assert parallel.process_pool.pool is pool
+
+    errors = compare_segments(serial,parallel)
+    for k,v in errors.items():
+        assert(v<1e-8),k
+
+    parallel.process_pool.close()
+
+    return
+
+# ----------------------------------------------------------------------
+#   Compare Segments
+# ----------------------------------------------------------------------
+
+def compare_segments(serial,parallel,errors=None,prefix=''):
+
+    if errors is None:
+        errors = Data()
+
+    for tag, segment in serial.segments.items():
+        other = parallel.segments[tag]
+
+        a = segment.state.conditions.pack_array('vector')
+        b = other.state.conditions.pack_array('vector')
+        errors[prefix + tag] = np.max(np.abs(a-b)/np.maximum(np.abs(a),1.))
+
+        # the segments of a container segment
+        if 'segments' in segment:
+            compare_segments(segment,other,errors,prefix + tag + '_')
+
+    return errors
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def full_setup():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+    mission  = mission_setup(analyses)
+
+    configs.finalize()
+    analyses.finalize()
+
+    return mission
+
+def mission_setup(analyses):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points = 4
+    base_segment.process.iterate.conditions.stability      = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability   = SUAVE.Methods.skip
+
+    # ------------------------------------------------------------------
+    #   Climb Segments
+    # ------------------------------------------------------------------
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb_1"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 3.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb_2"
+    segment.analyses.extend( analyses.cruise )
+    segment.altitude_end   = 8.0   * Units.km
+    segment.air_speed      = 190.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Container Segment: also starts from the first climb
+    # ------------------------------------------------------------------
+
+    vary_cruise = SUAVE.Analyses.Mission.Vary_Cruise.Given_Weight()
+    vary_cruise.tag = 'vary_cruise'
+    vary_cruise.settings.initials_segment = 'climb_1'
+    vary_cruise.cruise_tag = 'cruise'
+    vary_cruise.target_landing_weight = analyses.base.weights.vehicle.mass_properties.operating_empty
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    vary_cruise.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = 4000.00 * Units.km
+    vary_cruise.append_segment(segment)
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    vary_cruise.append_segment(segment)
+
+    mission.append_segment(vary_cruise)
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: also starts from the first climb
+    # ------------------------------------------------------------------
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise_2"
+    segment.settings.initials_segment = 'climb_1'
+    segment.analyses.extend( analyses.cruise )
+    segment.altitude   = 3.0   * Units.km
+    segment.air_speed  = 150.0 * Units['m/s']
+    segment.distance   = 500.0 * Units.km
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Descent Segment: starts from the previous segment
+    # ------------------------------------------------------------------
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
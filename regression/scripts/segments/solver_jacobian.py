@@ -0,0 +1,111 @@
+# solver_jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Evaluates the segment_test mission with the sparse and the user supplied solver jacobians and
+    checks that the results are the same as with the jacobian of the root finder
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions.Segments.converge_root import iterate
+from SUAVE.Methods.Missions.Segments.sparse_jacobian import dense_jacobian, finite_difference_steps, \
+     color_jacobian_columns, is_compressed
+
+import numpy as np
+import time
+
+import segment_test
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    coloring()
+
+    results = Data()
+    for method in ['none','sparse','function']:
+        mission = mission_setup(method)
+
+        t0 = time.time()
+        mission.evaluate()
+        print('%-10s %8.2f s' % (method,time.time()-t0))
+
+        for segment in mission.segments.values():
+            assert segment.state.numerics.converged, (method,segment.tag)
+
+        results[method] = mission
+
+    # the same solution within the tolerance of the solver
+    for method in ['sparse','function']:
+        for tag, segment in results.none.segments.items():
+            a = segment.state.conditions.pack_array('vector')
+            b = results[method].segments[tag].state.conditions.pack_array('vector')
+            error = np.max(np.abs(a-b)/np.maximum(np.abs(a),1.))
+            print(method,tag,error)
+            assert error < 1e-5, (method,tag)
+
+    # a dense pattern is differenced column by column and later left to the root finder
+    for segment in results.sparse.segments.values():
+        numerics = segment.state.numerics
+        sparsity = numerics.jacobian_sparsity
+        if sparsity is not None and np.all(sparsity):
+            assert not is_compressed(numerics.jacobian_colors), segment.tag
+
+    return
+
+# ----------------------------------------------------------------------
+#   Coloring
+# ----------------------------------------------------------------------
+
+def coloring():
+
+    # a banded jacobian needs three colors
+    sparsity = np.eye(6,dtype=bool) | np.eye(6,k=1,dtype=bool) | np.eye(6,k=-1,dtype=bool)
+    colors   = color_jacobian_columns(sparsity)
+    assert colors.max() + 1 == 3
+    assert is_compressed(colors)
+    for color in range(3):
+        assert np.all(sparsity[:,colors == color].sum(axis=1) <= 1)
+
+    # a dense jacobian needs a color per column
+    colors = color_jacobian_columns(np.ones((6,6),dtype=bool))
+    assert np.all(np.sort(colors) == np.arange(6))
+    assert not is_compressed(colors)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(method):
+
+    configs, analyses = segment_test.full_setup()
+    segment_test.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    for segment in mission.segments.values():
+        segment.state.numerics.solver_jacobian   = method
+        segment.state.numerics.jacobian_function = finite_difference_jacobian
+
+    return mission
+
+def finite_difference_jacobian(unknowns,segment):
+    """ A user supplied jacobian, differenced one column at a time """
+
+    x  = np.array(unknowns,dtype=float)
+    F0 = iterate(x.copy(),segment)
+
+    return dense_jacobian(x,F0,finite_difference_steps(x),segment)
+
+if __name__ == '__main__':
+    main()
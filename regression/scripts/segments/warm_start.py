@@ -0,0 +1,92 @@
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" Evaluates a mission several times with and without the warm start of its segments, and checks
+    that the converged results are the same and that the warm started evaluations need fewer
+    residual evaluations
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+
+import packing_plan
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    warm = evaluations(True)
+    cold = evaluations(False)
+
+    # the first evaluations start from the same unknowns
+    for tag in warm[0].calls.keys():
+        assert warm[0].calls[tag] == cold[0].calls[tag], tag
+        assert np.all(warm[0].results[tag] == cold[0].results[tag]), tag
+
+    # the second evaluation starts from the converged solution
+    for tag in warm[0].calls.keys():
+        assert warm[1].calls[tag] < warm[0].calls[tag], tag
+
+    # new control points start from the interpolated solution rather than from the last iterate
+    assert sum(warm[2].calls.values()) < sum(cold[2].calls.values())
+
+    # the same solution within the tolerance of the solver
+    for evaluation in range(3):
+        for tag, reference in cold[evaluation].results.items():
+            result = warm[evaluation].results[tag]
+            error  = np.max(np.abs(result - reference)/np.maximum(np.abs(reference),1.))
+            print('evaluation',evaluation,tag,'residual calls warm',warm[evaluation].calls[tag],
+                  'cold',cold[evaluation].calls[tag],'difference',error)
+            assert error < 5e-5, (evaluation,tag)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluations
+# ----------------------------------------------------------------------
+
+def evaluations(warm_start):
+    """ evaluates the mission twice, and then once more with more control points """
+
+    mission = packing_plan.full_setup()
+    mission.settings.warm_start = warm_start
+
+    calls = Data()
+    def count_residuals(segment):
+        calls[segment.tag] += 1
+
+    for segment in mission.segments.values():
+        segment.process.iterate.count_residuals = count_residuals
+
+    outputs = []
+    for evaluation in range(3):
+        if evaluation == 2:
+            for segment in mission.segments.values():
+                segment.state.numerics.number_control_points = 6
+
+        for tag in mission.segments.keys():
+            calls[tag] = 0
+
+        mission.evaluate()
+
+        output = Data()
+        output.calls   = Data(calls)
+        output.results = Data()
+        for tag, segment in mission.segments.items():
+            assert segment.state.numerics.converged, (warm_start,evaluation,tag)
+            output.results[tag] = segment.state.conditions.pack_array('vector')
+        outputs.append(output)
+
+    return outputs
+
+if __name__ == '__main__':
+    main()
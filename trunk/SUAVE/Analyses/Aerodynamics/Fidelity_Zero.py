@@ -5,6 +5,7 @@
 # Modified: Feb 2016, Andrew Wendorff
 #           Apr 2019, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -72,6 +73,7 @@ class Fidelity_Zero(Markup):
         settings.use_surrogate                      = True 
         settings.include_slipstream_effect          = False 
         settings.plot_vortex_distribution           = False
+        settings.surrogate_cache_directory          = None
         
         # build the evaluation process
         compute = self.process.compute
@@ -132,6 +134,8 @@ class Fidelity_Zero(Markup):
         n_cw                      = self.settings.number_panels_chordwise  
                                   
         self.process.compute.lift.inviscid_wings.geometry = self.geometry 
+        if self.settings.surrogate_cache_directory is not None:
+            self.process.compute.lift.inviscid_wings.settings.surrogate_cache_directory = self.settings.surrogate_cache_directory
         self.process.compute.lift.inviscid_wings.initialize(use_surrogate , vortex_distribution_flag , n_sw ,  n_cw ,include_slipstream_effect )          
                                                             
     finalize = initialize                                          
\ No newline at end of file
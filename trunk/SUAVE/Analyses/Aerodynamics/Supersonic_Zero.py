@@ -5,6 +5,7 @@
 # Modified: Nov 2016, T. MacDonald
 #           Apr 2019, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -76,6 +77,7 @@ class Supersonic_Zero(Markup):
         settings.use_surrogate                      = True 
         settings.include_slipstream_effect          = False 
         settings.plot_vortex_distribution           = False
+        settings.surrogate_cache_directory          = None
         
         # this multiplier is used to determine the volume wave drag at the peak Mach number
         # by multiplying the volume wave drag at the end drag rise Mach number
@@ -151,6 +153,8 @@ class Supersonic_Zero(Markup):
         n_cw                      = self.settings.number_panels_chordwise  
         
         self.process.compute.lift.inviscid_wings.geometry = self.geometry 
+        if self.settings.surrogate_cache_directory is not None:
+            self.process.compute.lift.inviscid_wings.settings.surrogate_cache_directory = self.settings.surrogate_cache_directory
         self.process.compute.lift.inviscid_wings.initialize(use_surrogate , vortex_distribution_flag , n_sw ,  n_cw ,include_slipstream_effect )     
         
                 
@@ -9,6 +9,7 @@
 #           Dec 2018, M. Clarke
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -24,11 +25,16 @@ from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
 # local imports
 from .Aerodynamics import Aerodynamics
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution import compute_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.influence_cache import cached_vortex_distribution
+from SUAVE.Methods.Utilities.hash_data import hash_data
 from SUAVE.Plots import plot_vehicle_vlm_panelization  
 from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.Cubic_Spline_Blender import Cubic_Spline_Blender
 
 # package imports
+import os
+import tempfile
 import numpy as np 
+from warnings import warn
 from scipy.interpolate import interp2d, RectBivariateSpline, RegularGridInterpolator
 
 # ----------------------------------------------------------------------
@@ -69,6 +75,10 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.number_panels_spanwise         = 10
         self.settings.number_panels_chordwise        = 2 
         self.settings.vortex_distribution            = Data()   
+        self.settings.use_influence_cache            = False  # keeps the influence matrices of each Mach number
+        self.settings.influence_cache_size           = 16   # number of Mach numbers kept
+        self.settings.influence_memory_budget        = 2.**31 # bytes, larger problems are solved in blocks
+        self.settings.surrogate_cache_directory      = None   # stores the training data on disk when set
         
         # conditions table, used for surrogate model training
         self.training                                = Data()    
@@ -84,6 +94,12 @@ class Vortex_Lattice(Aerodynamics):
         self.training.wing_drag_coefficient_sub      = None
         self.training.wing_drag_coefficient_sup      = None
         
+        # adaptive training, refines the grid where the leave-one-out spline error is high
+        self.training.adaptive                       = False
+        self.training.initial_points                 = 4      # per axis and speed regime
+        self.training.maximum_evaluations            = 128    # number of VLM solves
+        self.training.refinement_tolerance           = 1e-3   # relative to the range of the coefficients
+        
         # blending function 
         self.hsub_min                                = 0.85
         self.hsub_max                                = 0.95
@@ -136,7 +152,10 @@ class Vortex_Lattice(Aerodynamics):
             settings.number_panels_chordwise = n_cw
             
         # generate vortex distribution
-        VD = compute_vortex_distribution(geometry,settings)      
+        if settings.use_influence_cache:
+            VD = cached_vortex_distribution(geometry,settings)
+        else:
+            VD = compute_vortex_distribution(geometry,settings)      
         
         # Pack
         settings.vortex_distribution        = VD
@@ -149,8 +168,11 @@ class Vortex_Lattice(Aerodynamics):
                 
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            self.sample_training()
+            # sample training data, unless the same vehicle has been trained before
+            cache_file = self.training_cache_file()
+            if not self.load_training(cache_file):
+                self.sample_training()
+                self.save_training(cache_file)
                         
             # build surrogate
             self.build_surrogate()        
@@ -355,11 +377,17 @@ class Vortex_Lattice(Aerodynamics):
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
         self.training.angle_of_attack [radians]
+        self.training.adaptive        [Boolean]
         """
         # unpack
         geometry      = self.geometry
         settings      = self.settings
         training      = self.training
+        
+        if training.get('adaptive',False):
+            self.sample_training_adaptive()
+            return
+        
         AoA           = training.angle_of_attack 
         Mach          = training.Mach
         data_len      = len(AoA) 
@@ -434,6 +462,268 @@ class Vortex_Lattice(Aerodynamics):
         training.wing_drag_coefficient_sup    = CDi_w_sup
         
         return
+    
+    def sample_training_adaptive(self):
+        """Runs the vortex lattice on a training grid that is refined where it is needed. 
+        The grid starts with a few angles of attack and Mach numbers in each speed regime, 
+        spanning the ranges of self.training. Each interior grid line is then left out of 
+        a spline fit in turn; the line with the largest error in lift or induced drag is 
+        refined by adding the midpoints of its neighbouring intervals. This repeats until the 
+        error is below the tolerance or the next refinement would exceed the number of 
+        evaluations allowed.
+
+        Assumptions:
+        The grid stays a tensor grid so the surrogates of build_surrogate can be used
+        Refining an angle of attack line costs one solve per Mach number and vice versa
+
+        Source:
+        N/A
+
+        Inputs:
+        see properties used
+
+        Outputs:
+        self.training.
+          angle_of_attack             [radians]
+          Mach                        [-]
+          lift_coefficient            [-] 
+          wing_lift_coefficient       [-] (wing specific)
+          drag_coefficient            [-] 
+          wing_drag_coefficient       [-] (wing specific)
+
+        Properties Used:
+        self.geometry.wings.*.tag
+        self.settings                 (passed to calculate vortex lattice)
+        self.training.
+          angle_of_attack             [radians]
+          Mach                        [-]
+          initial_points              [-]
+          maximum_evaluations         [-]
+          refinement_tolerance        [-]
+        """
+        # unpack
+        geometry  = self.geometry
+        settings  = self.settings
+        training  = self.training
+        AoA       = training.angle_of_attack[:,0]
+        Mach      = training.Mach[:,0]
+        n_0       = max(int(training.initial_points),4)
+        max_evals = training.maximum_evaluations
+        tolerance = training.refinement_tolerance
+        
+        # the coarse grid spans the ranges of the fixed grid
+        grid      = Data()
+        grid.AoA  = np.linspace(np.min(AoA),np.max(AoA),n_0)
+        grid.sub  = np.linspace(np.min(Mach[Mach<1.]),np.max(Mach[Mach<1.]),n_0)
+        grid.sup  = np.linspace(np.min(Mach[Mach>1.]),np.max(Mach[Mach>1.]),n_0)
+        samples   = dict()
+        
+        while True:
+            
+            # run the vortex lattice on the points not yet sampled
+            sample_training_points(grid,samples,settings,geometry)
+            
+            # find the grid line with the largest leave-one-out error
+            errors = []
+            for axis, dim, regimes in [('AoA',0,['sub','sup']),('sub',1,['sub']),('sup',1,['sup'])]:
+                error = np.zeros_like(grid[axis])
+                for regime in regimes:
+                    CL, CDi = training_grid_coefficients(grid,regime,samples)[:2]
+                    for i in range(1,len(grid[axis])-1):
+                        error[i] = max(error[i],leave_one_out_error(grid.AoA,grid[regime],CL,i,dim),
+                                       leave_one_out_error(grid.AoA,grid[regime],CDi,i,dim))
+                errors += [(error[i],axis,i) for i in range(1,len(grid[axis])-1)]
+            errors.sort(key=lambda e: e[0],reverse=True)
+            
+            # refine the worst line that can be afforded
+            refined = False
+            for error, axis, i in errors:
+                if error < tolerance:
+                    break
+                if axis == 'AoA':
+                    cost = len(grid.sub) + len(grid.sup)
+                else:
+                    cost = len(grid.AoA)
+                x   = grid[axis]
+                new = [0.5*(x[i-1]+x[i]),0.5*(x[i]+x[i+1])]
+                if len(samples) + len(new)*cost > max_evals:
+                    new = new[:1] if x[i]-x[i-1] >= x[i+1]-x[i] else new[1:]
+                if len(samples) + len(new)*cost > max_evals:
+                    continue
+                grid[axis] = np.sort(np.hstack((x,new)))
+                refined    = True
+                break
+            
+            if not refined:
+                break
+        
+        # store the training data, as a tensor grid in each regime
+        CL_sub, CDi_sub, CL_w_sub, CDi_w_sub = training_grid_coefficients(grid,'sub',samples)
+        CL_sup, CDi_sup, CL_w_sup, CDi_w_sup = training_grid_coefficients(grid,'sup',samples)
+        
+        training.angle_of_attack              = np.atleast_2d(grid.AoA).T
+        training.Mach                         = np.atleast_2d(np.hstack((grid.sub,grid.sup))).T
+        training.lift_coefficient_sub         = CL_sub
+        training.lift_coefficient_sup         = CL_sup
+        training.wing_lift_coefficient_sub    = CL_w_sub        
+        training.wing_lift_coefficient_sup    = CL_w_sup
+        training.drag_coefficient_sub         = CDi_sub
+        training.drag_coefficient_sup         = CDi_sup
+        training.wing_drag_coefficient_sub    = CDi_w_sub        
+        training.wing_drag_coefficient_sup    = CDi_w_sup
+        
+        return
+        
+    def training_cache_file(self):
+        """Finds the file of the training data cache. The name is a hash of everything 
+        the training data depends on, so a changed vehicle or training grid gives a new file.
+
+        Assumptions:
+        The training data only depends on the wings, fuselages, reference area, panel counts 
+        and the training inputs
+
+        Source:
+        N/A
+
+        Inputs:
+        see properties used
+
+        Outputs:
+        filename                      [string] or None if the cache is not used
+
+        Properties Used:
+        self.geometry.
+          wings
+          fuselages
+          reference_area
+        self.settings.
+          surrogate_cache_directory
+          number_panels_spanwise
+          number_panels_chordwise
+          include_slipstream_effect
+        self.training.
+          angle_of_attack
+          Mach
+          adaptive
+          initial_points
+          maximum_evaluations
+          refinement_tolerance
+        """
+        
+        geometry  = self.geometry
+        settings  = self.settings
+        training  = self.training
+        directory = settings.get('surrogate_cache_directory',None)
+        if directory is None:
+            return None
+        
+        inputs = Data()
+        for key in ['angle_of_attack','Mach','adaptive','initial_points','maximum_evaluations','refinement_tolerance']:
+            inputs[key] = training.get(key,None)
+        
+        key = hash_data('Vortex_Lattice training 1',geometry.wings,geometry.fuselages,geometry.reference_area,
+                        settings.number_panels_spanwise,settings.number_panels_chordwise,
+                        settings.get('include_slipstream_effect',False),inputs)
+        
+        return os.path.join(directory,'VLM_training_' + key + '.npz')
+        
+    def load_training(self,filename):
+        """Loads the training data from the cache, if the vehicle has been trained before.
+
+        Assumptions:
+        A file that can not be read is treated as a miss
+
+        Source:
+        N/A
+
+        Inputs:
+        filename                      [string] from training_cache_file, or None
+
+        Outputs:
+        hit                           [Boolean]
+        self.training.
+          angle_of_attack             [radians]
+          Mach                        [-]
+          lift_coefficient            [-] 
+          wing_lift_coefficient       [-] (wing specific)
+          drag_coefficient            [-] 
+          wing_drag_coefficient       [-] (wing specific)
+
+        Properties Used:
+        self.geometry.wings.*.tag
+        """
+        
+        if filename is None or not os.path.isfile(filename):
+            return False
+        
+        wings   = self.geometry.wings.keys()
+        loaded  = Data()
+        try:
+            with np.load(filename) as archive:
+                for key in training_arrays:
+                    if key.startswith('wing_'):
+                        loaded[key] = Data()
+                        for wing in wings:
+                            loaded[key][wing] = archive[key + '/' + wing]
+                    else:
+                        loaded[key] = archive[key]
+        except Exception as error:
+            warn('could not load the training data cache ' + filename + ': ' + str(error),RuntimeWarning)
+            return False
+        
+        self.training.update(loaded)
+        
+        return True
+        
+    def save_training(self,filename):
+        """Saves the training data to the cache. The file is written under a temporary name 
+        and then moved in place, so other processes never see a partial file.
+
+        Assumptions:
+        A cache that can not be written only gives a warning
+
+        Source:
+        N/A
+
+        Inputs:
+        filename                      [string] from training_cache_file, or None
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.training.
+          angle_of_attack             [radians]
+          Mach                        [-]
+          lift_coefficient            [-] 
+          wing_lift_coefficient       [-] (wing specific)
+          drag_coefficient            [-] 
+          wing_drag_coefficient       [-] (wing specific)
+        """
+        
+        if filename is None:
+            return
+        
+        training = self.training
+        arrays   = dict()
+        for key in training_arrays:
+            if key.startswith('wing_'):
+                for wing, values in training[key].items():
+                    arrays[key + '/' + wing] = values
+            else:
+                arrays[key] = training[key]
+        
+        try:
+            directory = os.path.dirname(filename)
+            os.makedirs(directory,exist_ok=True)
+            handle, temporary = tempfile.mkstemp(dir=directory,suffix='.npz')
+            with os.fdopen(handle,'wb') as file:
+                np.savez_compressed(file,**arrays)
+            os.replace(temporary,filename)
+        except OSError as error:
+            warn('could not save the training data cache ' + filename + ': ' + str(error),RuntimeWarning)
+        
+        return
         
     def build_surrogate(self):
         """Build a surrogate using sample evaluation results.
@@ -481,8 +771,8 @@ class Vortex_Lattice(Aerodynamics):
         CDi_w_data_sup = training.wing_drag_coefficient_sup 
          
         # transonic regime   	                             
-        CL_data_trans        = np.zeros((len(mach_data_sub),3))	      
-        CDi_data_trans       = np.zeros((len(mach_data_sub),3))	 	      
+        CL_data_trans        = np.zeros((len(AoA_data),3))	      
+        CDi_data_trans       = np.zeros((len(AoA_data),3))	 	      
         CL_w_data_trans      = Data()	                     
         CDi_w_data_trans     = Data()    
         CL_data_trans[:,0]   = CL_data_sub[:,-1]    	     
@@ -551,6 +841,19 @@ class Vortex_Lattice(Aerodynamics):
 # ----------------------------------------------------------------------
 #  Helper Functions
 # ----------------------------------------------------------------------
+
+# training data stored in the cache
+training_arrays = ['angle_of_attack',
+                   'Mach',
+                   'lift_coefficient_sub',
+                   'lift_coefficient_sup',
+                   'wing_lift_coefficient_sub',
+                   'wing_lift_coefficient_sup',
+                   'drag_coefficient_sub',
+                   'drag_coefficient_sup',
+                   'wing_drag_coefficient_sub',
+                   'wing_drag_coefficient_sup']
+
 def calculate_VLM(conditions,settings,geometry):
     """Calculate the total vehicle lift coefficient and specific wing coefficients (with specific wing reference areas)
     using a vortex lattice method.
@@ -601,3 +904,143 @@ def calculate_VLM(conditions,settings,geometry):
         i+=1
 
     return total_lift_coeff, total_induced_drag_coeff, wing_lifts, wing_drags , cl_y , cdi_y , CPi
+
+def sample_training_points(grid,samples,settings,geometry):
+    """Runs the vortex lattice on the points of a training grid that have not been sampled yet
+    and adds them to the samples.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    grid.
+      AoA                           [radians]
+      sub                           [-] subsonic Mach numbers
+      sup                           [-] supersonic Mach numbers
+    samples                         [dict] (angle of attack, Mach) to coefficients
+    settings                        (passed to vortex lattice method)
+    geometry                        (passed to vortex lattice method)
+
+    Outputs:
+    samples                         [dict] (angle of attack, Mach) to coefficients
+
+    Properties Used:
+    N/A
+    """      
+    
+    points = [(a,m) for m in np.hstack((grid.sub,grid.sup)) for a in grid.AoA if not (a,m) in samples]
+    if not points:
+        return samples
+    
+    points = np.array(points)
+    
+    # Setup Konditions                      
+    konditions                              = Data()
+    konditions.aerodynamics                 = Data()
+    konditions.freestream                   = Data()
+    konditions.aerodynamics.angle_of_attack = np.atleast_2d(points[:,0]).T
+    konditions.freestream.mach_number       = np.atleast_2d(points[:,1]).T
+    konditions.freestream.velocity          = np.zeros((len(points),1))
+    
+    total_lift, total_drag, wing_lifts, wing_drags = calculate_VLM(konditions,settings,geometry)[:4]
+    
+    for k, point in enumerate(points):
+        CL_w  = Data()
+        CDi_w = Data()
+        for wing in geometry.wings.keys():
+            CL_w[wing]  = wing_lifts[wing][k,0]
+            CDi_w[wing] = wing_drags[wing][k,0]
+        samples[tuple(point)] = (total_lift[k,0],total_drag[k,0],CL_w,CDi_w)
+    
+    return samples
+
+def training_grid_coefficients(grid,regime,samples):
+    """Arranges the samples of one speed regime on the training grid
+
+    Assumptions:
+    Every point of the grid has been sampled
+
+    Source:
+    N/A
+
+    Inputs:
+    grid.
+      AoA                           [radians]
+      sub                           [-] subsonic Mach numbers
+      sup                           [-] supersonic Mach numbers
+    regime                          ['sub' or 'sup']
+    samples                         [dict] (angle of attack, Mach) to coefficients
+
+    Outputs:
+    CL, CDi                         [array] angle of attack by Mach number
+    CL_w, CDi_w                     [Data] of arrays, wing specific
+
+    Properties Used:
+    N/A
+    """  
+    
+    AoA   = grid.AoA
+    Mach  = grid[regime]
+    CL    = np.zeros((len(AoA),len(Mach)))
+    CDi   = np.zeros_like(CL)
+    CL_w  = Data()
+    CDi_w = Data()
+    
+    for j, m in enumerate(Mach):
+        for i, a in enumerate(AoA):
+            CL[i,j], CDi[i,j], CL_wing, CDi_wing = samples[(a,m)]
+            for wing in CL_wing.keys():
+                if not wing in CL_w:
+                    CL_w[wing]  = np.zeros_like(CL)
+                    CDi_w[wing] = np.zeros_like(CL)
+                CL_w[wing][i,j]  = CL_wing[wing]
+                CDi_w[wing][i,j] = CDi_wing[wing]
+    
+    return CL, CDi, CL_w, CDi_w
+
+def leave_one_out_error(x,y,data,index,axis):
+    """Fits a spline to a tensor grid with one grid line left out, and returns the largest 
+    error along the left out line relative to the range of the data
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    x, y                            [array] grid coordinates
+    data                            [array] values on the grid
+    index                           [int] grid line to leave out
+    axis                            [int] 0 for a line of constant x, 1 for constant y
+
+    Outputs:
+    error                           [-]
+
+    Properties Used:
+    N/A
+    """  
+    
+    scale = np.max(data) - np.min(data)
+    if scale == 0.:
+        return 0.
+    
+    if axis == 0:
+        keep     = np.arange(len(x)) != index
+        x_fit    = x[keep]
+        y_fit    = y
+        data_fit = data[keep,:]
+        guess    = RectBivariateSpline(x_fit,y_fit,data_fit,kx=min(3,len(x_fit)-1),ky=min(3,len(y_fit)-1))(x[index],y)
+        actual   = data[index,:]
+    else:
+        keep     = np.arange(len(y)) != index
+        x_fit    = x
+        y_fit    = y[keep]
+        data_fit = data[:,keep]
+        guess    = RectBivariateSpline(x_fit,y_fit,data_fit,kx=min(3,len(x_fit)-1),ky=min(3,len(y_fit)-1))(x,y[index])
+        actual   = data[:,index]
+    
+    return np.max(np.abs(np.ravel(guess)-np.ravel(actual)))/scale
@@ -4,6 +4,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,9 +22,12 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
+# the properties the model is meant for, created once to check against
+reference_air   = Air()
+reference_earth = Earth()
 
 # ----------------------------------------------------------------------
 #  Classes
@@ -62,6 +66,10 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # optionally interpolate the pressure and temperature from a table
+        self.use_lookup_table        = False
+        self.lookup_table_resolution = 10. * Units.m
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
@@ -93,21 +101,20 @@ class US_Standard_1976(Atmospheric):
             altitude                             [m]
             temperature                          [K]
             pressure                             [Pa]
+          use_lookup_table                       [Boolean]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
         planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
         
         # check properties
-        if not gas == Air():
+        if not gas == reference_air:
             warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
+        if not planet == reference_earth:
             warn('US Standard Atmosphere not using Earth planet properties')          
         
         # convert input if necessary
@@ -128,36 +135,13 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        # pressure and temperature of the standard day
+        if self.use_lookup_table:
+            p, T = self.interpolate_lookup_table(zs)
+        else:
+            p, T = self.compute_standard_values(zs)
         
-        T   = T0 - dz*alpha + delta_isa
+        T   = T + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
@@ -173,6 +157,139 @@ class US_Standard_1976(Atmospheric):
         return atmo_data
 
 
+    def compute_standard_values(self,zs,i_layer=None):
+        """Computes the pressure and temperature of the standard day. Unless the layers are
+        given, the layer of each altitude is found with a binary search on the break altitudes.
+        Altitudes on a break use the layer above it.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+        Altitudes are within the breaks
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m] geopotential altitude
+        i_layer                                  [-] index of the layer of each altitude
+
+        Output:
+        p                                        [Pa]
+        T                                        [K]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        # unpack
+        grav      = self.planet.sea_level_gravity
+        R         = self.fluid_properties.gas_specific_constant
+        z_breaks  = np.asarray(self.breaks.altitude)
+        T_breaks  = np.asarray(self.breaks.temperature)
+        p_breaks  = np.asarray(self.breaks.pressure)
+        
+        # lapse rate of each layer
+        alpha_breaks = -(T_breaks[1:] - T_breaks[:-1])/(z_breaks[1:] - z_breaks[:-1])
+        
+        # find the layers
+        if i_layer is None:
+            i_layer = np.searchsorted(z_breaks,zs,side='right') - 1
+            i_layer = np.clip(i_layer,0,len(z_breaks)-2)
+        z0      = z_breaks[i_layer]
+        T0      = T_breaks[i_layer]
+        p0      = p_breaks[i_layer]
+        alpha   = alpha_breaks[i_layer]
+        
+        # interpolate the breaks
+        p  = np.zeros_like(zs)
+        dz = zs-z0
+        i_isoth = (alpha == 0.)
+        i_adiab = (alpha != 0.)
+        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        
+        T  = T0 - dz*alpha
+        
+        return p, T
+    
+    def interpolate_lookup_table(self,zs):
+        """Interpolates the pressure and temperature of the standard day from a table. The
+        table is built the first time it is needed and again when the breaks, the gas or the
+        resolution change. The breaks are nodes of the table and every interval keeps the
+        values at both of its ends from its own layer, so the small jumps of the tabulated
+        pressures at the breaks are not smeared. The temperature is exact, the logarithm of
+        the pressure is interpolated linearly.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+        Altitudes are within the breaks
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m] geopotential altitude
+
+        Output:
+        p                                        [Pa]
+        T                                        [K]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks                                 [Data]
+          lookup_table_resolution                [m]
+        """
+        
+        z_breaks = np.asarray(self.breaks.altitude,dtype=float)
+        key      = (z_breaks.tobytes(),
+                    np.asarray(self.breaks.temperature,dtype=float).tobytes(),
+                    np.asarray(self.breaks.pressure,dtype=float).tobytes(),
+                    float(self.planet.sea_level_gravity),
+                    float(self.fluid_properties.gas_specific_constant),
+                    float(self.lookup_table_resolution))
+        
+        table = self.get('_lookup_table',None)
+        if table is None or table.key != key:
+            z_table = np.arange(z_breaks[0],z_breaks[-1],self.lookup_table_resolution)
+            z_table = np.unique(np.concatenate([z_table,z_breaks]))
+            
+            # the layer of each interval
+            i_layer = np.searchsorted(z_breaks,z_table[:-1],side='right') - 1
+            i_layer = np.clip(i_layer,0,len(z_breaks)-2)
+            p_lower, T_lower = self.compute_standard_values(z_table[:-1],i_layer)
+            p_upper, T_upper = self.compute_standard_values(z_table[1:],i_layer)
+            
+            table = Data()
+            table.key                = key
+            table.altitude           = z_table
+            table.log_pressure_lower = np.log(p_lower)
+            table.log_pressure_upper = np.log(p_upper)
+            table.temperature_lower  = T_lower
+            table.temperature_upper  = T_upper
+            self._lookup_table = table
+            
+        # find the intervals
+        z_table    = table.altitude
+        i_interval = np.searchsorted(z_table,zs,side='right') - 1
+        i_interval = np.clip(i_interval,0,len(z_table)-2)
+        z_lower    = z_table[i_interval]
+        w          = (zs - z_lower)/(z_table[i_interval+1] - z_lower)
+        
+        log_p = (1.-w)*table.log_pressure_lower[i_interval] + w*table.log_pressure_upper[i_interval]
+        p     = np.exp(log_p)
+        T     = (1.-w)*table.temperature_lower[i_interval] + w*table.temperature_upper[i_interval]
+        
+        return p, T
+
+
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------
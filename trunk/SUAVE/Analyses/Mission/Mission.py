@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 """ Mission.py: Top-level mission class """
 
@@ -12,6 +13,8 @@
 
 import SUAVE
 from SUAVE.Core import Container as ContainerBase
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions.Segments.warm_start import seed_unknowns, store_unknowns, reset_unknowns, cold_start_needed
 from . import Segments
 
 # ----------------------------------------------------------------------
@@ -29,6 +32,9 @@ class Mission(Segments.Simple.Container):
         None
     """
     
+    # the stored solutions are kept on the instance, not as a key
+    warm_start_store = None
+    
     def __defaults__(self):
         """This sets the default values.
     
@@ -49,8 +55,50 @@ class Mission(Segments.Simple.Container):
         """         
         self.tag = 'mission'
         
+        # start the segments from the unknowns they converged to in the last evaluation
+        self.settings.warm_start = True
+        self.warm_start_store    = Data()
+        
         # see Segments.Simple.Container
         
+    def evaluate(self,state=None):
+        """ Runs the mission. The unknowns of each segment start from the last converged
+            solution of the segment, see Methods.Missions.Segments.warm_start. A segment of a
+            Sequential_Segments mission that does not converge from there is run again from its
+            cold start. A mission that is solved as a whole is run again from the cold start of
+            all its segments. Clearing warm_start_store restarts every segment from its current
+            unknowns.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            state   [Data()]
+            self.settings.warm_start [bool]
+    
+            Outputs:
+            self    [Mission()]
+    
+            Properties Used:
+            None
+        """   
+        
+        seed_unknowns(self)
+        
+        Segments.Simple.Container.evaluate(self,state)
+        
+        # fall back to a cold start
+        if cold_start_needed(self):
+            reset_unknowns(self)
+            Segments.Simple.Container.evaluate(self,state)
+        
+        store_unknowns(self)
+        
+        return self
+    
     def finalize(self):
         """ Stub
     
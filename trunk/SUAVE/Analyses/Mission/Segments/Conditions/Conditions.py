@@ -5,17 +5,22 @@
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 # python imports
+import copy
 import numpy as np
 
 # SUAVE imports
 from SUAVE.Core                    import Data
 
+dictsetitem  = dict.__setitem__
+objgetattrib = object.__getattribute__
+
 # ----------------------------------------------------------------------
 #  Conditions
 # ----------------------------------------------------------------------
@@ -35,6 +40,35 @@ class Conditions(Data):
 
     _size = 1
     
+    # the packed layout, see pack()
+    _buffer       = None
+    _packed_views = None
+    
+    def __setitem__(self,k,v):
+        """ Sets a value. If the conditions are packed and a packed array is replaced, its
+            columns of the buffer are no longer used, so the old array keeps its values.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            k      [key]
+            v      [value]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        views = objgetattrib(self,'_packed_views')
+        if views is not None and k in views and not v is views[k]:
+            del views[k]
+        dictsetitem(self,k,v)
+    
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
         
@@ -116,6 +150,11 @@ class Conditions(Data):
             None
         """           
         
+        # the buffer is rebuilt at the new size
+        packed = self._buffer is not None
+        if packed:
+            self.unpack()
+        
         # store
         self._size = rows
         
@@ -136,6 +175,126 @@ class Conditions(Data):
             #: if type
         #: for each key,value
         
+        if packed:
+            self.pack()
+        
+        return
+    
+    def pack(self):
+        """ Moves the arrays of the conditions into one buffer with a column for every column of
+            every array, and replaces the arrays with views of their columns. The buffer is in
+            column major order, so every column is contiguous. Writing into an array writes into
+            the buffer, setting a new array replaces the view as usual.
+        
+            Assumptions:
+            Only two dimensional float arrays with a row per control point are packed
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            buffer   [array]
+    
+            Properties Used:
+            None
+        """
+        
+        self.unpack()
+        
+        # find the arrays
+        rows   = self._size
+        arrays = []
+        def gather(conditions):
+            for k,v in conditions.items():
+                if isinstance(v,Conditions):
+                    gather(v)
+                elif isinstance(v,np.ndarray) and v.ndim == 2 and v.shape[0] == rows and v.dtype == np.float64:
+                    arrays.append((conditions,k,v))
+        gather(self)
+        
+        # copy them into the buffer
+        n_columns = sum(v.shape[1] for conditions,k,v in arrays)
+        buffer    = np.empty((rows,n_columns),order='F')
+        start     = 0
+        for conditions,k,v in arrays:
+            stop = start + v.shape[1]
+            view = buffer[:,start:stop]
+            view[...] = v
+            if conditions._packed_views is None:
+                conditions._packed_views = dict()
+            conditions._packed_views[k] = view
+            dictsetitem(conditions,k,view)
+            start = stop
+        
+        self._buffer = buffer
+        
+        return buffer
+    
+    def __deepcopy__(self,memo):
+        """ Copies the conditions. Packed conditions copy their buffer once and the copied
+            arrays are views of the copied buffer.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            memo     [dict]
+    
+            Outputs:
+            copy     [Conditions]
+    
+            Properties Used:
+            None
+        """
+        
+        buffer = self._buffer
+        if buffer is not None and buffer.size and not id(buffer) in memo:
+            new_buffer = buffer.copy(order='F')
+            memo[id(buffer)] = new_buffer
+            def map_views(conditions):
+                views = conditions._packed_views
+                if views is not None:
+                    for view in views.values():
+                        start = (view.__array_interface__['data'][0] - buffer.__array_interface__['data'][0])//buffer.strides[1]
+                        memo[id(view)] = new_buffer[:,start:start+view.shape[1]]
+                for v in conditions.values():
+                    if isinstance(v,Conditions):
+                        map_views(v)
+            map_views(self)
+        
+        return copy._reconstruct(self,memo,*self.__reduce_ex__(4))
+    
+    def unpack(self):
+        """ Stops treating the arrays as part of a buffer. The arrays keep their values.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        self._buffer       = None
+        self._packed_views = None
+        for v in self.values():
+            if isinstance(v,Conditions):
+                v.unpack()
+        
         return
 
     def compile(self):
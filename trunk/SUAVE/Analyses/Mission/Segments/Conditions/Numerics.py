@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -52,10 +53,14 @@ class Numerics(Conditions):
         self.number_control_points = 16
         self.discretization_method = chebyshev_data
         
-        self.solver_jacobian                  = "none"
+        self.solver_jacobian                  = "none"     # "none", "sparse" or "function"
+        self.jacobian_sparsity                = None       # found on the first jacobian if "sparse"
+        self.jacobian_colors                  = None
+        self.jacobian_function                = None       # jacobian_function(unknowns,segment) if "function"
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
+        self.pack_conditions                  = False      # keep the conditions arrays in one buffer, see Conditions.pack
         
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
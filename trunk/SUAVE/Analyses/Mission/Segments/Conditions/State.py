@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,7 +21,7 @@ from .Numerics   import Numerics
 
 import SUAVE
 from SUAVE.Core.Arrays import array_type
-from SUAVE.Core import DataOrdered
+from SUAVE.Core import Data, DataOrdered
 
 # ----------------------------------------------------------------------
 #  State
@@ -147,14 +148,7 @@ class Container(State):
             None
         """              
         
-        state_out = State()
-        
-        for i,(tag,sub_state) in enumerate(self.segments.items()):
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        state_out = merge_states(list(self.segments.values()))
             
         return state_out
         
@@ -183,4 +177,81 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def merge_states(sub_states):
+    """ Combines the unknowns, conditions and residuals of a list of states. Every array is
+        stacked once from all of the states, so each value is only copied once however many
+        states there are.
+
+        Assumptions:
+        Gives the same result as stacking the states one after the other: only the keys
+        every state has are kept, and only if they are arrays in every state.
+
+        Source:
+        N/A
+
+        Inputs:
+        sub_states [list of State()]
+
+        Outputs:
+        state_out  [State()]
+
+        Properties Used:
+        None
+    """     
+    
+    state_out = State()
+    
+    if not len(sub_states):
+        return state_out
+    
+    for key in ['unknowns','conditions','residuals']:
+        state_out[key].update(sub_states[0][key])
+        if len(sub_states) > 1:
+            structures     = [state_out[key]] + [sub_state[key] for sub_state in sub_states[1:]]
+            state_out[key] = merge_structures(structures,state_out[key].__class__)
+            
+    return state_out
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def merge_structures(structures,klass):
+    """ Stacks the arrays of several data structures, walking all of them at once
+
+        Assumptions:
+        Keys are taken from the first structure. A structure that is not a Data stands in for
+        all of its keys.
+
+        Source:
+        N/A
+
+        Inputs:
+        structures [list of Data]
+        klass      [class] of the merged data structures
+
+        Outputs:
+        merged     [klass]
+
+        Properties Used:
+        None
+    """      
+    
+    merged = klass()
+    
+    for k,a in structures[0].items():
+        values = [a]
+        for B in structures[1:]:
+            if isinstance(B,Data):
+                if not k in B:
+                    break
+                values.append(B[k])
+            else:
+                values.append(B)
+        else:
+            if isinstance(a,Data):
+                merged[k] = merge_structures(values,klass)
+            elif all(isinstance(v,array_type) for v in values):
+                merged[k] = np.vstack(values)
+            
+    return merged
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@
 
 from SUAVE.Analyses import Analysis, Settings, Process
 from .Conditions import State
+from .Conditions.State import merge_states
 from SUAVE.Core.Arrays import array_type
 import numpy as np
 
@@ -50,6 +52,7 @@ class Segment(Analysis):
         """          
         
         self.settings = Settings()
+        self.settings.initials_segment = None # tag of the segment to take initials from, None is the previous segment
         
         self.state = State()
 
@@ -219,15 +222,7 @@ class Segment(Analysis):
             None
         """              
         
-        state_out = State()
-        
-        for i,(tag,sub_seg) in enumerate(self.segments.items()):
-            sub_state = sub_seg.state
-            for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key].update(sub_state[key])
-                else:
-                    state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
+        state_out = merge_states([sub_seg.state for sub_seg in self.segments.values()])
             
         return state_out
 
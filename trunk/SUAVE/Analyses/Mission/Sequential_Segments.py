@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Oct 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -28,6 +29,9 @@ class Sequential_Segments(Mission):
         None
     """
     
+    # the worker processes are kept on the instance, not as a key
+    process_pool = None
+    
     def __defaults__(self):
         """This sets the default values.
     
@@ -49,6 +53,11 @@ class Sequential_Segments(Mission):
         
         self.tag = 'mission'
         
+        # segments that do not depend on each other through their initials
+        # are evaluated in parallel if this is more than one
+        self.settings.number_of_processes = 1
+        self.process_pool                 = Methods.Segments.Common.Sub_Segments.Process_Pool()
+        
         
         # --------------------------------------------------------------
         #   The Solving Process
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -54,4 +55,7 @@ class Fidelity_One(Noise):
         settings.approach       = 0
         settings.sideline       = 0
         settings.mic_x_position = 0
+        
+        # microphones evaluated together by the noise footprint
+        settings.footprint_chunk_size = 32
         
\ No newline at end of file
@@ -5,6 +5,7 @@
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -12,6 +13,8 @@ from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars \
      import compute_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.interpolate_airfoil_polars \
+     import interpolate_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
 
@@ -182,6 +185,7 @@ class Propeller(Energy_Component):
             # compute airfoil polars for airfoils 
             airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
+            airfoil_cl_stations = airfoil_cl[a_loc]
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
@@ -244,8 +248,7 @@ class Propeller(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl_stations)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -489,8 +492,9 @@ class Propeller(Energy_Component):
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on propeller')            
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self,conditions, a_pol)
+            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
+            airfoil_cl_stations = airfoil_cl[a_loc]
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
@@ -553,8 +557,7 @@ class Propeller(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl_stations)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
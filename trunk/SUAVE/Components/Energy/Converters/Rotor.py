@@ -5,6 +5,7 @@
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -15,8 +16,9 @@ import scipy as sp
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data, Units
 import scipy.optimize as opt
-from scipy.optimize import fsolve
+from SUAVE.Methods.Propulsion.rotor_forward_flight_inflow import rotor_forward_flight_inflow
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import compute_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.interpolate_airfoil_polars import interpolate_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
 
@@ -178,29 +180,25 @@ class Rotor(Energy_Component):
         ua = np.zeros_like(V)
         power_ratio = np.zeros_like(V)
         if Vh != None:   
-            for i in range(len(V)):
-                V_inf = V_thrust[i] 
-                V_Vh =  V_thrust[i][0]/Vh
+            V_Vh = V/Vh
             
-                if Vv[i,:].all()  == 0 :
-                    ua[i] = Vh
-                elif Vv[i][0]  == 0 and  Vv[i][2] != 0: # vertical / axial flight
-                    if V_Vh > 0: # climbing 
-                        ua[i] =Vh*(-.5*V_Vh+np.sqrt((.5*V_Vh)**2+1)) #Vh*(-(-V_inf[0]/(2*Vh)) + np.sqrt((-V_inf[0]/(2*Vh))**2 + 1))
-                        
-                    elif -2 <= V_Vh and V_Vh <= 0:  # slow descent                 
-                        ua[i] = Vh*(1.15-V_Vh)#Vh*(1.15 -1.125*(V_Vh) - 1.372*(V_Vh)**2 - 1.718*(V_Vh)**2 - 0.655*(V_Vh)**4 ) 
-                    else: # windmilling 
-                        print("rotor is in the windmill break state!")
-                        ua[i] = Vh*(-(-V_inf[0]/(2*Vh)) - np.sqrt((-V_inf[0]/(2*Vh))**2 + 1))
-                
-                
-                else: # forward flight conditions                 
-                    func = lambda vi: vi - (Vh**2)/(np.sqrt(((-V_inf[2])**2 + (V_inf[0] + vi)**2)))
-                    vi_initial_guess = V_inf[0]
-                    ua[i]    = fsolve(func,vi_initial_guess)
+            # flight regime of each control point
+            hover    = np.logical_not(np.all(Vv,axis=1))[:,None]
+            axial    = np.logical_and(np.logical_and(Vv[:,0,None] == 0, Vv[:,2,None] != 0),np.logical_not(hover)) # vertical / axial flight
+            forward  = np.logical_not(np.logical_or(hover,axial))                                                 # forward flight conditions
+            climb    = np.logical_and(axial,V_Vh > 0)
+            descent  = np.logical_and(axial,np.logical_and(-2 <= V_Vh,V_Vh <= 0))
+            windmill = np.logical_and(axial,np.logical_not(np.logical_or(climb,descent)))
+            
+            ua[hover]   = Vh
+            ua[climb]   = (Vh*(-.5*V_Vh+np.sqrt((.5*V_Vh)**2+1)))[climb] 
+            ua[descent] = (Vh*(1.15-V_Vh))[descent]
+            if np.any(windmill):
+                print("rotor is in the windmill break state!")
+                ua[windmill] = (Vh*(-(-V/(2*Vh)) - np.sqrt((-V/(2*Vh))**2 + 1)))[windmill]
+            ua[forward] = rotor_forward_flight_inflow(V_thrust[forward[:,0]],Vh)
            
-                power_ratio[i] = ua[i]/Vh+V_Vh 
+            power_ratio = ua/Vh+V_Vh 
         else: 
             ua = 0.0 
         
@@ -220,6 +218,7 @@ class Rotor(Energy_Component):
             # compute airfoil polars for airfoils 
             airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
+            airfoil_cl_stations = airfoil_cl[a_loc]
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
@@ -282,8 +281,7 @@ class Rotor(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl_stations)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -535,22 +533,23 @@ class Rotor(Energy_Component):
         ut    = np.zeros_like(V)
         
         if Vh != None:     
-            for i in range(len(V)): 
-                V_Vh =  V_thrust[i][0]/Vh
-                if Vv[i,:].all()  == True :
-                    ua[i] = Vh
-                elif Vv[i][0]  == 0 and  Vv[i][2] != 0: # vertical / axial flight
-                    if V_Vh > 0: # climbing 
-                        ua[i] = Vh*(-(-V_inf[i][0]/(2*Vh)) + np.sqrt((-V_inf[i][0]/(2*Vh))**2 + 1))
-                    elif -2 <= V_Vh and V_Vh <= 0:  # slow descent                 
-                        ua[i] = Vh*(1.15 -1.125*(V_Vh) - 1.372*(V_Vh)**2 - 1.718*(V_Vh)**2 - 0.655*(V_Vh)**4 ) 
-                    else: # windmilling 
-                        print("rotor is in the windmill break state!")
-                        ua[i] = Vh*(-(-V_inf[i][0]/(2*Vh)) - np.sqrt((-V_inf[i][0]/(2*Vh))**2 + 1))
-                else: # forward flight conditions                 
-                    func = lambda vi: vi - (Vh**2)/(np.sqrt(((-V_inf[i][2])**2 + (V_inf[i][0] + vi)**2)))
-                    vi_initial_guess = V_inf[i][0]
-                    ua[i]    = fsolve(func,vi_initial_guess)
+            V_Vh = V/Vh
+            
+            # flight regime of each control point
+            hover    = np.all(Vv,axis=1)[:,None]
+            axial    = np.logical_and(np.logical_and(Vv[:,0,None] == 0, Vv[:,2,None] != 0),np.logical_not(hover)) # vertical / axial flight
+            forward  = np.logical_not(np.logical_or(hover,axial))                                                 # forward flight conditions
+            climb    = np.logical_and(axial,V_Vh > 0)
+            descent  = np.logical_and(axial,np.logical_and(-2 <= V_Vh,V_Vh <= 0))
+            windmill = np.logical_and(axial,np.logical_not(np.logical_or(climb,descent)))
+            
+            ua[hover]   = Vh
+            ua[climb]   = (Vh*(-(-V/(2*Vh)) + np.sqrt((-V/(2*Vh))**2 + 1)))[climb]
+            ua[descent] = (Vh*(1.15 -1.125*(V_Vh) - 1.372*(V_Vh)**2 - 1.718*(V_Vh)**2 - 0.655*(V_Vh)**4 ))[descent]
+            if np.any(windmill):
+                print("rotor is in the windmill break state!")
+                ua[windmill] = (Vh*(-(-V/(2*Vh)) - np.sqrt((-V/(2*Vh))**2 + 1)))[windmill]
+            ua[forward] = rotor_forward_flight_inflow(V_inf[forward[:,0]],Vh)
             lambda_i      = ua/(omega*R)
  
         #Things that don't change with iteration
@@ -564,6 +563,7 @@ class Rotor(Energy_Component):
             # compute airfoil polars for airfoils 
             airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
+            airfoil_cl_stations = airfoil_cl[a_loc]
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
@@ -628,8 +628,7 @@ class Rotor(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl_stations)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -4,6 +4,7 @@
 # Created:  Jun 2016, E. Botero
 # Modified: Jan 2020, M. Clarke
 #           May 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -17,15 +18,111 @@ chars = string.punctuation + string.whitespace
 t_table = str.maketrans( chars          + string.ascii_uppercase , 
                             '_'*len(chars) + string.ascii_lowercase )
 
-dictgetitem = dict.__getitem__
+dictgetitem  = dict.__getitem__
 objgetattrib = object.__getattribute__
+objsetattrib = object.__setattr__
+objdelattrib = object.__delattr__
+
+# the attribute names and the Data() bases of each class
+class_attributes = {}
+class_bases      = {}
+
+# ----------------------------------------------------------------------
+#   Class Attributes
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def get_class_attributes(klass):
+    """ Returns the names of the attributes an instance of klass finds on its class. The names
+        are collected once per class, and collected again after an attribute of a Data() class
+        is set or deleted, see Data_Class.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        klass
+
+        Outputs:
+        names    [frozenset]
+
+        Properties Used:
+        N/A
+    """
+    names = class_attributes.get(klass)
+    if names is None:
+        names = class_attributes[klass] = frozenset(dir(klass))
+
+    return names
+
+# ----------------------------------------------------------------------
+#   Data Class
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Data_Class(type):
+    """ The class of the Data() classes. It keeps the attribute names of get_class_attributes up
+        to date when an attribute is added to or removed from a class after it is created.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+    """
+
+    def __setattr__(cls, k, v):
+        """ Sets a class attribute and forgets the collected attribute names
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+            v        [value]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        type.__setattr__(cls, k, v)
+        class_attributes.clear()
+
+    def __delattr__(cls, k):
+        """ Deletes a class attribute and forgets the collected attribute names
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k        [key]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        type.__delattr__(cls, k)
+        class_attributes.clear()
 
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
 
 ## @ingroup Core
-class Data(dict):
+class Data(dict, metaclass=Data_Class):
     """ An extension of the Python dict which allows for both tag and '.' usage.
         This is an unordered dictionary. So indexing it will not produce deterministic results.
         This has less overhead than ordering. If ordering is needed use DataOrdered().
@@ -41,7 +138,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Keys come before attributes. The attribute is only looked up if there is no key k.
     
             Source:
             N/A
@@ -57,14 +154,15 @@ class Data(dict):
             """         
         try:
             return dictgetitem(self,k)
-        except:
+        except KeyError:
             return objgetattrib(self,k)
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            k is treated as an object attribute if the class or the instance has it, 
+            otherwise it is treated as a key.
     
             Source:
             N/A
@@ -79,18 +177,17 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
+        if k in get_class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
+            objsetattrib(self, k, v)
+        else:
             self[k] = v
-        else:          
-            object.__setattr__(self, k, v) 
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            k is treated as an object attribute if the class or the instance has it, 
+            otherwise it is treated as a key.
     
             Source:
             N/A
@@ -104,12 +201,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
+        if k in get_class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
+            objdelattrib(self, k)
         else:
-            object.__delattr__(self, k)
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -428,6 +523,10 @@ class Data(dict):
             # recurse only if self's value is a Dict()
             if k.startswith('_'):
                 continue
+            
+            if not k in self:
+                self[k] = v
+                continue
         
             try:
                 self[k].update(v)
@@ -453,17 +552,20 @@ class Data(dict):
             Properties Used:
             N/A    
         """          
-        klass = self.__class__
-        klasses = []
-        while klass:
-            if issubclass(klass,Data): 
-                klasses.append(klass)
-                klass = klass.__base__
-            else:
-                klass = None
-        if not klasses: # empty list
-            raise TypeError('class %s is not of type Data()' % self.__class__)
-        return klasses    
+        klass   = self.__class__
+        klasses = class_bases.get(klass)
+        if klasses is None:
+            klasses = []
+            while klass:
+                if issubclass(klass,Data): 
+                    klasses.append(klass)
+                    klass = klass.__base__
+                else:
+                    klass = None
+            if not klasses: # empty list
+                raise TypeError('class %s is not of type Data()' % self.__class__)
+            class_bases[self.__class__] = klasses
+        return list(klasses)    
     
     def append(self,value,key=None):
         """ Adds new values to the classes. Can also change an already appended key
@@ -5,6 +5,7 @@
 # Modified: Sep 2016, E. Botero
 #           May 2020, E. Botero
 #           Jul 2020, E. Botero 
+#           Oct 2026, SUAVE Team
 
 
    
@@ -23,6 +24,13 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 from warnings import warn
 import numpy as np
 
+from .Data import get_class_attributes
+
+objgetattrib = object.__getattribute__
+
+# the DataOrdered() bases of each class
+class_bases = {}
+
 # ----------------------------------------------------------------------
 #   Property Class
 # ----------------------------------------------------------------------   
@@ -203,10 +211,10 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """          
-        if not (isinstance(k,int) or isinstance(k,np.int64)):
-            return super(DataOrdered,self).__getattribute__(k)
+        if not isinstance(k,(int,np.int64)):
+            return objgetattrib(self,k)
         else:
-            return super(DataOrdered,self).__getattribute__(self.keys()[k])
+            return objgetattrib(self,self.keys()[k])
     
     def __new__(cls,*args,**kwarg):
         """ Creates a new Data() class
@@ -229,7 +237,7 @@ class DataOrdered(OrderedDict):
         # Make the new:
         self = OrderedDict.__new__(cls)
         
-        if self.hasattr('_root'):
+        if dict.__contains__(self,'_root'):
             self._root
         else:
             root = [] # sentinel node
@@ -393,17 +401,20 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """        
-        klass = self.__class__
-        klasses = []
-        while klass:
-            if issubclass(klass,DataOrdered): 
-                klasses.append(klass)
-                klass = klass.__base__
-            else:
-                klass = None
-        if not klasses: # empty list
-            raise TypeError('class %s is not of type DataBunch()' % self.__class__)
-        return klasses
+        klass   = self.__class__
+        klasses = class_bases.get(klass)
+        if klasses is None:
+            klasses = []
+            while klass:
+                if issubclass(klass,DataOrdered): 
+                    klasses.append(klass)
+                    klass = klass.__base__
+                else:
+                    klass = None
+            if not klasses: # empty list
+                raise TypeError('class %s is not of type DataBunch()' % self.__class__)
+            class_bases[self.__class__] = klasses
+        return list(klasses)
     
     def typestring(self):
         """ This function makes the .key.key structure in string form of Data()
@@ -539,6 +550,10 @@ class DataOrdered(OrderedDict):
             # recurse only if self's value is a Dict()
             if k.startswith('_'):
                 continue
+            
+            if not hasattr(self,k):
+                self[k] = v
+                continue
         
             try:
                 self[k].update(v)
@@ -682,8 +697,8 @@ class DataOrdered(OrderedDict):
         """        
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
-        #if not self.has_key(key) and not hasattr(self.__class__,key):
+        klass = self.__class__
+        if not hasattr(self,key) and not key in get_class_attributes(type(klass)):
             root = dict.__getitem__(self,'_root')
             last = root[0]
             map  = dict.__getitem__(self,'_map')
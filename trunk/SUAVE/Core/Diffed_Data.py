@@ -4,6 +4,7 @@
 # Created:  Feb 2015, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
 #           Jun 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -55,7 +56,8 @@ class Diffed_Data(Data):
         self._diff  = Data()
         
     def __init__(self,base=None):
-        """ Initializes the new Diffed_Data() class through a deepcopy
+        """ Initializes the new Diffed_Data() class through a deepcopy. If the base is 
+            itself a Diffed_Data(), its own base and diff are not copied.
     
             Assumptions:
             N/A
@@ -74,7 +76,15 @@ class Diffed_Data(Data):
         """  
         if base is None: base = Data()
         self._base = base
-        this = deepcopy(base) # deepcopy is needed here to build configs - Feb 2016, T. MacDonald
+        
+        # the hidden items are not kept, so they are not copied
+        memo = {}
+        for key in ['_base','_diff']:
+            if dict.__contains__(base,key):
+                hidden = dict.__getitem__(base,key)
+                memo[id(hidden)] = hidden
+        
+        this = deepcopy(base,memo) # deepcopy is needed here to build configs - Feb 2016, T. MacDonald
         Data.__init__(self,this)
         
     def store_diff(self):
@@ -304,6 +314,30 @@ def diff(A,B):
         N/A    
     """      
 
+    return make_diff(A,diff_items(A,B))
+
+def diff_items(A,B):
+    """ Finds the keys and values of A that differ from B. Sub-diffs are only built for the 
+        branches that differ, so the work done for the branches that do not scales with the 
+        number of values compared.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        A
+        B
+
+        Outputs:
+        items    [list of (key,value)]
+
+        Properties Used:
+        N/A    
+    """      
+
     keys = set([])
     keys.update( A.keys() )
     keys.update( B.keys() )
@@ -312,29 +346,63 @@ def diff(A,B):
         keys.remove('_base')
         keys.remove('_diff')
 
-    result = type(A)()
-    result.clear()
+    items = []
 
     for key in keys:
         va = A.get(key,None)
         vb = B.get(key,None)
         if isinstance(va,Data) and isinstance(vb,Data):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+            sub_items = diff_items(va,vb)
+            if sub_items:
+                sub_diff = make_diff(va,sub_items)
+                if sub_diff:
+                    items.append((key,sub_diff))
 
         elif isinstance(va,Data) or isinstance(vb,Data):
-            result[key] = va
+            items.append((key,va))
             
         elif isinstance(va,DataOrdered) and isinstance(vb,DataOrdered):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+            sub_items = diff_items(va,vb)
+            if sub_items:
+                sub_diff = make_diff(va,sub_items)
+                if sub_diff:
+                    items.append((key,sub_diff))
 
         elif isinstance(va,DataOrdered) or isinstance(vb,DataOrdered):
-            result[key] = va        
+            items.append((key,va))
+
+        else:
+            # scalars compare to a bool, which does not need numpy
+            equal = va == vb
+            if equal is False or (equal is not True and not np.all(equal)):
+                items.append((key,va))
+
+    return items
+
+def make_diff(A,items):
+    """ Builds an empty instance of the class of A that holds the items of a diff
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        A
+        items    [list of (key,value)]
+
+        Outputs:
+        Result
+
+        Properties Used:
+        N/A    
+    """      
+
+    result = type(A)()
+    result.clear()
 
-        elif not np.all(va == vb):
-            result[key] = va
+    for key, value in items:
+        result[key] = value
 
-    return result    
\ No newline at end of file
+    return result
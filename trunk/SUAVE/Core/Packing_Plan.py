@@ -0,0 +1,372 @@
+## @ingroup Core
+# Packing_Plan.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+
+from .Arrays import array_type, matrix_type
+
+# valid types for packing, same as Data.pack_array()
+valid_types = ( int, float,
+                array_type,
+                matrix_type )
+
+# ----------------------------------------------------------------------
+#   Packing Plan
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Packing_Plan(object):
+    """ A precompiled version of Data.pack_array() and Data.unpack_array() for the
+        vector output. The layout of a data dictionary is walked once and stored as a
+        flat list of (container, key, shape, offset) entries with a preallocated buffer.
+        Packing and unpacking are then slice copies. The containers of the data are
+        found once and reused while their keys stay the same, and the shapes of the
+        values are checked as they are copied. The plan rebuilds itself if either has
+        changed.
+
+        Assumptions:
+        Packs in the same order and with the same rules as Data.pack_array(output='vector').
+        A value that was not packed, such as a string, is not picked up if it is replaced
+        by an array under the same key.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data=None):
+        """ Initializes the plan, optionally compiling it for some data
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data     [Data()]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.size        = 0
+        self.buffer      = np.zeros(0)
+        self._containers = []
+        self._layouts    = []
+        self._entries    = []
+        self._keys       = []
+        self._resolved   = None
+        self._built      = False
+
+        if data is not None:
+            self.build(data)
+
+    def __reduce__(self):
+        """ Drops the compiled plan when copying or pickling. The views into the buffer
+            do not survive a copy, so copies start as an empty plan and recompile on their
+            first use. This works the same for every pickle protocol.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            class, arguments [tuple]
+
+            Properties Used:
+            N/A
+        """
+        return (self.__class__, ())
+
+    def build(self,data):
+        """ Walks the data dictionary and compiles the packing plan
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data     [Data()]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        containers = []
+        layouts    = []
+        entries    = []
+        offset     = [0]
+
+        def do_build(D,parent,key):
+            index = len(containers)
+            containers.append((parent,key))
+            layout = []
+            layouts.append(layout)
+            for k,v in D.items():
+                sig = signature(v)
+                layout.append((k,sig))
+                if sig == 'dict':
+                    do_build(v,index,k) # recursion!
+                    continue
+                elif sig is None:
+                    continue
+                # scalars pack as a single value, arrays in column major order
+                n = int(np.prod(sig)) if sig else 1
+                start, stop = offset[0], offset[0] + n
+                entries.append([index,k,sig,start,stop,None])
+                offset[0] = stop
+
+        do_build(data,None,None)
+
+        self.size        = offset[0]
+        self.buffer      = np.zeros(self.size)
+        self._containers = containers
+        self._layouts    = [tuple(layout) for layout in layouts]
+        self._keys       = [tuple([k for k,sig in layout]) for layout in layouts]
+        self._resolved   = None
+        self._built      = True
+
+        # views of the buffer shaped like each entry
+        for entry in entries:
+            index, k, sig, start, stop, _ = entry
+            if sig:
+                entry[5] = self.buffer[start:stop].reshape(sig,order='F')
+        self._entries = [tuple(entry) for entry in entries]
+
+        return
+
+    def resolve(self,data):
+        """ Finds the containers of the plan in the data, returns None if the
+            keys or shapes of the data no longer match the plan. The containers found
+            for the same data are reused as long as they are the same objects with the
+            same keys, the shapes of the values are then checked by pack and unpack.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [Data()]
+
+            Outputs:
+            containers [list]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self._built:
+            return None
+
+        # reuse the containers found last time
+        containers = self._resolved
+        if containers is not None and containers[0] is data:
+            keys = self._keys
+            for i,(parent,key) in enumerate(self._containers):
+                D = containers[i]
+                if i and dict.get(containers[parent],key) is not D:
+                    break
+                if tuple(D.keys()) != keys[i]:
+                    break
+            else:
+                return containers
+
+        layouts    = self._layouts
+        containers = [data]
+        for i,(parent,key) in enumerate(self._containers):
+            if i:
+                containers.append(containers[parent][key])
+            D = containers[i]
+            if not isinstance(D,dict):
+                return None
+            layout = tuple([(k,signature(v)) for k,v in D.items()])
+            if layout != layouts[i]:
+                return None
+
+        self._resolved = containers
+
+        return containers
+
+    def pack(self,data):
+        """ Maps the data dict to a 1D vector, equivalent to Data.pack_array()
+
+            Assumptions:
+            The returned vector is a copy and does not share memory with the plan
+
+            Source:
+            N/A
+
+            Inputs:
+            data     [Data()]
+
+            Outputs:
+            array    [np.array]
+
+            Properties Used:
+            N/A
+        """
+
+        containers = self.resolve(data)
+        if containers is None or not self.copy_in(containers):
+            self.build(data)
+            self.copy_in(self.resolve(data))
+
+        return self.buffer.copy()
+
+    def copy_in(self,containers):
+        """ Copies the values of the data into the buffer, returns False if a value
+            no longer matches the plan
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            containers [list]
+
+            Outputs:
+            matched    [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+        for index, k, sig, start, stop, view in self._entries:
+            v = dict.get(containers[index],k,None)
+            if view is None:
+                if signature(v) != ():
+                    return False
+                buffer[start] = v
+            elif getattr(v,'shape',None) == sig:
+                view[...] = v
+            else:
+                return False
+
+        return True
+
+    def unpack(self,data,M):
+        """ Unpacks a 1D vector into the data dictionary, equivalent to Data.unpack_array()
+
+            Assumptions:
+            The structure of the data must match the data the vector was packed from
+
+            Source:
+            N/A
+
+            Inputs:
+            data     [Data()]
+            M        [np.array]
+
+            Outputs:
+            a reference to data, updates data in place
+
+            Properties Used:
+            N/A
+        """
+
+        # the plan only handles vectors
+        if M.ndim != 1:
+            return data.unpack_array(M)
+
+        containers = self.resolve(data)
+        if containers is None or not self.copy_out(containers,M):
+            self.build(data)
+            self.copy_out(self.resolve(data),M)
+
+        if not M.shape[-1] == self.size: warn('did not unpack all values',RuntimeWarning)
+
+        return data
+
+    def copy_out(self,containers,M):
+        """ Copies a vector into the values of the data, returns False if a value no
+            longer matches the plan. The values before it have then been written.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            containers [list]
+            M          [np.array]
+
+            Outputs:
+            matched    [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        for index, k, sig, start, stop, view in self._entries:
+            D = containers[index]
+            v = dict.get(D,k,None)
+            if view is None:
+                if signature(v) != ():
+                    return False
+                D[k] = M[start]
+            elif getattr(v,'shape',None) == sig:
+                v[...] = M[start:stop].reshape(sig,order='F')
+            else:
+                return False
+
+        return True
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def signature(v):
+    """ Classifies a value for the packing plan
+
+        Assumptions:
+        Arrays of rank greater than 2 are not packed
+
+        Source:
+        N/A
+
+        Inputs:
+        v           [any]
+
+        Outputs:
+        signature   ['dict', shape tuple, or None if not packed]
+
+        Properties Used:
+        N/A
+    """
+    if isinstance(v,dict):
+        return 'dict'
+    elif not isinstance(v,valid_types):
+        return None
+    try:
+        shape = v.shape
+    except AttributeError:
+        return ()
+    if len(shape) > 2:
+        return None
+    return shape
@@ -8,5 +8,6 @@ from .DataOrdered      import DataOrdered
 from .Diffed_Data      import Diffed_Data, diff
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
+from .Packing_Plan     import Packing_Plan
 
 from .Units import Units
\ No newline at end of file
@@ -3,6 +3,7 @@
 # 
 # Created:  May 2019, M. Clarke
 #           Jul 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,8 @@ from SUAVE.Core import Units
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_induced_velocity_matrix
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution     import compute_vortex_distribution
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix              import compute_RHS_matrix
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.influence_cache                 import cached_vortex_distribution, \
+     cached_induced_velocity_matrix, cached_vortex_strengths
 # ----------------------------------------------------------------------
 #  Vortex Lattice
 # ----------------------------------------------------------------------
@@ -69,6 +72,9 @@ def VLM(conditions,settings,geometry):
        settings.number_panels_chordwise        [Unitless]
        settings.use_surrogate                  [Unitless]
        settings.include_slipstream_effect      [Unitless]
+       settings.use_influence_cache            [Unitless]
+       settings.influence_cache_size           [Unitless]
+       settings.influence_memory_budget        [bytes]
        conditions.aerodynamics.angle_of_attack [radians]
        conditions.freestream.mach_number       [Unitless]
        
@@ -114,13 +120,21 @@ def VLM(conditions,settings,geometry):
     ones = np.atleast_2d(np.ones_like(aoa)) 
    
     # generate vortex distribution
-    VD = compute_vortex_distribution(geometry,settings)  
+    if settings.get('use_influence_cache',False):
+        VD = cached_vortex_distribution(geometry,settings)  
+    else:
+        VD = compute_vortex_distribution(geometry,settings)  
+    n_cp = VD.n_cp  
     
-    # Build induced velocity matrix, C_mn
-    C_mn, DW_mn  = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa,mach)
-    MCM = VD.MCM 
+    # problems larger than the memory budget are solved in blocks, without the influence cache
+    budget    = settings.get('influence_memory_budget',None)
+    chunked   = budget is not None and influence_memory(len(mach),n_cp,n_cp) > budget
+    use_cache = settings.get('use_influence_cache',False) and not chunked
+    if use_cache:
+        conditions_keys = np.hstack((mach,aoa))
     
     # Compute flow tangency conditions   
+    mach[mach==1] = 1.001
     inv_root_beta = np.zeros_like(mach)
     inv_root_beta[mach<1] = 1/np.sqrt(1-mach[mach<1]**2)     
     inv_root_beta[mach>1] = 1/np.sqrt(mach[mach>1]**2-1) 
@@ -130,29 +144,34 @@ def VLM(conditions,settings,geometry):
     
     phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones          # dihedral angle 
     delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*inv_root_beta)) # mean camber surface angle 
-   
-    # Build Aerodynamic Influence Coefficient Matrix
-    A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42 
     
-    B =   np.multiply(DW_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(DW_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(DW_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42     
-   
-   
     # Build the vector
     RHS = compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,sur_flag,slipstream)
-
-    # Compute vortex strength  
-    n_cp  = VD.n_cp  
-    gamma = np.linalg.solve(A,RHS)
-    gamma_3d = np.repeat(np.atleast_3d(gamma), n_cp ,axis = 2 )
-    u = np.sum(C_mn[:,:,:,0]*MCM[:,:,:,0]*gamma_3d, axis = 2) 
-    v = np.sum(C_mn[:,:,:,1]*MCM[:,:,:,1]*gamma_3d, axis = 2) 
-    w = np.sum(C_mn[:,:,:,2]*MCM[:,:,:,2]*gamma_3d, axis = 2) 
-    w_ind = -np.sum(B*MCM[:,:,:,2]*gamma_3d, axis = 2) 
-     
+    
+    if chunked:
+        gamma, u, v, w, w_ind = compute_vortex_strengths_in_blocks(VD,n_sw,n_cw,aoa,mach,delta,phi,RHS,budget)
+    else:
+        # Build induced velocity matrix, C_mn
+        if use_cache:
+            C_mn, DW_mn = cached_induced_velocity_matrix(VD,n_sw,n_cw,aoa,mach,settings)
+        else:
+            C_mn, DW_mn = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa,mach)
+        MCM = VD.MCM 
+        
+        # Build Aerodynamic Influence Coefficient Matrix
+        A = compute_influence_coefficient_matrix(C_mn,delta,phi)
+        B = compute_influence_coefficient_matrix(DW_mn,delta,phi)
+    
+        # Compute vortex strength  
+        if use_cache:
+            gamma = cached_vortex_strengths(A,RHS,conditions_keys,settings)
+        else:
+            gamma = np.linalg.solve(A,RHS)
+        u, v, w, w_ind = compute_induced_velocities(C_mn,B,MCM,gamma)
+        
+        # delete MCM from VD data structure since it consumes memory
+        delattr(VD, 'MCM')   
+    
     # ---------------------------------------------------------------------------------------
     # STEP 10: Compute aerodynamic coefficients 
     # ---------------------------------------------------------------------------------------  
@@ -207,7 +226,172 @@ def VLM(conditions,settings,geometry):
     # moment coefficient
     CM          = np.atleast_2d(np.sum(np.multiply((X_M - VD.XCH*ones),Del_Y*gamma),axis=1)/(Sref*c_bar)).T     
     
-    # delete MCM from VD data structure since it consumes memory
+    return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP 
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_influence_coefficient_matrix(C_mn,delta,phi):
+    """Projects an induced velocity matrix onto the panel normals 
+
+    Assumptions:
+    None
+
+    Source:
+    Aerodynamics for Engineers, Sixth Edition by John Bertin & Russel Cummings, eqn 7.42
+
+    Inputs:
+    C_mn     - induced velocity matrix          [Unitless]
+    delta    - mean camber surface angle        [radians]
+    phi      - dihedral angle                   [radians]
+
+    Outputs:
+    A        - influence coefficient matrix     [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
+        + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
+        - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42 
+    
+    return A
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_induced_velocities(C_mn,B,MCM,gamma):
+    """Sums the velocities induced by the vortex strengths 
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    C_mn     - total induced velocity matrix    [Unitless]
+    B        - downwash influence matrix        [Unitless]
+    MCM      - mach cone matrix                 [Unitless]
+    gamma    - vortex strengths                 [Unitless]
+
+    Outputs:
+    u, v, w  - induced velocities               [Unitless]
+    w_ind    - induced downwash                 [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    gamma_3d = np.repeat(np.atleast_3d(gamma), np.shape(C_mn)[2] ,axis = 2 )
+    u = np.sum(C_mn[:,:,:,0]*MCM[:,:,:,0]*gamma_3d, axis = 2) 
+    v = np.sum(C_mn[:,:,:,1]*MCM[:,:,:,1]*gamma_3d, axis = 2) 
+    w = np.sum(C_mn[:,:,:,2]*MCM[:,:,:,2]*gamma_3d, axis = 2) 
+    w_ind = -np.sum(B*MCM[:,:,:,2]*gamma_3d, axis = 2) 
+    
+    return u, v, w, w_ind
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_vortex_strengths_in_blocks(VD,n_sw,n_cw,aoa,mach,delta,phi,RHS,budget):
+    """Solves for the vortex strengths and induced velocities without building the full 
+    induced velocity matrices. The flight conditions are split into blocks that fit in the 
+    memory budget. If a single condition does not fit, its influence coefficient matrix is 
+    assembled a block of rows at a time and the rows are computed again for the induced 
+    velocities. The results are identical to the unblocked solution.
+
+    Assumptions:
+    At least one row of one condition fits in the memory budget, otherwise one row is used
+
+    Source:
+    None
+
+    Inputs:
+    VD       - vehicle vortex distribution      [Unitless]
+    n_sw     - number_panels_spanwise           [Unitless]
+    n_cw     - number_panels_chordwise          [Unitless]
+    aoa      - angle of attack                  [radians]
+    mach                                        [Unitless]
+    delta    - mean camber surface angle        [radians]
+    phi      - dihedral angle                   [radians]
+    RHS      - right hand side                  [Unitless]
+    budget   - memory budget                    [bytes]
+
+    Outputs:
+    gamma    - vortex strengths                 [Unitless]
+    u, v, w  - induced velocities               [Unitless]
+    w_ind    - induced downwash                 [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    n_cp   = VD.n_cp
+    n_cond = len(mach)
+    
+    # size the blocks
+    n_cond_block = int(max(1,min(n_cond,budget//influence_memory(1,n_cp,n_cp))))
+    n_row_block  = int(max(1,min(n_cp,budget//influence_memory(1,1,n_cp))))
+    if n_cond_block > 1:
+        n_row_block = n_cp
+    row_blocks = [slice(i,min(i+n_row_block,n_cp)) for i in range(0,n_cp,n_row_block)]
+    
+    gamma = np.zeros_like(RHS)
+    u     = np.zeros_like(RHS)
+    v     = np.zeros_like(RHS)
+    w     = np.zeros_like(RHS)
+    w_ind = np.zeros_like(RHS)
+    
+    for start in range(0,n_cond,n_cond_block):
+        conds = slice(start,min(start+n_cond_block,n_cond))
+        
+        if len(row_blocks) == 1:
+            # the whole condition block fits
+            C_mn, DW_mn = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa[conds],mach[conds])
+            A           = compute_influence_coefficient_matrix(C_mn,delta[conds],phi[conds])
+            B           = compute_influence_coefficient_matrix(DW_mn,delta[conds],phi[conds])
+            gamma[conds] = np.linalg.solve(A,RHS[conds])
+            u[conds], v[conds], w[conds], w_ind[conds] = compute_induced_velocities(C_mn,B,VD.MCM,gamma[conds])
+            continue
+        
+        # assemble the influence coefficient matrix a block of rows at a time
+        A = np.zeros((conds.stop-conds.start,n_cp,n_cp))
+        for rows in row_blocks:
+            C_mn, _ = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa[conds],mach[conds],rows)
+            A[:,rows,:] = compute_influence_coefficient_matrix(C_mn,delta[conds,rows],phi[conds,rows])
+        gamma[conds] = np.linalg.solve(A,RHS[conds])
+        
+        # compute the rows again for the induced velocities
+        for rows in row_blocks:
+            C_mn, DW_mn = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa[conds],mach[conds],rows)
+            B           = compute_influence_coefficient_matrix(DW_mn,delta[conds,rows],phi[conds,rows])
+            u[conds,rows], v[conds,rows], w[conds,rows], w_ind[conds,rows] = \
+                compute_induced_velocities(C_mn,B,VD.MCM,gamma[conds,rows])
+    
     delattr(VD, 'MCM')   
     
-    return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP 
\ No newline at end of file
+    return gamma, u, v, w, w_ind
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def influence_memory(n_cond,n_rows,n_cp):
+    """Estimates the peak memory of building and using the induced velocity matrices 
+
+    Assumptions:
+    About 64 double precision arrays the size of one component of the matrices are 
+    alive at the peak of compute_induced_velocity_matrix and the solve
+
+    Source:
+    None
+
+    Inputs:
+    n_cond   - number of flight conditions      [Unitless]
+    n_rows   - number of matrix rows            [Unitless]
+    n_cp     - number of control points         [Unitless]
+
+    Outputs:
+    memory                                      [bytes]
+
+    Properties Used:
+    N/A
+    """
+    
+    return 512*n_cond*n_rows*n_cp
@@ -7,3 +7,4 @@ from .fuselage_correction              import fuselage_correction
 from .VLM                              import VLM
 from .compute_vortex_distribution      import compute_vortex_distribution
 from .compute_induced_velocity_matrix  import compute_induced_velocity_matrix
+from .influence_cache                  import cached_vortex_distribution, cached_induced_velocity_matrix, cached_vortex_strengths
@@ -4,6 +4,7 @@
 # Created:  May 2018, M. Clarke
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,12 +14,13 @@
 import numpy as np 
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
+def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach,rows=slice(None)):
     """ This computes the induced velocitys are each control point 
     of the vehicle vortex lattice 
 
     Assumptions: 
     Trailing vortex legs infinity are alligned to freestream
+    Only the rows of the matrices given by rows are computed, this bounds the memory
 
     Source:  
     None
@@ -29,16 +31,55 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     n_cw     - number_panels_chordwise          [Unitless] 
     mach                                        [Unitless] 
     theta_w  - freestream wake angle            [radians]
+    rows     - rows of the matrices to compute  [slice]
     
     Outputs:                                
     C_mn     - total induced velocity matrix    [Unitless] 
     DW_mn    - induced downwash velocity matrix [Unitless] 
 
+    Properties Used:
+    N/A
+    """
+    # influence of everything except the direction of the trailing legs to infinity
+    C_0, DW_0, W, MCM = compute_wake_independent_influence(VD,n_sw,n_cw,mach,rows)
+    VD.MCM = MCM 
+    
+    # point the trailing legs along the wake
+    C_mn, DW_mn = apply_wake_angle(C_0,DW_0,W,theta_w)
+    
+    return C_mn, DW_mn 
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_wake_independent_influence(VD,n_sw,n_cw,mach,rows=slice(None)):
+    """ This computes the parts of the induced velocity matrix that do not depend on the 
+    wake angle. The legs of the horseshoe vortices that trail to infinity along the wake 
+    angle theta_w induce velocities of the form [-sin(theta_w)*W, Q, cos(theta_w)*W], so the 
+    full matrix can be rebuilt for any wake angle by apply_wake_angle.
+
+    Assumptions: 
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:  
+    None
+
+    Inputs: 
+    VD       - vehicle vortex distribution      [Unitless] 
+    n_sw     - number_panels_spanwise           [Unitless]
+    n_cw     - number_panels_chordwise          [Unitless] 
+    mach                                        [Unitless] 
+    rows     - rows of the matrices to compute  [slice]
+    
+    Outputs:                                
+    C_0      - induced velocity matrix without the wake angle terms [Unitless] 
+    DW_0     - downwash matrix without the wake angle terms         [Unitless] 
+    W        - wake angle influence of the legs to infinity         [Unitless] 
+    MCM      - mach cone matrix                                     [Unitless] 
+
     Properties Used:
     N/A
     """
     # unpack  
-    ones     = np.atleast_3d(np.ones_like(theta_w))
+    ones     = np.atleast_3d(np.ones_like(mach))
  
     # Prandtl Glauret Transformation for subsonic
     inv_root_beta = np.zeros_like(mach)
@@ -82,8 +123,6 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     YC    = np.atleast_3d(VD.YC*ones) 
     ZC    = np.atleast_3d(VD.ZC*ones)  
     n_w   = VD.n_w
-
-    theta_w = np.atleast_3d(theta_w)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
     
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
@@ -109,31 +148,35 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     YC = np.swapaxes(YC,1,2) 
     ZC = np.swapaxes(ZC,1,2)  
     
+    # only the control points of the rows asked for
+    XC_r = XC[:,rows]
+    YC_r = YC[:,rows]
+    ZC_r = ZC[:,rows]
+    
     # compute influence of bound vortices 
-    C_AB_bv = np.transpose(vortex(XC, YC, ZC, XAH, YAH, ZAH, XBH, YBH, ZBH),axes=[1,2,3,0])
+    C_AB_bv = np.transpose(vortex(XC_r, YC_r, ZC_r, XAH, YAH, ZAH, XBH, YBH, ZBH),axes=[1,2,3,0])
     
     # compute influence of 3/4 left legs 
-    C_AB_34_ll = np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH),axes=[1,2,3,0]) # original
+    C_AB_34_ll = np.transpose(vortex(XC_r, YC_r, ZC_r, XA2, YA2, ZA2, XAH, YAH, ZAH),axes=[1,2,3,0]) # original
 
     # compute influence of whole panel left legs  
-    C_AB_ll   =  np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1),axes=[1,2,3,0]) # original
+    C_AB_ll   =  np.transpose(vortex(XC_r, YC_r, ZC_r, XA2, YA2, ZA2, XA1, YA1, ZA1),axes=[1,2,3,0]) # original
 
     # compute influence of 3/4 right legs  
-    C_AB_34_rl = np.transpose(vortex(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
+    C_AB_34_rl = np.transpose(vortex(XC_r, YC_r, ZC_r, XBH, YBH, ZBH, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
 
     # compute influence of whole right legs   
-    C_AB_rl = np.transpose(vortex(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
+    C_AB_rl = np.transpose(vortex(XC_r, YC_r, ZC_r, XB1, YB1, ZB1, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
 
-    # velocity induced by left leg of vortex (A to inf)
-    C_Ainf  = np.transpose(vortex_leg_from_A_to_inf(XC, YC, ZC, XA_TE, YA_TE, ZA_TE,theta_w),axes=[1,2,3,0])
+    # velocity induced by left leg of vortex (A to inf), without the wake angle
+    W_Ainf, C_Ainf = vortex_leg_from_A_to_inf(XC_r, YC_r, ZC_r, XA_TE, YA_TE, ZA_TE)
 
-    # velocity induced by right leg of vortex (B to inf)
-    C_Binf  = np.transpose(vortex_leg_from_B_to_inf(XC, YC, ZC, XB_TE, YB_TE, ZB_TE,theta_w),axes=[1,2,3,0])
+    # velocity induced by right leg of vortex (B to inf), without the wake angle
+    W_Binf, C_Binf = vortex_leg_from_B_to_inf(XC_r, YC_r, ZC_r, XB_TE, YB_TE, ZB_TE)
 
     # compute Mach Cone Matrix
     MCM      = np.ones_like(C_AB_bv)
-    MCM      = compute_mach_cone_matrix(XC,YC,ZC,MCM,mach)
-    VD.MCM = MCM 
+    MCM      = compute_mach_cone_matrix(XC,YC,ZC,MCM,mach,rows)
     n_cp     = n_w*n_cw*n_sw 
     
     # multiply by mach cone 
@@ -144,28 +187,61 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     C_AB_rl     = C_AB_rl    * MCM
     C_Ainf      = C_Ainf     * MCM
     C_Binf      = C_Binf     * MCM  
+    W           = (W_Ainf + W_Binf) * MCM[:,:,:,0]
     
     # the follow block of text adds up all the trailing legs of the vortices which are on the wing for the downwind panels   
     C_AB_ll_on_wing = np.zeros_like(C_AB_ll)
     C_AB_rl_on_wing = np.zeros_like(C_AB_ll)
-    
-    # original 
-    for n in range(n_cp):
-        n_te_p = (n_cw-(n+1)%n_cw)
-        if (n+1)%n_cw != 0:
-            start = n+1
-            end   = n+n_te_p
-            C_AB_ll_on_wing[:,:,n,:] = np.sum(C_AB_ll[:,:,start:end,:],axis=2) 
-            C_AB_rl_on_wing[:,:,n,:] = np.sum(C_AB_rl[:,:,start:end,:],axis=2)                
+    C_AB_ll_on_wing[:,:,:n_cp] = sum_downstream_legs(C_AB_ll[:,:,:n_cp],n_cw)
+    C_AB_rl_on_wing[:,:,:n_cp] = sum_downstream_legs(C_AB_rl[:,:,:n_cp],n_cw)
 
     # Add all the influences together
     C_AB_ll_tot = C_AB_ll_on_wing + C_AB_34_ll + C_Ainf  # verified from book using example 7.4 pg 399-404
     C_AB_rl_tot = C_AB_rl_on_wing + C_AB_34_rl + C_Binf  # verified from book using example 7.4 pg 399-404
-    C_mn        = C_AB_bv +  C_AB_ll_tot  + C_AB_rl_tot  # verified from book using example 7.4 pg 399-404
+    C_0         = C_AB_bv +  C_AB_ll_tot  + C_AB_rl_tot  # verified from book using example 7.4 pg 399-404
     
-    DW_mn = 2*(C_AB_ll_tot + C_AB_rl_tot) # summation of trailing vortices for semi infinite
+    DW_0 = 2*(C_AB_ll_tot + C_AB_rl_tot) # summation of trailing vortices for semi infinite
     
-    return C_mn, DW_mn 
+    return C_0, DW_0, W, MCM
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def apply_wake_angle(C_0,DW_0,W,theta_w):
+    """ This adds the wake angle terms of the legs trailing to infinity to the 
+    wake independent induced velocity matrices
+
+    Assumptions: 
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:  
+    None
+
+    Inputs: 
+    C_0      - induced velocity matrix without the wake angle terms [Unitless] 
+    DW_0     - downwash matrix without the wake angle terms         [Unitless] 
+    W        - wake angle influence of the legs to infinity         [Unitless] 
+    theta_w  - freestream wake angle                                [radians]
+    
+    Outputs:                                
+    C_mn     - total induced velocity matrix    [Unitless] 
+    DW_mn    - induced downwash velocity matrix [Unitless] 
+
+    Properties Used:
+    N/A
+    """
+    
+    theta_w = np.atleast_3d(theta_w)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
+    sin_W   = np.sin(theta_w)*W
+    cos_W   = np.cos(theta_w)*W
+    
+    C_mn          = C_0.copy()
+    C_mn[:,:,:,0] = C_mn[:,:,:,0] - sin_W
+    C_mn[:,:,:,2] = C_mn[:,:,:,2] + cos_W
+    
+    DW_mn          = DW_0.copy()
+    DW_mn[:,:,:,0] = DW_mn[:,:,:,0] - 2*sin_W
+    DW_mn[:,:,:,2] = DW_mn[:,:,:,2] + 2*cos_W
+    
+    return C_mn, DW_mn
 
 # -------------------------------------------------------------------------------
 # vortex strength computation
@@ -199,7 +275,8 @@ def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2):
 
     return COEF
 
-def vortex_leg_from_A_to_inf(X,Y,Z,X1,Y1,Z1,tw): 
+def vortex_leg_from_A_to_inf(X,Y,Z,X1,Y1,Z1): 
+    # The leg induces [-sin(tw)*W, V, cos(tw)*W], the wake angle tw is applied later
 
     # Take all the differences
     X_X1  = X-X1    
@@ -209,16 +286,15 @@ def vortex_leg_from_A_to_inf(X,Y,Z,X1,Y1,Z1,tw):
 
     DENUM =  np.square(Z_Z1) + np.square(Y1_Y)
     DENUM[DENUM==0] = 1e-32
-    XVEC  = -Y1_Y*np.sin(tw)/DENUM
-    YVEC  = (Z_Z1)/DENUM
-    ZVEC  = Y1_Y*np.cos(tw)/DENUM
-    RVEC  = np.array([XVEC, YVEC, ZVEC])
     BRAC  = 1 + (X_X1 / (np.sqrt(np.square(X_X1) + np.square(Y_Y1) + np.square(Z_Z1))))    
-    COEF  = (1/(4*np.pi))*RVEC*BRAC   
+    W     = (1/(4*np.pi))*(Y1_Y/DENUM)*BRAC
+    COEF  = np.zeros(np.shape(W)+(3,))
+    COEF[:,:,:,1] = (1/(4*np.pi))*(Z_Z1/DENUM)*BRAC
 
-    return COEF
+    return W, COEF
 
-def vortex_leg_from_B_to_inf(X,Y,Z,X1,Y1,Z1,tw):
+def vortex_leg_from_B_to_inf(X,Y,Z,X1,Y1,Z1):
+    # The leg induces [-sin(tw)*W, V, cos(tw)*W], the wake angle tw is applied later
 
     # Take all the differences
     X_X1  = X-X1    
@@ -228,36 +304,38 @@ def vortex_leg_from_B_to_inf(X,Y,Z,X1,Y1,Z1,tw):
 
     DENUM =  np.square(Z_Z1) + np.square(Y1_Y)
     DENUM[DENUM==0] = 1e-32
-    XVEC  = -Y1_Y*np.sin(tw)/DENUM
-    YVEC  = Z_Z1/DENUM
-    ZVEC  = Y1_Y*np.cos(tw)/DENUM
-    RVEC  = np.array([XVEC, YVEC, ZVEC])
     BRAC  = 1 + (X_X1 / (np.sqrt(np.square(X_X1)+ np.square(Y_Y1)+ np.square(Z_Z1))))    
-    COEF  = -(1/(4*np.pi))*RVEC*BRAC      
+    W     = -(1/(4*np.pi))*(Y1_Y/DENUM)*BRAC
+    COEF  = np.zeros(np.shape(W)+(3,))
+    COEF[:,:,:,1] = -(1/(4*np.pi))*(Z_Z1/DENUM)*BRAC
 
-    return COEF
+    return W, COEF
 
-def compute_mach_cone_matrix(XC,YC,ZC,MCM,mach):
- 
-    for m_idx in range(len(mach)):
-        
-        # Prep new vectors
-        XC_sub = XC[m_idx,:]
-        YC_sub = YC[m_idx,:]
-        ZC_sub = ZC[m_idx,:]
-        length = len(XC[m_idx,:])
-        ones   = np.ones((1,length))
-        
-        # Take differences
-        del_x = XC_sub*ones - XC_sub.T
-        del_y = YC_sub*ones - YC_sub.T
-        del_z = ZC_sub*ones - ZC_sub.T
-        
-        # Flag certain indices
-        c     = np.arcsin(1/mach[m_idx])
-        flag  = -c*del_x**2 + del_y**2 + del_z**2
-        idxs  = np.where(flag > 0.0)
-        MCM[m_idx,idxs[0],idxs[1]]  = [0.0, 0.0, 0.0]      
+def sum_downstream_legs(C_AB,n_cw):
+    # For each panel, sums the legs of the panels behind it on the same chordwise strip, 
+    # leaving out the last panel of the strip. The sums run over the strips in one operation 
+    # and add the legs front to back in the same order as a sum over each panel. 
+    
+    shape    = np.shape(C_AB)
+    n_strips = shape[2]//n_cw
+    C_strips = np.reshape(C_AB,shape[:2]+(n_strips,n_cw)+shape[3:])
+    on_wing  = np.zeros_like(C_strips)
+    
+    for k in range(n_cw-2):
+        on_wing[:,:,:,k] = np.sum(C_strips[:,:,:,k+1:n_cw-1],axis=3)
+    
+    return np.reshape(on_wing,shape)
+
+def compute_mach_cone_matrix(XC,YC,ZC,MCM,mach,rows=slice(None)):
+    
+    # Take differences, all Mach numbers at once
+    del_x = XC[:,rows] - np.swapaxes(XC,1,2)
+    del_y = YC[:,rows] - np.swapaxes(YC,1,2)
+    del_z = ZC[:,rows] - np.swapaxes(ZC,1,2)
     
+    # Flag certain indices
+    c     = np.atleast_3d(np.arcsin(1/mach))
+    flag  = -c*del_x**2 + del_y**2 + del_z**2
+    MCM[flag > 0.0] = 0.0
     
     return MCM
\ No newline at end of file
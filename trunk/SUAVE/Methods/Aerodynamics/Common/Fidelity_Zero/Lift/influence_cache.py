@@ -0,0 +1,266 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+# influence_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+from collections import OrderedDict
+from scipy.linalg import lu_factor, lu_solve
+
+from SUAVE.Methods.Utilities.hash_data import hash_data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution     import compute_vortex_distribution
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_wake_independent_influence, apply_wake_angle
+
+# ----------------------------------------------------------------------
+#  Cached Vortex Distribution
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_vortex_distribution(geometry,settings):
+    """ Returns the vortex distribution of the vehicle, only recomputing it when the wings,
+    fuselages or panel counts have changed. A change also clears the cached influence matrices.
+
+    Assumptions:
+    The vortex distribution only depends on the wings, the fuselages and the number of panels
+
+    Source:
+    None
+
+    Inputs:
+    geometry.wings
+    geometry.fuselages
+    settings.number_panels_spanwise             [Unitless]
+    settings.number_panels_chordwise            [Unitless]
+
+    Outputs:
+    VD       - vehicle vortex distribution      [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    cache = get_influence_cache(settings)
+    key   = hash_data(geometry.wings,geometry.fuselages,settings.number_panels_spanwise,settings.number_panels_chordwise)
+
+    if key != cache.geometry_key:
+        VD = compute_vortex_distribution(geometry,settings)
+        cache.geometry_key        = key
+        cache.vortex_distribution = VD
+        cache.influence.clear()
+        cache.factorizations.clear()
+
+    VD = cache.vortex_distribution
+    geometry.vortex_distribution = VD
+    settings.vortex_distribution = VD
+
+    return VD
+
+# ----------------------------------------------------------------------
+#  Cached Induced Velocity Matrix
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach,settings):
+    """ Computes the same induced velocity matrices as compute_induced_velocity_matrix, but
+    keeps the wake independent parts for each Mach number. Only Mach numbers that have not
+    been seen before are computed, the wake angle is applied for every call.
+
+    Assumptions:
+    Same as compute_induced_velocity_matrix
+    VD is the vortex distribution returned by cached_vortex_distribution
+
+    Source:
+    None
+
+    Inputs:
+    VD       - vehicle vortex distribution      [Unitless]
+    n_sw     - number_panels_spanwise           [Unitless]
+    n_cw     - number_panels_chordwise          [Unitless]
+    theta_w  - freestream wake angle            [radians]
+    mach                                        [Unitless]
+    settings.influence_cache_size               [Unitless]
+
+    Outputs:
+    C_mn     - total induced velocity matrix    [Unitless]
+    DW_mn    - induced downwash velocity matrix [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    cache     = get_influence_cache(settings)
+    influence = cache.influence
+    keys      = [float(m) for m in mach[:,0]]
+
+    # compute the Mach numbers that are missing
+    missing = []
+    for key in keys:
+        if not key in influence and not key in missing:
+            missing.append(key)
+    if missing:
+        C_0, DW_0, W, MCM = compute_wake_independent_influence(VD,n_sw,n_cw,np.atleast_2d(missing).T)
+        for i, key in enumerate(missing):
+            influence[key] = (C_0[i], DW_0[i], W[i], MCM[i,:,:,0])
+
+    # gather the parts for each condition
+    for key in keys:
+        influence.move_to_end(key)
+    C_0  = np.array([influence[key][0] for key in keys])
+    DW_0 = np.array([influence[key][1] for key in keys])
+    W    = np.array([influence[key][2] for key in keys])
+    MCM  = np.array([influence[key][3] for key in keys])
+
+    # drop the least recently used Mach numbers
+    trim_cache(influence,settings.influence_cache_size)
+
+    # the same adjustment to the Mach number as compute_induced_velocity_matrix
+    mach[mach==1] = 1.001
+
+    VD.MCM = np.broadcast_to(MCM[:,:,:,None],MCM.shape+(3,))
+
+    C_mn, DW_mn = apply_wake_angle(C_0,DW_0,W,theta_w)
+
+    return C_mn, DW_mn
+
+# ----------------------------------------------------------------------
+#  Cached Vortex Strengths
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def cached_vortex_strengths(A,RHS,conditions_keys,settings):
+    """ Solves for the vortex strengths, keeping the LU factorization of the aerodynamic
+    influence coefficient matrix of each flight condition. A repeated condition then only
+    needs the back substitution.
+
+    Assumptions:
+    The influence matrix only depends on the Mach number and angle of attack
+
+    Source:
+    None
+
+    Inputs:
+    A               - aerodynamic influence coefficient matrix [Unitless]
+    RHS             - right hand side                          [Unitless]
+    conditions_keys - Mach number and angle of attack per row  [Unitless, radians]
+    settings.influence_cache_size                              [Unitless]
+
+    Outputs:
+    gamma           - vortex strengths                         [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    cache          = get_influence_cache(settings)
+    factorizations = cache.factorizations
+    gamma          = np.zeros(np.shape(RHS))
+
+    for i in range(len(RHS)):
+        key = tuple(conditions_keys[i])
+        if key in factorizations:
+            factorizations.move_to_end(key)
+        else:
+            factorizations[key] = lu_factor(A[i])
+        gamma[i] = lu_solve(factorizations[key],RHS[i])
+
+    trim_cache(factorizations,settings.influence_cache_size)
+
+    return gamma
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def get_influence_cache(settings):
+    """ Retrieves the influence cache stored on the analysis settings, creating it if needed
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    settings                                    [Data]
+
+    Outputs:
+    cache                                       [Influence_Cache]
+
+    Properties Used:
+    N/A
+    """
+
+    try:
+        cache = settings._influence_cache
+    except AttributeError:
+        cache = Influence_Cache()
+        settings._influence_cache = cache
+
+    return cache
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+class Influence_Cache(object):
+    """ Holds the cached vortex distribution, influence matrices and factorizations. This is a
+    plain object rather than a Data, so archiving results that include the analyses skips it.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+    """
+
+    def __init__(self):
+        """ Creates an empty cache
+
+        Assumptions:
+        None
+
+        Source:
+        None
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        self.geometry_key        = None
+        self.vortex_distribution = None
+        self.influence           = OrderedDict()
+        self.factorizations      = OrderedDict()
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def trim_cache(entries,size):
+    """ Drops the least recently used entries of a cache
+
+    Assumptions:
+    Entries are moved to the end when used
+
+    Source:
+    None
+
+    Inputs:
+    entries                                     [OrderedDict]
+    size                                        [int]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    while len(entries) > size:
+        entries.popitem(last=False)
+
+    return
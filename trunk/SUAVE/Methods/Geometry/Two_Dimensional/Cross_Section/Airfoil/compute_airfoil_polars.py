@@ -3,13 +3,23 @@
 # 
 # Created:  Mar 2019, M. Clarke
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core               import Data , Units
 from .import_airfoil_geometry import import_airfoil_geometry 
 from .import_airfoil_polars   import import_airfoil_polars
+import os
 import numpy as np
+from copy import deepcopy
+from collections import OrderedDict
+
+# airfoil files and polar tables already computed in this process, the cache is off until 
+# airfoil_cache_size is set to the number of files and tables to keep
+airfoil_file_cache  = OrderedDict()
+airfoil_table_cache = OrderedDict()
+airfoil_cache_size  = 0
 
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
 def compute_airfoil_polars(propeller,a_geo,a_polar):
@@ -20,6 +30,8 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
     
     Assumptions:
     Uses AERODAS forumatuon for post stall characteristics 
+    If airfoil_cache_size is above zero, the files are only read again if they have been 
+    modified, and the tables are only computed again for a new blade aspect ratio
 
     Source:
     Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in Wind Turbines and Wind Tunnels
@@ -43,30 +55,89 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
     N/A
     """  
     
-    num_airfoils = len(a_polar)
     # unpack 
     Rh = propeller.hub_radius
     Rt = propeller.tip_radius
     n = len(propeller.chord_distribution)
     cm = propeller.chord_distribution[round(n*0.5)] 
 
-    # read airfoil geometry  
-    airfoil_data = import_airfoil_geometry(a_geo)
-
     AR = 2*(Rt - Rh)/cm
+    
+    if airfoil_cache_size <= 0:
+        airfoil_geometry   = import_airfoil_geometry(a_geo)
+        airfoil_polar_data = import_airfoil_polars(a_polar)
+        return compute_aerodas_tables(airfoil_geometry,airfoil_polar_data,AR)
+    
+    # files are identified by their path and modification time
+    files_key = (airfoil_files_key(a_geo),airfoil_files_key(a_polar))
+    table_key = files_key + (float(AR),)
+    
+    if table_key in airfoil_table_cache:
+        airfoil_table_cache.move_to_end(table_key)
+        return deepcopy(airfoil_table_cache[table_key])
+    
+    # read airfoil geometry and polars 
+    if files_key in airfoil_file_cache:
+        airfoil_file_cache.move_to_end(files_key)
+    else:
+        airfoil_file_cache[files_key] = (import_airfoil_geometry(a_geo),import_airfoil_polars(a_polar))
+    airfoil_geometry, airfoil_polar_data = airfoil_file_cache[files_key]
+    
+    airfoil_data = compute_aerodas_tables(deepcopy(airfoil_geometry),airfoil_polar_data,AR)
+    
+    airfoil_table_cache[table_key] = airfoil_data
+    while len(airfoil_file_cache) > airfoil_cache_size:
+        airfoil_file_cache.popitem(last=False)
+    while len(airfoil_table_cache) > airfoil_cache_size:
+        airfoil_table_cache.popitem(last=False)
+
+    return deepcopy(airfoil_data)
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def compute_aerodas_tables(airfoil_data,airfoil_polar_data,AR):
+    """Builds the AERODAS lift and drag tables of each airfoil over a sweep of angles of attack
+    from -20 to 90 degrees. The whole sweep is computed at once.
+    
+    Assumptions:
+    Uses AERODAS forumatuon for post stall characteristics 
+
+    Source:
+    Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in Wind Turbines and Wind Tunnels
+    by D Spera, 2008
+
+    Inputs:
+    airfoil_data.
+        thickness_to_chord [unitless]
+    airfoil_polar_data.
+        lift_coefficients  [unitless]
+        drag_coefficients  [unitless]
+        angle_of_attacks   [degrees]
+    AR                     [unitless]
+
+    Outputs:
+    airfoil_data.
+        lift_coefficients  [unitless]
+        drag_coefficients  [unitless]      
+        angle_of_attacks   [radians]
+    
+    Properties Used:
+    N/A
+    """  
+    
+    num_airfoils = len(airfoil_polar_data.lift_coefficients)
 
     # Get all of the coefficients for AERODAS wings
     AoA_sweep = np.linspace(-20,90,111)
     CL = np.zeros((num_airfoils,len(AoA_sweep)))
     CD = np.zeros((num_airfoils,len(AoA_sweep)))
+    alpha = AoA_sweep
 
     # AERODAS
     for i in range(num_airfoils):           
-        # read airfoil polars 
-        airfoil_polar_data =  import_airfoil_polars(a_polar)
         airfoil_cl  = airfoil_polar_data.lift_coefficients[i] 
         airfoil_cd  = airfoil_polar_data.drag_coefficients[i] 
         airfoil_aoa = airfoil_polar_data.angle_of_attacks[i]   
+        t_c         = airfoil_data.thickness_to_chord[i]
 
         # computing approximate zero lift aoa
         airfoil_cl_plus = airfoil_cl[airfoil_cl>0]
@@ -76,123 +147,124 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
         # computing approximate lift curve slope
         cl_range = airfoil_aoa[idx_zero_lift:idx_zero_lift+50]
         aoa_range = airfoil_cl[idx_zero_lift:idx_zero_lift+50]
-        S1 = np.mean(np.diff(cl_range)/np.diff(aoa_range))  
+        S1p = np.mean(np.diff(cl_range)/np.diff(aoa_range))  
 
         # max lift coefficent and associated aoa
-        CL1max  = np.max(airfoil_cl) 
-        idx_aoa_max_prestall_cl = np.where(airfoil_cl == CL1max)[0][0]
-        ACL1  = airfoil_aoa[idx_aoa_max_prestall_cl]
+        CL1maxp = np.max(airfoil_cl) 
+        idx_aoa_max_prestall_cl = np.where(airfoil_cl == CL1maxp)[0][0]
+        ACL1p   = airfoil_aoa[idx_aoa_max_prestall_cl]
 
         # max drag coefficent and associated aoa
-        CD1max  = np.max(airfoil_cd) 
-        idx_aoa_max_prestall_cd = np.where(airfoil_cd == CD1max)[0][0]
-        ACD1   = airfoil_aoa[idx_aoa_max_prestall_cd]          
+        CD1maxp = np.max(airfoil_cd) 
+        idx_aoa_max_prestall_cd = np.where(airfoil_cd == CD1maxp)[0][0]
+        ACD1p   = airfoil_aoa[idx_aoa_max_prestall_cd]          
 
         CD0     = airfoil_cd[idx_zero_lift]       
-        CL1maxp = CL1max
-        ACL1p   = ACL1
-        ACD1p   = ACD1
-        CD1maxp = CD1max
-        S1p     = S1
-
-        for j in range(len(AoA_sweep)):
-            alpha  = AoA_sweep[j] 
-            t_c = airfoil_data.thickness_to_chord[i]
-
-            # Equation 5a
-            ACL1   = ACL1p + 18.2*CL1maxp*(AR**(-0.9)) 
-
-            # From McCormick
-            S1 = S1p*AR/(2+np.sqrt(4+AR**2)) 
-
-            # Equation 5c
-            ACD1   =  ACD1p + 18.2*CL1maxp*(AR**(-0.9)) 
-
-            # Equation 5d
-            CD1max = CD1maxp + 0.280*(CL1maxp*CL1maxp)*(AR**(-0.9))
-
-            # Equation 5e
-            CL1max = CL1maxp*(0.67+0.33*np.exp(-(4.0/AR)**2.))
-
-            # ------------------------------------------------------
-            # Equations for coefficients in pre-stall regime 
-            # ------------------------------------------------------
-            # Equation 6c
-            RCL1   = S1*(ACL1-A0)-CL1max
-
-            # Equation 6d
-            N1     = 1 + CL1max/RCL1
-
-            # Equation 6a or 6b depending on the alpha                  
-            if alpha == A0:
-                CL[i,j] = 0.0        
-            elif alpha > A0: 
-                CL[i,j] = S1*(alpha - A0)-RCL1*((alpha-A0)/(ACL1-A0))**N1        
-            else:
-                CL[i,j] = S1*(alpha - A0)+RCL1 *((A0-alpha )/(ACL1 -A0))**N1 
-
-            # Equation 7a or 7b depending on alpha
-            M    = 2.0  
-            con  = np.logical_and((2*A0-ACD1)<=alpha,alpha<=ACD1)
-            if con == True:
-                CD[i,j] = CD0  + (CD1max -CD0)*((alpha  -A0)/(ACD1 -A0))**M   
-            else:
-                CD[i,j] = 0.  
-            # ------------------------------------------------------
-            # Equations for coefficients in post-stall regime 
-            # ------------------------------------------------------               
-            # Equation 9a and b
-            F1        = 1.190*(1.0-(t_c**2))
-            F2        = 0.65 + 0.35*np.exp(-(9.0/AR)**2.3)
-
-            # Equation 10b and c
-            G1        = 2.3*np.exp(-(0.65*t_c)**0.9)
-            G2        = 0.52 + 0.48*np.exp(-(6.5/AR)**1.1)
-
-            # Equation 8a and b
-            CL2max    = F1*F2
-            CD2max    = G1*G2
-
-            # Equation 11d
-            RCL2      = 1.632-CL2max
-
-            # Equation 11e
-            N2        = 1 + CL2max/RCL2
-
-            # LIFT COEFFICIENT
-            # Equation 11a,b,c
-            if alpha > ACL1:
-                con2      = np.logical_and(ACL1<=alpha,alpha<=(92.0))
-                con3      = [alpha>=(92.0)]                   
-                if con2 == True:
-                    CL[i,j] = -0.032*(alpha-92.0) - RCL2*((92.-alpha)/(51.0))**N2
-                elif con3 == True:
-                    CL[i,j] = -0.032*(alpha-92.0) + RCL2*((alpha-92.)/(51.0))**N2
-
-            # If alpha is negative flip things for lift
-            elif alpha < 0.:  
-                alphan    = - alpha+2*A0
-                con2      = np.logical_and(ACL1<=alpha, alpha<=(92.0))
-                con3      = alpha>=(92.0)                    
-                if con2 == True:
-                    CL[i,j] = 0.032*(alphan-92.0) + RCL2*((92.-alpha)/(51.0))**N2
-                elif con3 == True:
-                    CL[i,j] = 0.032*(alphan-92.0) - RCL2*((alphan-92.)/(51.0))**N2
-
-            # DRAG COEFFICIENT
-            # Equation 12a 
-            if  alpha > ACD1:
-                CD[i,j]  = CD1max + (CD2max - CD1max) * np.sin(((alpha-ACD1)/(90.-ACD1))*90.*Units.degrees)
-
-            # If alpha is negative flip things for drag
-            elif alpha < 0.:
-                alphan    = -alpha + 2*A0
-                if alphan>=ACD1:
-                    CD[i,j]  = CD1max + (CD2max - CD1max) * np.sin(((alphan-ACD1)/(90.-ACD1))*Units.degrees)     
 
+        # Equation 5a
+        ACL1   = ACL1p + 18.2*CL1maxp*(AR**(-0.9)) 
+
+        # From McCormick
+        S1 = S1p*AR/(2+np.sqrt(4+AR**2)) 
+
+        # Equation 5c
+        ACD1   =  ACD1p + 18.2*CL1maxp*(AR**(-0.9)) 
+
+        # Equation 5d
+        CD1max = CD1maxp + 0.280*(CL1maxp*CL1maxp)*(AR**(-0.9))
+
+        # Equation 5e
+        CL1max = CL1maxp*(0.67+0.33*np.exp(-(4.0/AR)**2.))
+
+        # ------------------------------------------------------
+        # Equations for coefficients in pre-stall regime 
+        # ------------------------------------------------------
+        # Equation 6c
+        RCL1   = S1*(ACL1-A0)-CL1max
+
+        # Equation 6d
+        N1     = 1 + CL1max/RCL1
+
+        # Equation 6a or 6b depending on the alpha                  
+        cl     = np.zeros_like(alpha)
+        above  = alpha > A0
+        below  = alpha < A0
+        cl[above] = S1*(alpha[above] - A0)-RCL1*((alpha[above]-A0)/(ACL1-A0))**N1        
+        cl[below] = S1*(alpha[below] - A0)+RCL1 *((A0-alpha[below] )/(ACL1 -A0))**N1 
+
+        # Equation 7a or 7b depending on alpha
+        M      = 2.0  
+        cd     = np.zeros_like(alpha)
+        con    = np.logical_and((2*A0-ACD1)<=alpha,alpha<=ACD1)
+        cd[con] = CD0  + (CD1max -CD0)*((alpha[con]  -A0)/(ACD1 -A0))**M   
+        
+        # ------------------------------------------------------
+        # Equations for coefficients in post-stall regime 
+        # ------------------------------------------------------               
+        # Equation 9a and b
+        F1        = 1.190*(1.0-(t_c**2))
+        F2        = 0.65 + 0.35*np.exp(-(9.0/AR)**2.3)
+
+        # Equation 10b and c
+        G1        = 2.3*np.exp(-(0.65*t_c)**0.9)
+        G2        = 0.52 + 0.48*np.exp(-(6.5/AR)**1.1)
+
+        # Equation 8a and b
+        CL2max    = F1*F2
+        CD2max    = G1*G2
+
+        # Equation 11d
+        RCL2      = 1.632-CL2max
+
+        # Equation 11e
+        N2        = 1 + CL2max/RCL2
+
+        # LIFT COEFFICIENT
+        # Equation 11a,b,c
+        alphan    = - alpha+2*A0
+        stalled   = np.logical_and(alpha > ACL1,alpha<=(92.0))
+        cl[stalled] = -0.032*(alpha[stalled]-92.0) - RCL2*((92.-alpha[stalled])/(51.0))**N2
+
+        # If alpha is negative flip things for lift
+        stalled   = np.logical_and(np.logical_and(alpha <= ACL1,alpha < 0.),np.logical_and(ACL1<=alpha,alpha<=(92.0)))
+        cl[stalled] = 0.032*(alphan[stalled]-92.0) + RCL2*((92.-alpha[stalled])/(51.0))**N2
+
+        # DRAG COEFFICIENT
+        # Equation 12a 
+        stalled   = alpha > ACD1
+        cd[stalled]  = CD1max + (CD2max - CD1max) * np.sin(((alpha[stalled]-ACD1)/(90.-ACD1))*90.*Units.degrees)
+
+        # If alpha is negative flip things for drag
+        stalled   = np.logical_and(np.logical_and(alpha <= ACD1,alpha < 0.),alphan>=ACD1)
+        cd[stalled]  = CD1max + (CD2max - CD1max) * np.sin(((alphan[stalled]-ACD1)/(90.-ACD1))*Units.degrees)     
+        
+        CL[i] = cl
+        CD[i] = cd
 
     airfoil_data.lift_coefficients  = CL
     airfoil_data.drag_coefficients  = CD
     airfoil_data.angle_of_attacks   = AoA_sweep*Units.degrees 
 
     return airfoil_data   
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def airfoil_files_key(files):
+    """Identifies a list of airfoil files by their paths and modification times
+    
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    files                  <list of strings>
+
+    Outputs:
+    key                    <tuple>
+    
+    Properties Used:
+    N/A
+    """  
+    
+    return tuple([(os.path.abspath(f),os.path.getmtime(f)) for f in files])
@@ -0,0 +1,67 @@
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+# interpolate_airfoil_polars.py
+# 
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+import numpy as np
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def interpolate_airfoil_polars(alpha,AoA_sweep,tables):
+    """Interpolates the polar table of each blade station at the local angles of attack. 
+    All control points and stations are looked up at once, giving the same values as 
+    np.interp on each station.
+    
+    Assumptions:
+    Angles of attack outside of the sweep take the value at the nearest end
+
+    Source:
+    None
+
+    Inputs:
+    alpha           angle of attack, control points by stations     [radians]
+    AoA_sweep       angles of attack of the tables, increasing      [radians]
+    tables          coefficient of each station, stations by sweep  [unitless]
+
+    Outputs:
+    coefficients    control points by stations                      [unitless]
+    
+    Properties Used:
+    N/A
+    """  
+    
+    x  = np.array(alpha,dtype=float)
+    xp = AoA_sweep
+    n  = len(xp)
+    
+    # bracket each angle of attack, xp[j] <= x < xp[j+1]
+    j  = np.searchsorted(xp,x,side='right') - 1
+    jl = np.clip(j,0,n-2)
+    
+    stations = np.broadcast_to(np.arange(np.shape(tables)[0]),np.shape(x))
+    x0 = xp[jl]
+    x1 = xp[jl+1]
+    y0 = tables[stations,jl]
+    y1 = tables[stations,jl+1]
+    
+    # linear interpolation, in the same order of operations as np.interp
+    with np.errstate(divide='ignore',invalid='ignore'):
+        slope  = (y1 - y0)/(x1 - x0)
+        values = slope*(x - x0) + y0
+        
+        # fall back to the upper point if the result is not finite
+        nans         = np.isnan(values)
+        values[nans] = slope[nans]*(x[nans] - x1[nans]) + y1[nans]
+        nans         = np.logical_and(np.isnan(values),y0==y1)
+        values[nans] = y0[nans]
+    
+    # points on the grid and at the ends of the sweep
+    on_grid         = x0 == x
+    values[on_grid] = y0[on_grid]
+    values[j==n-1]  = tables[stations,n-1][j==n-1]
+    values[x<xp[0]] = tables[stations,0][x<xp[0]]
+    values[np.isnan(x)] = x[np.isnan(x)]
+    
+    return values
@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,9 @@
 
 from SUAVE.Analyses import Process
 from SUAVE.Core import Data
+from SUAVE.Methods.Missions.Segments.warm_start import cold_start_segment
+
+import multiprocessing
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -22,7 +26,8 @@ def expand_sub_segments(segment):
     """ Fills in the segments to a mission with data, sets initials data if necessary
     
         Assumptions:
-        N/A
+        A segment takes its initials from the previous segment, unless 
+        sub_segment.settings.initials_segment names an earlier segment
         
         Inputs:
         N/A
@@ -36,15 +41,23 @@ def expand_sub_segments(segment):
     """    
 
     last_tag = None
+    earlier  = []
     
     for tag,sub_segment in segment.segments.items():
         
         if Process.verbose:
             print('segment start :' , tag)
         
-        if last_tag:
-            sub_segment.state.initials = segment.segments[last_tag].state
+        initials_tag = sub_segment.settings.get('initials_segment',None)
+        if initials_tag is None:
+            initials_tag = last_tag
+        elif not initials_tag in earlier:
+            raise ValueError('initials segment "%s" of segment "%s" is not an earlier segment' % (initials_tag,tag))
+        
+        if initials_tag:
+            sub_segment.state.initials = segment.segments[initials_tag].state
         last_tag = tag        
+        earlier.append(tag)
         
         sub_segment.process.initialize.expand_state(sub_segment)
                
@@ -111,7 +124,8 @@ def finalize_sub_segments(segment):
 ## @ingroup Methods-Missions-Segments-Common
 def sequential_sub_segments(segment):
     
-    """ Evaluates all the segments in a mission one by one
+    """ Evaluates all the segments in a mission one by one. A segment that does not converge from
+        a warm start is evaluated again from its cold start, see warm_start.cold_start_segment
     
         Assumptions:
         N/A
@@ -127,9 +141,331 @@ def sequential_sub_segments(segment):
                                 
     """       
 
-    for tag,sub_segment in segment.segments.items():
-        sub_segment.evaluate()
+    number_of_processes = segment.settings.get('number_of_processes',1)
+    process_pool        = segment.__dict__.get('process_pool',None)
+    
+    # worker processes can not start their own pools
+    if not number_of_processes or number_of_processes <= 1 or process_pool is None \
+       or multiprocessing.current_process().daemon:
+        for tag,sub_segment in segment.segments.items():
+            sub_segment.evaluate()
+            cold_start_segment(segment,sub_segment)
+        return
+    
+    # evaluate the independent segments of each level together, the states are updated in place
+    pool = process_pool.get(number_of_processes)
+    for level in sub_segment_levels(segment):
+        if len(level) == 1:
+            level[0].evaluate()
+        else:
+            outputs = pool.map(evaluate_sub_segment,level)
+            for sub_segment, states in zip(level,outputs):
+                update_sub_segment_states(sub_segment,states)
+                
+        # segments that did not converge from a warm start are run again here
+        for sub_segment in level:
+            cold_start_segment(segment,sub_segment)
+        
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def sub_segment_levels(segment):
+    
+    """ Orders the segments of a mission into levels from the links of their initials. 
+        The segments within a level do not depend on each other and can be evaluated together.
+    
+        Assumptions:
+        The segments only depend on each other through state.initials
+        
+        Inputs:
+        segment.segments                 [Data]
+            
+        Outputs:
+        levels                           [list of lists of segments]
+
+        Properties Used:
+        N/A
+                                
+    """      
+    
+    # find the segment each segment takes initials from
+    segments = list(segment.segments.values())
+    parents  = []
+    for sub_segment in segments:
+        parent = None
+        for i, other in enumerate(segments):
+            if sub_segment.state.initials is other.state:
+                parent = i
+                break
+        parents.append(parent)
+        
+    # segments join the first level after the segment they depend on, in mission order 
+    depth  = []
+    levels = []
+    for i, parent in enumerate(parents):
+        d = 0 if parent is None else depth[parent] + 1
+        depth.append(d)
+        if d == len(levels):
+            levels.append([])
+        levels[d].append(segments[i])
+        
+    return levels
+
+## @ingroup Methods-Missions-Segments-Common
+def evaluate_sub_segment(sub_segment):
+    
+    """ Evaluates a segment in a worker process and returns its state and the states of its own
+        segments
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        sub_segment                      [Segment]
+            
+        Outputs:
+        states                           [Data], see sub_segment_states
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    sub_segment.evaluate()
+    
+    return sub_segment_states(sub_segment)
+
+## @ingroup Methods-Missions-Segments-Common
+def sub_segment_states(sub_segment):
+    
+    """ Collects the state of a segment and, for a container, the states of its segments. The
+        other values of a segment are collected too, as its process may set them, such as the
+        distance of the cruise segment of a Vary_Cruise mission.
+    
+        Assumptions:
+        The initials are not sent back, they belong to another segment. The analyses and the
+        process are not changed by an evaluation.
+        
+        Inputs:
+        sub_segment                      [Segment]
+            
+        Outputs:
+        states.state                     [State]
+        states.segment                   [Data] the other values of the segment
+        states.segments                  [Data]
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    state = sub_segment.state
+    if 'initials' in state:
+        del state.initials
+    
+    states = Data()
+    states.state     = state
+    states.segment   = Data()
+    states.segments  = Data()
+    
+    for key, value in sub_segment.items():
+        if not key in ['state','conditions','analyses','process','segments']:
+            states.segment[key] = value
+    
+    for tag, child in sub_segment.get('segments',Data()).items():
+        states.segments[tag] = sub_segment_states(child)
+    
+    return states
+
+## @ingroup Methods-Missions-Segments-Common
+def update_sub_segment_states(sub_segment,states):
+    
+    """ Copies the states evaluated in a worker process back into a segment and its own segments
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        sub_segment                      [Segment]
+        states                           [Data], see sub_segment_states
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    update_sub_segment_state(sub_segment,states.state)
+    
+    for key, value in states.segment.items():
+        if isinstance(value,Data) and isinstance(sub_segment.get(key,None),Data):
+            sub_segment[key].update(value)
+        else:
+            sub_segment[key] = value
+    
+    for tag, child_states in states.segments.items():
+        update_sub_segment_states(sub_segment.segments[tag],child_states)
+            
+    return
 
+## @ingroup Methods-Missions-Segments-Common
+def update_sub_segment_state(sub_segment,state):
+    
+    """ Copies a state evaluated in a worker process back into a segment in place, so that the
+        links of the initials and segment.conditions still point at the segment state
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        sub_segment                      [Segment]
+        state                            [State]
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    for key, value in state.items():
+        if isinstance(value,Data) and isinstance(sub_segment.state.get(key,None),Data):
+            sub_segment.state[key].update(value)
+        else:
+            sub_segment.state[key] = value
+            
+    return
+
+# ----------------------------------------------------------------------
+#  Process Pool
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+class Process_Pool(object):
+    """ Keeps the pool of worker processes of a mission between its evaluations. Copies and
+        pickles of a mission start without a pool.
+    
+        Assumptions:
+        The pool is closed when the mission is deleted or the number of processes changes
+        
+        Source:
+        N/A
+    """
+    
+    def __init__(self):
+        """ Starts without a pool
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            N/A
+    
+            Properties Used:
+            N/A
+        """
+        self.pool                = None
+        self.number_of_processes = 0
+        
+    def __reduce__(self):
+        """ Drops the pool when copying or pickling, the copy starts without a pool for
+            every pickle protocol
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            class, arguments [tuple]
+    
+            Properties Used:
+            N/A
+        """
+        return (self.__class__, ())
+        
+    def __del__(self):
+        """ Stops the worker processes
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            N/A
+    
+            Properties Used:
+            N/A
+        """
+        self.close()
+        
+    def get(self,number_of_processes,initializer=None,initargs=()):
+        """ Returns the pool, starting it on the first call
+    
+            Assumptions:
+            The initializer only runs in the workers when the pool is started
+    
+            Source:
+            N/A
+    
+            Inputs:
+            number_of_processes     [int]
+            initializer             [function] run by each worker when it starts
+            initargs                [tuple]    arguments of the initializer
+    
+            Outputs:
+            pool                    [multiprocessing.Pool]
+    
+            Properties Used:
+            N/A
+        """
+        if self.pool is None or self.number_of_processes != number_of_processes:
+            self.close()
+            self.pool                = multiprocessing.Pool(number_of_processes,initializer=initializer,initargs=initargs)
+            self.number_of_processes = number_of_processes
+            
+        return self.pool
+    
+    def close(self):
+        """ Stops the worker processes, a new pool is started by the next call of get
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            N/A
+    
+            Properties Used:
+            N/A
+        """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool                = None
+            self.number_of_processes = 0
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,8 @@ import scipy.optimize
 import numpy as np
 
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Core import Data, Packing_Plan
+from .sparse_jacobian import segment_jacobian, is_compressed
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -31,6 +34,7 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]
 
     Outputs:
     state.unknowns                     [Any]
@@ -40,19 +44,38 @@ def converge_root(segment):
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    plans    = get_packing_plans(segment)
+    unknowns = plans.unknowns.pack(segment.state.unknowns)
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
+    # use a sparse or user supplied jacobian instead of the root finder's own, unless the
+    # sparsity found before leaves no columns to difference together
+    numerics = segment.state.numerics
+    options  = {}
+    if numerics.solver_jacobian == "function":
+        options['fprime'] = segment_jacobian
+    elif numerics.solver_jacobian == "sparse":
+        colors = numerics.jacobian_colors
+        if colors is None or np.size(colors) != unknowns.size or is_compressed(colors):
+            options['fprime'] = segment_jacobian
+    elif numerics.solver_jacobian != "none":
+        raise ValueError('unknown solver jacobian "%s"' % numerics.solver_jacobian)
+    
     unknowns,infodict,ier,msg = root_finder( iterate,
                                          unknowns,
                                          args = segment,
                                          xtol = segment.state.numerics.tolerance_solution,
                                          maxfev = segment.state.numerics.max_evaluations,
-                                         full_output = 1)
+                                         full_output = 1,
+                                         **options)
+    
+    # the last evaluation may have been a jacobian column, reset the state to the solution
+    if options:
+        iterate(unknowns,segment)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -90,13 +113,49 @@ def iterate(unknowns, segment):
     Properties Used:
     N/A
     """       
+    plans = get_packing_plans(segment)
+    
     if isinstance(unknowns,array_type):
-        segment.state.unknowns.unpack_array(unknowns)
+        plans.unknowns.unpack(segment.state.unknowns,unknowns)
     else:
         segment.state.unknowns = unknowns
         
     segment.process.iterate(segment)
     
-    residuals = segment.state.residuals.pack_array()
+    residuals = plans.residuals.pack(segment.state.residuals)
+        
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def get_packing_plans(segment):
+    
+    """Retrieves the packing plans of the unknowns and residuals of a segment, building them
+    on the first call. The plans rebuild themselves if the keys or shapes of the data change.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state                 [Data]
+
+    Outputs:
+    plans.unknowns                [Packing_Plan]
+    plans.residuals               [Packing_Plan]
+
+    Properties Used:
+    N/A
+    """  
+    state = segment.state
+    
+    try:
+        plans = state._packing_plans
+    except AttributeError:
+        plans = Data()
+        plans.unknowns  = Packing_Plan()
+        plans.residuals = Packing_Plan()
+        state._packing_plans = plans
         
-    return residuals 
\ No newline at end of file
+    return plans 
\ No newline at end of file
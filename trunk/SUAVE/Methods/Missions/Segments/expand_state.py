@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Expand State
@@ -11,7 +12,8 @@
 ## @ingroup methods-mission-segments
 def expand_state(segment):
     
-    """Makes all vectors in the state the same size.
+    """Makes all vectors in the state the same size. If numerics.pack_conditions is set, the
+    arrays of the conditions are then packed into one buffer.
 
     Assumptions:
     N/A
@@ -21,6 +23,7 @@ def expand_state(segment):
 
     Inputs:
     state.numerics.number_control_points  [Unitless]
+    state.numerics.pack_conditions        [Boolean]
 
     Outputs:
     N/A
@@ -33,5 +36,8 @@ def expand_state(segment):
     
     segment.state.expand_rows(n_points)
     
+    if segment.state.numerics.get('pack_conditions',False) and segment.state.conditions._buffer is None:
+        segment.state.conditions.pack()
+    
     return
     
\ No newline at end of file
@@ -0,0 +1,242 @@
+## @ingroup Methods-Missions-Segments
+# sparse_jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Segment Jacobian
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def segment_jacobian(unknowns, segment):
+    """Computes the jacobian of the segment residuals with respect to the unknowns. This is passed
+    to the root finder in place of its own dense finite differencing.
+
+    The method is chosen by state.numerics.solver_jacobian:
+        "sparse"   - compressed finite differences. Columns that do not share a nonzero row are
+                     perturbed together, so each jacobian costs (colors + 1) iterations instead of
+                     (unknowns + 1). The sparsity is taken from numerics.jacobian_sparsity, or found
+                     by probing every column at the unknowns and at a random point near them if
+                     that is None. If no two columns can be perturbed together, as in segments
+                     that use Chebyshev differentiation, the columns are differenced one by one
+                     and converge_root leaves later jacobians to the root finder.
+        "function" - numerics.jacobian_function(unknowns,segment) returns the jacobian directly
+
+    Assumptions:
+    A sparsity pattern found by probing is assumed to hold for the rest of the solve and for later
+    solves. An entry is only missed if it is zero at both probed points.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    unknowns                            [array]
+    segment.state.numerics:
+        solver_jacobian                 [string]
+        jacobian_sparsity               [array of bools] or None
+        jacobian_function               [function]
+
+    Outputs:
+    jacobian                            [array]
+    segment.state.numerics:
+        jacobian_sparsity               [array of bools]
+        jacobian_colors                 [array of ints]
+
+    Properties Used:
+    N/A
+    """
+
+    from .converge_root import iterate
+
+    numerics = segment.state.numerics
+    method   = numerics.solver_jacobian
+
+    if method == 'function':
+        return np.atleast_2d(numerics.jacobian_function(unknowns,segment))
+    elif method != 'sparse':
+        raise ValueError('unknown solver jacobian "%s"' % method)
+
+    x  = np.array(unknowns,dtype=float)
+    F0 = iterate(x.copy(),segment)
+    n  = x.size
+    m  = F0.size
+    h  = finite_difference_steps(x)
+
+    # find the sparsity if needed
+    sparsity = numerics.jacobian_sparsity
+    if sparsity is None or np.shape(sparsity) != (m,n):
+        jacobian = dense_jacobian(x,F0,h,segment)
+        
+        # entries that happen to be zero at the unknowns are found at a second point
+        random = np.random.RandomState(0)
+        xr = x + 0.01*np.maximum(np.abs(x),1.)*random.uniform(-1.,1.,n)
+        hr = finite_difference_steps(xr)
+        jacobian_r = dense_jacobian(xr,iterate(xr.copy(),segment),hr,segment)
+        
+        numerics.jacobian_sparsity = (jacobian != 0.) | (jacobian_r != 0.)
+        numerics.jacobian_colors   = color_jacobian_columns(numerics.jacobian_sparsity)
+        return jacobian
+
+    colors = numerics.jacobian_colors
+    if colors is None or np.shape(colors) != (n,):
+        colors = color_jacobian_columns(sparsity)
+        numerics.jacobian_colors = colors
+        
+    # nothing to compress
+    if not is_compressed(colors):
+        return dense_jacobian(x,F0,h,segment)
+
+    # compressed finite differences, one iteration per color
+    sparsity = np.asarray(sparsity,dtype=bool)
+    jacobian = np.zeros((m,n))
+    for color in range(int(colors.max())+1 if n else 0):
+        columns = np.where(colors == color)[0]
+        xp = x.copy()
+        xp[columns] = xp[columns] + h[columns]
+        dF = iterate(xp,segment) - F0
+        for j in columns:
+            rows = sparsity[:,j]
+            jacobian[rows,j] = dF[rows]/h[j]
+
+    return jacobian
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def dense_jacobian(x,F0,h,segment):
+    """Finite difference jacobian of the segment residuals, one iteration per unknown
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    x          [array]
+    F0         [array] residuals at x
+    h          [array] step sizes
+    segment    [Data]
+
+    Outputs:
+    jacobian   [array]
+
+    Properties Used:
+    N/A
+    """
+
+    from .converge_root import iterate
+
+    jacobian = np.zeros((F0.size,x.size))
+    for j in range(x.size):
+        xp    = x.copy()
+        xp[j] = xp[j] + h[j]
+        jacobian[:,j] = (iterate(xp,segment) - F0)/h[j]
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def is_compressed(colors):
+    """Checks if a coloring perturbs any columns together
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    colors       [array of ints] or None
+
+    Outputs:
+    compressed   [bool]
+
+    Properties Used:
+    N/A
+    """
+    
+    if colors is None or not np.size(colors):
+        return False
+    
+    return int(np.max(colors)) + 1 < np.size(colors)
+
+## @ingroup Methods-Missions-Segments
+def color_jacobian_columns(sparsity):
+    """Groups the columns of a jacobian so that no two columns in a group share a nonzero row.
+    The columns of a group can be found with a single finite difference. A greedy coloring of the
+    column intersection graph is used, largest columns first.
+
+    Assumptions:
+    N/A
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    sparsity   [array of bools]
+
+    Outputs:
+    colors     [array of ints]
+
+    Properties Used:
+    N/A
+    """
+
+    sparsity = np.asarray(sparsity,dtype=bool)
+    m, n     = sparsity.shape
+    
+    # every column shares the nonzero rows of a dense jacobian, so each needs its own color
+    rows = sparsity.any(axis=1)
+    if np.any(rows) and np.all(sparsity[rows]):
+        return np.arange(n)
+    
+    colors   = np.zeros(n,dtype=int)
+    used     = [] # rows already covered by each color
+
+    order = np.argsort(-sparsity.sum(axis=0),kind='stable')
+    for j in order:
+        rows = sparsity[:,j]
+        for color, covered in enumerate(used):
+            if not np.any(covered & rows):
+                covered |= rows
+                colors[j] = color
+                break
+        else:
+            colors[j] = len(used)
+            used.append(rows.copy())
+
+    return colors
+
+## @ingroup Methods-Missions-Segments
+def finite_difference_steps(x):
+    """Finite difference step sizes, the same as MINPACK uses for its own jacobians
+
+    Assumptions:
+    N/A
+
+    Source:
+    More, J. J., Garbow, B. S., and Hillstrom, K. E., "User Guide for MINPACK-1", 1980
+
+    Inputs:
+    x          [array]
+
+    Outputs:
+    h          [array]
+
+    Properties Used:
+    N/A
+    """
+    eps = np.sqrt(np.finfo(float).eps)
+    h   = eps*np.abs(x)
+    h[h==0.] = eps
+    return h
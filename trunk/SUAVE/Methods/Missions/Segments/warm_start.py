@@ -0,0 +1,368 @@
+## @ingroup Methods-Missions-Segments
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import atleast_2d_col
+
+# ----------------------------------------------------------------------
+#  Seed Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def seed_unknowns(mission):
+    """Starts the unknowns of each segment from the solution the segment converged to in the
+    last evaluation of the mission. If the number of control points has changed, the solution is
+    interpolated onto the new control points. Segments seen for the first time have their own
+    unknowns recorded as the cold start, as do segments that have no converged solution yet.
+
+    Without mission.settings.warm_start the unknowns are left as they are, so every segment
+    carries on from the last iterate of its previous evaluation.
+
+    Assumptions:
+    Segments are identified by their tags. A segment whose unknowns have different keys or columns
+    than the stored ones is treated as a new segment.
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.settings.warm_start             [bool]
+    mission.warm_start_store                [Data]
+    mission.segments.*.state:
+        unknowns                            [Data]
+        numerics.number_control_points      [int]
+        numerics.discretization_method      [function]
+
+    Outputs:
+    warm                                    [bool] True if any segment was warm started
+    mission.segments.*.state.unknowns       [Data]
+    mission.warm_start_store.*.warm         [bool]
+
+    Properties Used:
+    N/A
+    """
+
+    store = mission.warm_start_store
+    warm  = False
+
+    if not mission.settings.warm_start:
+        for entry in store.values():
+            entry.warm = False
+        return warm
+
+    for tag, segment in mission.segments.items():
+        state = segment.state
+        entry = store.get(tag,None)
+
+        # record the cold start of new segments
+        if entry is None or not same_layout(entry.cold,state.unknowns):
+            entry = Data()
+            entry.cold           = deepcopy(state.unknowns)
+            entry.unknowns       = None
+            entry.control_points = None
+            entry.warm           = False
+            store[tag] = entry
+            continue
+
+        if entry.unknowns is None:
+            state.unknowns = deepcopy(entry.cold)
+            entry.warm     = False
+            continue
+
+        # interpolate onto new control points
+        numerics = state.numerics
+        x_old    = entry.control_points
+        if len(x_old) == numerics.number_control_points:
+            state.unknowns = deepcopy(entry.unknowns)
+        else:
+            x_new,_,_ = numerics.discretization_method(numerics.number_control_points,**numerics)
+            state.unknowns = interpolate_unknowns(entry.unknowns,x_old,atleast_2d_col(x_new))
+
+        entry.warm = True
+        warm       = True
+
+    return warm
+
+# ----------------------------------------------------------------------
+#  Store Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def store_unknowns(mission):
+    """Stores the unknowns of each segment after an evaluation of the mission, with the control
+    points they belong to. Solutions that did not converge are not stored, the segment keeps the
+    last solution that did.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.settings.warm_start             [bool]
+    mission.warm_start_store                [Data]
+    mission.state.numerics.converged        [bool or None]
+    mission.segments.*.state:
+        unknowns                            [Data]
+        numerics.dimensionless.control_points [array]
+
+    Outputs:
+    mission.warm_start_store                [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    store = mission.warm_start_store
+    if not mission.settings.warm_start or not state_converged(mission.state):
+        return
+
+    for tag, segment in mission.segments.items():
+        entry = store.get(tag,None)
+        if entry is None or not segment_converged(segment):
+            continue
+        state = segment.state
+        entry.unknowns       = deepcopy(state.unknowns)
+        entry.control_points = np.array(state.numerics.dimensionless.control_points)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Reset Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def reset_unknowns(mission):
+    """Returns the unknowns of every segment to their cold start and forgets the stored solutions
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.warm_start_store                [Data]
+
+    Outputs:
+    mission.segments.*.state.unknowns       [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    store = mission.warm_start_store
+
+    for tag, segment in mission.segments.items():
+        entry = store.get(tag,None)
+        if entry is None:
+            continue
+        segment.state.unknowns = deepcopy(entry.cold)
+        entry.unknowns         = None
+        entry.control_points   = None
+        entry.warm             = False
+
+    return
+
+# ----------------------------------------------------------------------
+#  Cold Start
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def cold_start_segment(mission,segment):
+    """Evaluates a segment again from its cold start if it was warm started and did not
+    converge. The segments of a Sequential_Segments mission are checked one by one, so only the
+    segment that failed is run again.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.warm_start_store                [Data]
+    segment.state.numerics.converged        [bool or None]
+
+    Outputs:
+    restarted                               [bool]
+    segment.state.unknowns                  [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    store = mission.__dict__.get('warm_start_store',None)
+    entry = None if store is None else store.get(segment.tag,None)
+    if entry is None or not entry.get('warm',False) or segment_converged(segment):
+        return False
+
+    segment.state.unknowns = deepcopy(entry.cold)
+    entry.warm = False
+    segment.evaluate()
+
+    return True
+
+## @ingroup Methods-Missions-Segments
+def cold_start_needed(mission):
+    """Checks if a mission that is solved as a whole, rather than segment by segment, did not
+    converge from a warm start
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.warm_start_store                [Data]
+    mission.state.numerics.converged        [bool or None]
+
+    Outputs:
+    needed                                  [bool]
+
+    Properties Used:
+    N/A
+    """
+
+    warm = any([entry.get('warm',False) for entry in mission.warm_start_store.values()])
+
+    return warm and not state_converged(mission.state)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def segment_converged(segment):
+    """Checks the convergence flags the root finder left on a segment and on its own segments.
+    Segments that were not solved by a root finder count as converged.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state.numerics.converged              [bool or None]
+    segment.segments.*                            [Segment]
+
+    Outputs:
+    converged                                     [bool]
+
+    Properties Used:
+    N/A
+    """
+
+    if not state_converged(segment.state):
+        return False
+
+    for sub_segment in segment.get('segments',Data()).values():
+        if not segment_converged(sub_segment):
+            return False
+
+    return True
+
+## @ingroup Methods-Missions-Segments
+def state_converged(state):
+    """Checks the convergence flag the root finder left on a state
+
+    Assumptions:
+    A state that was not solved by a root finder counts as converged
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.converged                      [bool or None]
+
+    Outputs:
+    converged                                     [bool]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = state.get('numerics',None)
+
+    return numerics is None or numerics.get('converged',None) is not False
+
+## @ingroup Methods-Missions-Segments
+def same_layout(A,B):
+    """Checks if two sets of unknowns have the same keys and number of columns
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    A, B        [Data]
+
+    Outputs:
+    same        [bool]
+
+    Properties Used:
+    N/A
+    """
+
+    if list(A.keys()) != list(B.keys()):
+        return False
+
+    for k in A.keys():
+        a = A[k]
+        b = B[k]
+        if isinstance(a,Data) and isinstance(b,Data):
+            if not same_layout(a,b):
+                return False
+        elif np.ndim(a) != np.ndim(b) or np.shape(a)[1:] != np.shape(b)[1:]:
+            return False
+
+    return True
+
+## @ingroup Methods-Missions-Segments
+def interpolate_unknowns(unknowns,x_old,x_new):
+    """Linearly interpolates the rows of a set of unknowns from one set of dimensionless control
+    points onto another. Arrays that are not one row per control point are copied.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns    [Data]
+    x_old       [array] dimensionless control points of the unknowns
+    x_new       [array] new dimensionless control points
+
+    Outputs:
+    unknowns    [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    x_old = np.ravel(x_old)
+    x_new = np.ravel(x_new)
+    out   = deepcopy(unknowns)
+
+    for k, v in unknowns.items():
+        if isinstance(v,Data):
+            out[k] = interpolate_unknowns(v,x_old,x_new)
+        elif isinstance(v,np.ndarray) and v.ndim == 2 and v.shape[0] == len(x_old):
+            out[k] = np.array([np.interp(x_new,x_old,v[:,j]) for j in range(v.shape[1])]).T
+
+    return out
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -68,6 +69,8 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
                     distance_vector             - distance from the source location to observer
                     angle                       - polar angle from the source to the observer
                     phi                         - azimuthal angle from the source to the observer
+                    The geometry can have one row per microphone, in which case all the microphones are
+                    evaluated together and EPNL and SENEL have one value per microphone
 
 
             Outputs: One Third Octave Band SPL [dB]
@@ -80,7 +83,8 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
                 SPL_nose_landing_gear            - Sound Pressure Level of the nose landing gear
 
             Assumptions:
-                Correlation based."""
+                Correlation based. All the time steps are evaluated at once as arrays of time steps
+                (rows) by frequency bands (columns)."""
 
 
     # ==============================================
@@ -127,39 +131,32 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     angle = noise_segment.theta 
     phi   = noise_segment.phi
     
-    distance_vector = np.interp(noise_time,time,distance_vector)
-    angle = np.interp(noise_time,time,angle)
-    phi   = np.interp(noise_time,time,phi)
+    interpolate = lambda history: np.interp(noise_time,time,history)
+    
+    distance_vector = np.apply_along_axis(interpolate,-1,distance_vector)
+    angle = np.apply_along_axis(interpolate,-1,angle)
+    phi   = np.apply_along_axis(interpolate,-1,phi)
         
     # Number of points on the discretize segment   
     nsteps=len(noise_time)
     
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
-    
     # ==============================================
     #         Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
+    atmo_data = analyses.atmosphere.compute_values(np.atleast_2d(altitude).T)
         
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
+    #unpack    
+    sound_speed =    atmo_data.speed_of_sound
+    density     =    atmo_data.density
+    viscosity   =    atmo_data.dynamic_viscosity*10.7639 #units converstion - m2 to ft2
+    temperature =    atmo_data.temperature
         
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
     
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
     
 
     #Units conversion - knots to ft/s
@@ -173,72 +170,60 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     # Velocity in fts
     velocity_fst = velocity * Units.knot
     
-    #number of positions of the aircraft to calculate the noise
-    nrange = len(angle) 
-    i=0
-    SPL_wing_history = np.zeros((nrange,24))
-    SPLht_history    = np.zeros((nrange,24))
-    SPLvt_history    = np.zeros((nrange,24))
-    SPL_flap_history = np.zeros((nrange,24))
-    SPL_slat_history = np.zeros((nrange,24))
-    SPL_main_landing_gear_history = np.zeros((nrange,24))
-    SPL_nose_landing_gear_history = np.zeros((nrange,24))
-    SPL_total_history = np.zeros((nrange,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nrange,24))  
-    SPLt_dBA_max = np.zeros(nrange)    
-    
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
+    #Emission angle theta, azimuthal angle and distance from airplane to observer, evaluated at retarded time,
+    #in a column against the frequency bands
+    theta    = angle[...,None]
+    phi_step = phi[...,None]
+    distance = distance_vector[...,None]
+    shape    = angle.shape+(24,)
        
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
+     #Atmospheric attenuation
+    delta_atmo=atmospheric_attenuation(distance)
 
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+    #Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw,velocity,viscosity,M,phi_step,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw,velocity,viscosity,M,phi_step,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw,velocity,viscosity,M,phi_step,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
  
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi_step,theta,distance,frequency) -delta_atmo        #Slat leading edge
  
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+    if (deltaf==0):
+        SPL_flap = np.zeros(shape)
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M,phi_step,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
  
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros(shape)
+        SPL_nose_landing_gear = np.zeros(shape)
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M,velocity,phi_step,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M,velocity,phi_step,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
  
  
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
-        
+     #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
         
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)        
+    SPL_total_history = np.broadcast_to(SPL_total,shape).copy()
+    SPL_wing_history  = np.broadcast_to(SPL_wing,shape).copy()
+    SPLvt_history     = np.broadcast_to(SPLvt,shape).copy()
+    SPLht_history     = np.broadcast_to(SPLht,shape).copy()
+    SPL_flap_history  = np.broadcast_to(SPL_flap,shape).copy()
+    SPL_slat_history  = np.broadcast_to(SPL_slat,shape).copy()
+    SPL_nose_landing_gear_history = np.broadcast_to(SPL_nose_landing_gear,shape).copy()
+    SPL_main_landing_gear_history = np.broadcast_to(SPL_main_landing_gear,shape).copy()
+    
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = dbA_noise(SPL_total_history)
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=-1)
+    
+    #The last position of the aircraft is not part of the noise history
+    for history in [SPL_total_history,SPL_wing_history,SPLvt_history,SPLht_history,SPL_flap_history,SPL_slat_history, \
+                    SPL_nose_landing_gear_history,SPL_main_landing_gear_history,SPLt_dBA_history]:
+        history[...,-1,:] = 0.
+    SPLt_dBA_max[...,-1] = 0.
        
        
    #Calculation of dBA based on the sound pressure time history
@@ -304,9 +289,9 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         fid.write('\n')
         
         for id in range (0,nsteps):
-            fid.write(str('%2.2f' % time[id])+'        ')
+            fid.write(str('%2.2f' % noise_time[id])+'        ')
             fid.write(str('%2.2f' % altitude[id])+'        ')
-            fid.write(str('%2.2f' % M[id])+'        ')
+            fid.write(str('%2.2f' % M[id,0])+'        ')
             fid.write(str('%2.2f' % (angle[id]*180/np.pi))+'        ')
             fid.write(str('%2.2f' % (phi[id]*180/np.pi))+'        ')
             fid.write(str('%2.2f' % distance_vector[id])+'        ')
@@ -355,7 +340,7 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         fid.write('Sound Pressure Level for the Total Aircraft Noise')
         fid.write('\n')
         
-        for nid in range (0,nrange):
+        for nid in range (0,nsteps):
             fid.write('Polar angle = ' + str('%2.2f' % (angle[nid]*(180/np.pi))) + '  degrees' + '\n')
             fid.write('f		total SPL(dB)    total SPL(dBA)' + '\n')
             for id in range(0,24):
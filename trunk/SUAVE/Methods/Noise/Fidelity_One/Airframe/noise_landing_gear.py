@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -31,7 +32,8 @@ def noise_landing_gear (D,H,wheels,M,velocity,phi,theta,distance,frequency):
                     distance                   - Distance from airplane to observer, evaluated at retarded time [ft]
                     frequemcy                  - Frequency array [Hz]
 
-
+                    M, phi, theta and distance can be arrays of time steps in a column, in which case the
+                    SPL has one row per time step.
 
             Outputs: One Third Octave Band SPL [dB]
                 SPL                              - Sound Pressure Level of the landing gear [dB]
@@ -49,9 +51,9 @@ def noise_landing_gear (D,H,wheels,M,velocity,phi,theta,distance,frequency):
     if (wheels==1 or wheels==2):
         G1 = 13+np.log10(4.5*((frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)* \
             (12.5+((frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2))**-2.25)
-        G2 = (13+np.log10(2.0*(frequency*D/(velocity_fts*(1-M*np.math.cos(theta)))**2.0))* \
+        G2 = (13+np.log10(2.0*(frequency*D/(velocity_fts*(1-M*np.cos(theta)))**2.0))* \
             (30+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**8)**-1*(0.34*H/D))* \
-            (np.math.sin(phi))**2
+            (np.sin(phi))**2
     elif wheels==4:
         G1 = 12+np.log10(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2 \
         *(0.4+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)**(-1.6)
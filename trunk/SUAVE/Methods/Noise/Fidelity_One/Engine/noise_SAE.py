@@ -4,6 +4,7 @@
 # Created:  May 2015, C. Ilario
 # Modified: Nov 2015, C. Ilario
 #           Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -66,6 +67,10 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                         distance_microphone        - Distance from the nozzle exhaust to the microphones
                         angles                     - Array containing the desired polar angles
 
+                    noise_segment.dist, theta and phi can have one row per microphone, in which case
+                    all the microphones are evaluated together and EPNL and SENEL have one value per
+                    microphone
+
 
                     airport   - SUAVE type airport data, with followig fields:
                         atmosphere                  - Airport atmosphere (SUAVE type)
@@ -80,7 +85,10 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                     SPL_total                       - Sound Pressure Level of the total jet noise
 
                 Assumptions:
-                    ."""
+                    The time steps and the frequency bands are evaluated together as arrays of
+                    time steps (rows) by frequency bands (columns), with a leading axis for the
+                    microphones if there are several. Only the location of the noise sources is
+                    solved step by step, as each step starts from the previous one."""
 
 
     #unpack
@@ -125,35 +133,36 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
     angles              = noise_segment.theta #geometric[:][1]
     phi                 = noise_segment.phi #geometric[:][2]      
     
-    distance_microphone = np.interp(noise_time,time,distance_microphone)
-    angles = np.interp(noise_time,time,angles)
-    phi   = np.interp(noise_time,time,phi)    
+    interpolate = lambda history: np.interp(noise_time,time,history)
+    
+    distance_microphone = np.apply_along_axis(interpolate,-1,distance_microphone)
+    angles = np.apply_along_axis(interpolate,-1,angles)
+    phi   = np.apply_along_axis(interpolate,-1,phi)
     
     nsteps = len(noise_time)        
     
-    #Preparing matrix for noise calculation
-    sound_ambient       = np.zeros(nsteps)
-    density_ambient     = np.zeros(nsteps)
-    viscosity           = np.zeros(nsteps)
-    temperature_ambient = np.zeros(nsteps)
-    pressure_amb        = np.zeros(nsteps)
-    Mach_aircraft       = np.zeros(nsteps)
+    #Time steps are the rows of the arrays and frequency bands the columns
+    Temperature_primary   = np.atleast_2d(Temperature_primary).T
+    Pressure_primary      = np.atleast_2d(Pressure_primary).T
+    Temperature_secondary = np.atleast_2d(Temperature_secondary).T
+    Pressure_secondary    = np.atleast_2d(Pressure_secondary).T
+    Altitude              = np.atleast_2d(Altitude).T
+    distance_microphone   = distance_microphone[...,None]
     
-    Velocity_primary = np.ones(nsteps)*Velocity_primary_1
-    Velocity_secondary = np.ones(nsteps)*Velocity_secondary_1
+    Velocity_primary   = np.ones((nsteps,1))*Velocity_primary_1
+    Velocity_secondary = np.ones((nsteps,1))*Velocity_secondary_1
 
     # ==============================================
     # Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(Altitude[id])        
+    atmo_data = analyses.atmosphere.compute_values(Altitude)
     
-        sound_ambient[id]       =   np.float(atmo_data.speed_of_sound)
-        density_ambient[id]     =   np.float(atmo_data.density)
-        viscosity[id]           =   np.float(atmo_data.dynamic_viscosity)
-        temperature_ambient[id] =   np.float(atmo_data.temperature)
-        pressure_amb[id]        =   np.float(atmo_data.pressure)
+    sound_ambient       =   atmo_data.speed_of_sound
+    density_ambient     =   atmo_data.density
+    viscosity           =   atmo_data.dynamic_viscosity
+    temperature_ambient =   atmo_data.temperature
+    pressure_amb        =   atmo_data.pressure
     
     #Base parameters necessary input for the noise code
     pressure_isa = 101325 #[Pa]
@@ -173,44 +182,10 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
 
     """Starting the main program"""
 
-    #Arrays for the calculation of atmospheric attenuation
-    Acq = np.array((0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.9, 1.2, 1.5, 1.9, 2.5, 2.9, 3.6, 4.9, 6.8))
-    Acf = np.array((0, 0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.3, 1.8, 2.5, 3.0, 4.2, 6.1, 9.0))
-
     #Desired frequency range for noise evaluation
     frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
             2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
 
-
-#Defining each array before the main loop
-    B       = np.zeros(24)
-    theta_p = np.ones(24)*np.pi/2
-    theta_s = np.ones(24)*np.pi/2
-    theta_m = np.ones(24)*np.pi/2
-    EX_p    = np.zeros(24)
-    EX_s    = np.zeros(24)
-    EX_m    = np.zeros(24)
-    exc     = np.zeros(24)
-    SPL_p   = np.zeros(24)
-    SPL_s   = np.zeros(24)
-    SPL_m   = np.zeros(24)
-    PG_p    = np.zeros(24)
-    PG_s    = np.zeros(24)
-    PG_m    = np.zeros(24)
-    
-    dspl_attenuation_p = np.zeros(24)
-    dspl_attenuation_s = np.zeros(24)
-    dspl_attenuation_m = np.zeros(24)
-    
-    SPL_total_history     = np.zeros((nsteps,24))
-    SPL_primary_history   = np.zeros((nsteps,24))
-    SPL_secondary_history = np.zeros((nsteps,24))
-    SPL_mixed_history     = np.zeros((nsteps,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nsteps,24))  
-    SPLt_dBA_max = np.zeros(nsteps)     
-
     # Open output file to print the results
     if ioprint:
         if not filename:
@@ -218,190 +193,187 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
             
         fid      = open(filename,'w')
     
- #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for id in range(0,nsteps):
+    # Jet Flow Parameters
 
-        # Jet Flow Parameters
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gama_primary)
+    Cp  = R_gas/(1-1/gama)
     
-        #Primary and Secondary jets
-        Cpp = R_gas/(1-1/gama_primary)
-        Cp  = R_gas/(1-1/gama)
-        
-        density_primary   = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*Velocity_primary[id]**2/Cpp))
-        density_secondary = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*Velocity_secondary[id]**2/Cp))
-    
-        mass_flow_primary   = Area_primary*Velocity_primary[id]*density_primary
-        mass_flow_secondary = Area_secondary*Velocity_secondary[id]*density_secondary
-    
-        #Mach number of the external flow - based on the aircraft velocity
-        Mach_aircraft[id] = Velocity_aircraft/sound_ambient[id]
-    
-        #Calculation Procedure for the Mixed Jet Flow Parameters
-        Velocity_mixed = (mass_flow_primary*Velocity_primary[id]+mass_flow_secondary*Velocity_secondary[id])/ \
-                (mass_flow_primary+mass_flow_secondary)
-        Temperature_mixed =(mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
-                (mass_flow_primary+mass_flow_secondary)
-        density_mixed = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-        Area_mixed = Area_primary*density_primary*Velocity_primary[id]*(1+(mass_flow_secondary/mass_flow_primary))/ \
-                (density_mixed*Velocity_mixed)
-        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
-    
-        #**********************************************
-        # START OF THE NOISE PROCEDURE CALCULATIONS
-        #**********************************************
-    
-        XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-        if XBPR<0:
-                XBPR=0
-        elif XBPR>4:
-                XBPR=4
-    
-        #Auxiliary parameter defined as DVPS
-        DVPS = np.abs((Velocity_primary[id] - (Velocity_secondary[id]*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
-        if DVPS<0.3:
-            DVPS=0.3
-    
-        # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-        Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-        Str_s = frequency*Diameter_mixed/(Velocity_secondary[id]-Velocity_aircraft) #Secondary jet
-        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
-    
-        #Calculation of the Excitation adjustment parameter
-        #Excitation Strouhal Number
-        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
-        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
-            SX = 0.0
-        else:
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-    
-        #Effectiveness
-        exps = np.exp(-SX)
-    
-        #Spectral Shape Factor
-        exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-    
-        #Fan Duct Lenght Factor
-        exd = np.exp(0.6-(EXA)**0.5)
-    
-        #Excitation source location factor (zk)
-        zk = 1-0.4*(exd)*(exps)    
-
-        #Main loop for the desired polar angles
-
-        theta = angles[id]
-    
-      #Call function noise source location for the calculation of theta
-        thetaj = noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[id],Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary[id],Velocity_secondary[id],Velocity_mixed,Velocity_aircraft,sound_ambient[id],Str_m,Str_s)
-    
-      # Loop for the frequency array range
-        for i in range(0,24):
-               #Calculation of the Directivity Factor
-                if (theta_m[i] <=1.4):
-                    exc[i] = sound_ambient[id]/Velocity_mixed
-                elif (theta_m[i]>1.4):
-                    exc[i] =(sound_ambient[id]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m[i]-1.4))
-    
-                #Acoustic excitation adjustment (EX)
-                EX_m[i] = exd*exs[i]*exc[i]   #mixed component - dependant of the frequency
-        
-        EX_p = +5*exd*exps   #primary component - no frequency dependance
-        EX_s = 2*sound_ambient[id]/(Velocity_secondary[id]*(zk)) #secondary component - no frequency dependance    
-    
-        distance_primary   = distance_microphone[id] 
-        distance_secondary = distance_microphone[id] 
-        distance_mixed     = distance_microphone[id]
-    
-        #Noise attenuation due to Ambient Pressure
-        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/pressure_isa)
-    
-        #Noise attenuation due to Density Gradientes
-        dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id]))
-        dspl_density_s = 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id]))
-        dspl_density_m = 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id]))
-    
-        #Noise attenuation due to Spherical divergence
-        dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
-    
-       #Noise attenuation due to Geometric Near-Field
-        if near_field ==0:
-                dspl_geometric_p = 0.0
-                dspl_geometric_s = 0.0
-                dspl_geometric_m = 0.0
-        elif near_field ==1:
-                dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient[id]/frequency))/distance_primary)
-                dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_secondary)
-                dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_mixed)
-    
-       #Noise attenuation due to Acoustic Near-Field
-        if near_field ==0:
-                dspl_acoustic_p = 0.0;
-                dspl_acoustic_s = 0.0;
-                dspl_acoustic_m = 0.0;
-        elif near_field ==1:
-                dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_primary*frequency))**2)
-                dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_secondary*frequency))**2)
-                dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_mixed*frequency))**2)
-    
-        #Atmospheric attenuation coefficient
-        if tunnel==0:
-                f_primary   = frequency/(1-Mach_aircraft[id]*np.cos(theta_p))
-                f_secondary = frequency/(1-Mach_aircraft[id]*np.cos(theta_s))
-                f_mixed     = frequency/(1-Mach_aircraft[id]*np.cos(theta_m))
-                Aci         = Acf + ((temperature_ambient[id]-0)-15)/10*(Acq-Acf)    
-                
-                Ac_primary   = np.interp(f_primary,frequency,Aci)
-                Ac_secondary = np.interp(f_secondary,frequency,Aci)
-                Ac_mixed     = np.interp(f_mixed,frequency,Aci)
-                
-                 #Atmospheric attenuation
-                delta_atmo = atmospheric_attenuation(distance_primary)
-                
-                dspl_attenuation_p = -delta_atmo 
-                dspl_attenuation_s = -delta_atmo 
-                dspl_attenuation_m = -delta_atmo 
-    
-        elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
-                dspl_attenuation_p = np.zeros(24)
-                dspl_attenuation_s = np.zeros(24)
-                dspl_attenuation_m = np.zeros(24)
-                EX_m = np.zeros(24)
-                EX_p = 0
-                EX_s = 0
-    
-       #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
-        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
-        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
-    
-    
-      #Calculation of interference effects on jet noise
-        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[id],theta_m)
-        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-        Plug    = external_plug_effect(Velocity_primary[id],Velocity_secondary[id], Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient[id], theta_p,theta_s,theta_m)
-        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[id],theta_m,engine_height,Diameter_mixed,frequency)
-    
-      #Calculation of the sound pressure level for each jet component
-        SPL_p = primary_noise_component(SPL_p,Velocity_primary[id],Temperature_primary[id],R_gas,theta_p,DVPS,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
-        
-        SPL_s = secondary_noise_component(SPL_s,Velocity_primary[id],theta_s,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
-        
-        SPL_m = mixed_noise_component(SPL_m,Velocity_primary[id],theta_m,sound_ambient[id],Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp))
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft = Velocity_aircraft/sound_ambient
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/ \
+            (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    #**********************************************
+    # START OF THE NOISE PROCEDURE CALCULATIONS
+    #**********************************************
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5, 0., 4.)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
+    DVPS = np.maximum(DVPS,0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Velocity_secondary-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where(np.logical_and(excitation_Strouhal > 0.25, excitation_Strouhal < 0.5), 0.0, \
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)    
+
+    #Location of the noise sources, each time step starts from the angles of the previous one
+    microphones = angles.shape[:-1]
     
-     #Sum of the Total Noise
-        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+    B       = np.zeros(microphones+(24,))
+    theta_p = np.ones(microphones+(24,))*np.pi/2
+    theta_s = np.ones(microphones+(24,))*np.pi/2
+    theta_m = np.ones(microphones+(24,))*np.pi/2
+    
+    theta_p_history = np.zeros(microphones+(nsteps,24))
+    theta_s_history = np.zeros(microphones+(nsteps,24))
+    theta_m_history = np.zeros(microphones+(nsteps,24))
+    
+    for id in range(0,nsteps):
+        noise_source_location(B,Xo,zk[id,0],Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[...,id,:],Diameter_secondary,angles[...,id,None],theta_s,theta_m,Diameter_mixed[id,0],Velocity_primary[id,0],Velocity_secondary[id,0],Velocity_mixed[id,0],Velocity_aircraft,sound_ambient[id,0],Str_m[id],Str_s[id])
         
-     #Store the SPL history     
-        SPL_total_history[id][:]     = SPL_total[:]
-        SPL_primary_history[id][:]   = SPL_p[:]
-        SPL_secondary_history[id][:] = SPL_s[:]
-        SPL_mixed_history[id][:]     = SPL_m[:]
+        theta_p_history[...,id,:] = theta_p
+        theta_s_history[...,id,:] = theta_s
+        theta_m_history[...,id,:] = theta_m
         
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)          
+    theta_p = theta_p_history
+    theta_s = theta_s_history
+    theta_m = theta_m_history
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4, sound_ambient/Velocity_mixed, \
+                   (sound_ambient/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Velocity_secondary*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance_microphone 
+    distance_secondary = distance_microphone 
+    distance_mixed     = distance_microphone
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+   #Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+            dspl_geometric_p = 0.0
+            dspl_geometric_s = 0.0
+            dspl_geometric_m = 0.0
+    elif near_field ==1:
+            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient/frequency))/distance_primary)
+            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_secondary)
+            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_mixed)
+
+   #Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+            dspl_acoustic_p = 0.0;
+            dspl_acoustic_s = 0.0;
+            dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient/(distance_primary*frequency))**2)
+            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient/(distance_secondary*frequency))**2)
+            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient/(distance_mixed*frequency))**2)
+
+    #Atmospheric attenuation
+    if tunnel==0:
+            delta_atmo = atmospheric_attenuation(distance_primary)
+            
+            dspl_attenuation_p = -delta_atmo 
+            dspl_attenuation_s = -delta_atmo 
+            dspl_attenuation_m = -delta_atmo 
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+            dspl_attenuation_p = np.zeros(theta_m.shape)
+            dspl_attenuation_s = np.zeros(theta_m.shape)
+            dspl_attenuation_m = np.zeros(theta_m.shape)
+            EX_m = np.zeros(theta_m.shape)
+            EX_p = 0
+            EX_s = 0
+
+   #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+
+  #Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Velocity_primary,Velocity_secondary, Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient, theta_p,theta_s,theta_m)
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient,theta_m,engine_height,Diameter_mixed,frequency)
+
+  #Calculation of the sound pressure level for each jet component
+    SPL_p = np.zeros(theta_m.shape)
+    SPL_s = np.zeros(theta_m.shape)
+    SPL_m = np.zeros(theta_m.shape)
+    
+    SPL_p = primary_noise_component(SPL_p,Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
+    
+    #The last band of the primary component carries the level of the previous time step
+    SPL_p[...,23] = np.cumsum(Plug[0][...,23],axis=-1)
+    
+    SPL_s = secondary_noise_component(SPL_s,Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
+    
+    SPL_m = mixed_noise_component(SPL_m,Velocity_primary,theta_m,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+
+ #Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+    
+ #Store the SPL history     
+    SPL_total_history     = SPL_total
+    SPL_primary_history   = SPL_p
+    SPL_secondary_history = SPL_s
+    SPL_mixed_history     = SPL_m
+    
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = dbA_noise(SPL_total_history)
+    SPLt_dBA_max     = np.max(SPLt_dBA_history,axis=-1)
      
     #Calculation of the Perceived Noise Level EPNL based on the sound time history
     PNL_total               =  pnl_noise(SPL_total_history)    
@@ -449,14 +421,14 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
         fid.write('time     	altitude     Mach     Core Velocity   Fan Velocity  Polar angle    Azim angle    distance    Primary	  Secondary 	 Mixed        Total')
         fid.write('\n')
         for id in range (0,nsteps):
-            fid.write(str('%2.2f' % time[id])+'        ')
-            fid.write(str('%2.2f' % Altitude[id])+'        ')
-            fid.write(str('%2.2f' % Mach_aircraft[id])+'        ')
-            fid.write(str('%3.3f' % Velocity_primary[id])+'        ')
-            fid.write(str('%3.3f' % Velocity_secondary[id])+'        ')
+            fid.write(str('%2.2f' % noise_time[id])+'        ')
+            fid.write(str('%2.2f' % Altitude[id,0])+'        ')
+            fid.write(str('%2.2f' % Mach_aircraft[id,0])+'        ')
+            fid.write(str('%3.3f' % Velocity_primary[id,0])+'        ')
+            fid.write(str('%3.3f' % Velocity_secondary[id,0])+'        ')
             fid.write(str('%2.2f' % (angles[id]*180/np.pi))+'        ')
             fid.write(str('%2.2f' % (phi[id]*180/np.pi))+'        ')
-            fid.write(str('%2.2f' % distance_microphone[id])+'        ')
+            fid.write(str('%2.2f' % distance_microphone[id,0])+'        ')
             fid.write(str('%2.2f' % PNLT_primary[id])+'        ')
             fid.write(str('%2.2f' % PNLT_secondary[id])+'        ')
             fid.write(str('%2.2f' % PNLT_mixed[id])+'        ')
@@ -487,9 +459,9 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
             fid.write('\n')
             fid.write('\n')
             fid.write('Emission angle = ' + str(angles[id]*180/np.pi) + '\n')
-            fid.write('Altitude = ' + str(Altitude[id]) + '\n')
-            fid.write('Distance = ' + str(distance_microphone[id]) + '\n')
-            fid.write('Time = ' + str(time[id]) + '\n')
+            fid.write('Altitude = ' + str(Altitude[id,0]) + '\n')
+            fid.write('Distance = ' + str(distance_microphone[id,0]) + '\n')
+            fid.write('Time = ' + str(noise_time[id]) + '\n')
             fid.write('f		Primary  Secondary  	Mixed  		Total' + '\n')
          
        
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -16,103 +17,56 @@ import numpy as np
 
 ## @ingroupMethods-Noise-Fidelity_One-Engine
 def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    
-    #Primary jet source location
-    XJ = np.zeros(24)
-    
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
+    """This function calculates the polar angles of the primary, secondary and mixed jet noise sources
+    for all the frequency bands at once. The angles are found by a fixed point iteration that starts
+    from the angles passed in, which are updated in place. The angles can have a leading axis of
+    observers, with the observer angle theta and distance_microphone in a column."""
 
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
+    theta, distance_microphone = np.broadcast_arrays(theta,distance_microphone,theta_p)[:2]
 
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
-            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
+    #Polar angle of a source located XJ downstream of the nozzle exit
+    def emission_angle(XJ,bands):
+        B[bands] = (1./np.sin(theta[bands]))*(((Xo+XJ)/distance_microphone[bands])+np.cos(theta[bands]))
+        angle    = np.arcsin(((B[bands])**2.+1.)**(-0.5))
         
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
+        return np.where(B[bands]>=0.,angle,np.pi-angle)
+    
+    #Iterates the source location of each band until it moves less than the tolerance
+    def converge(theta_j,XJ,source_location,residual,tolerance):
+        bands      = np.ones(theta_j.shape,dtype=bool)
+        theta_j[bands] = emission_angle(XJ[bands],bands)
+        XJ         = source_location(theta_j)
         
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
+        bands[:] = residual>tolerance
+        while np.any(bands):
+            XJ_old         = XJ[bands]
+            theta1         = theta_j[bands]
+            theta2         = emission_angle(XJ_old,bands)
+            theta_j[bands] = (theta1+theta2)/2.
+            XJ[bands]      = source_location(theta_j)[bands]
+            bands[bands]   = np.abs(XJ_old-XJ[bands])>tolerance
             
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
+        return theta_j
 
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
+    #Primary jet source location
+    def primary_location(theta_j):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_j/np.pi)-9.)+(Area_secondary/Area_primary))
+    
+    converge(theta_p,primary_location(theta_p),primary_location,Diameter_primary,Diameter_primary/200.)
 
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
-            (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
+    #Secondary jet source location
+    def secondary_location(theta_j,diameter=Diameter_mixed):
+        return (zk*diameter)*(2.+1.6*np.arctan((4.5*theta_j/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s))* \
+            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
+    
+    converge(theta_s,secondary_location(theta_s,Diameter_secondary),secondary_location,Diameter_secondary,Diameter_mixed/200.)
 
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
+    #Mixed jet source location
+    def mixed_location(theta_j):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m)+(2.+1.1*np.arctan((18.*theta_j/np.pi)-13.))+\
+            (1.+0.5/np.sqrt(Str_m)))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
             *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
+    
+    converge(theta_m,mixed_location(theta_m),mixed_location,Diameter_mixed,Diameter_mixed/200.)
 
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+    return(theta_p,theta_s,theta_m)
@@ -2,7 +2,7 @@
 # noise_counterplot.py
 # 
 # Created:  Feb 2016, C. Ilario
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -14,7 +14,7 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
-def noise_counterplot(noise_segment,analyses,config):
+def noise_counterplot(noise_segment,analyses,config,microphone_locations=None):
     """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_counterplot(noise_segment,analyses,config):
             Computes the geometric parameters for the noise tools at any microphone potsition, not only the certification points:
             distance and emission angles for both polar and azimuthal angles.
@@ -23,45 +23,39 @@ def noise_counterplot(noise_segment,analyses,config):
                 noise_segment	 - SUAVE type vehicle
                 analyses
                 config
+                microphone_locations - x, altitude and lateral position of one microphone or one row per microphone,
+                                       analyses.mic_array if not given, [meters]
 
             Outputs:
                 dist            - Distance vector from the aircraft position in relation to the microphone coordinates, [meters]
                 theta           - Polar angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
                 phi             - Azimuthal angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
+                                  With several microphones the outputs have one row per microphone.
 
             Assumptions:
                 None."""
     
     #unpack
     position_vector = noise_segment.conditions.frames.inertial.position_vector
-    mic_position = analyses.mic_array
+    if microphone_locations is None:
+        microphone_locations = analyses.mic_array
+    mic_position = np.asarray(microphone_locations,dtype=float)
     
     #X,Y,Z position of the aircraft
     x_aircraft = position_vector[:,0]
     altitude   = - position_vector[:,2]
     z_aircraft = position_vector[:,1]
-    
-
-    n_steps = len(altitude)  #number of time steps (space discretization)
-    
-    # Preparing the matrix: Angles
-    phi = np.zeros(n_steps)
-    theta = np.zeros(n_steps)  
-    
    
-    #X,Y,Z position of each microphone
-    x_mic = np.float(mic_position[0])
-    y_mic = np.float(mic_position[1])
-    z_mic = np.float(mic_position[2])
+    #X,Y,Z position of each microphone, in a column against the time steps
+    x_mic = mic_position[...,0,None]
+    y_mic = mic_position[...,1,None]
+    z_mic = mic_position[...,2,None]
 
     dist = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
     phi   = np.arctan(np.abs(z_mic)/altitude)
 
-    for i in range (0,n_steps):
-        if (x_aircraft[i]-x_mic)< 0.:
-            theta[i] = np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
-        else:
-            theta[i] = np.pi - np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
+    theta = np.arctan(np.abs(altitude/(x_aircraft-x_mic)))
+    theta = np.where((x_aircraft-x_mic)< 0., theta, np.pi - theta)
             
                 
     #Pack the results
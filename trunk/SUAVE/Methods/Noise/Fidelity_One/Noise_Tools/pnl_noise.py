@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,14 +19,15 @@ def pnl_noise (SPL):
     """This method calculates de Perceived Noise Level PNL from a 1/3 octave band noise spectra
 
         Inputs:
-                    SPL                     - Sound Pressure Level in 1/3 octave band
+                    SPL                     - Sound Pressure Level in 1/3 octave band, the last axis are the
+                                              24 bands and the other axes (time, microphones) are kept
 
                 Outputs:
                     PNL                     - Perceived Noise Level"""
     
 
     #Definition of the noisineess matrix for each octave band
-    noy = [[1, 50, 91, 64, 52, 49, 55, 0.043478, 0.030103, 0.07952, 0.058098],
+    noy = np.array([[1, 50, 91, 64, 52, 49, 55, 0.043478, 0.030103, 0.07952, 0.058098],
             [2,	63, 85.9, 60, 51, 44, 51, 0.04057, 0.030103, 0.06816, 0.058098],
             [3,	80, 87.3, 56, 49, 39,	46,	0.036831, 0.030103, 0.06816, 0.052288],
             [4,	100, 	79.9,	53,	47,	34,	42,	0.036831, 0.030103, 0.05964, 0.047534],
@@ -48,44 +50,42 @@ def pnl_noise (SPL):
             [21, 5000, 9999999,	30,	30,	6,	15,	0.02996, 0, 0.053013, 0.034859],
             [22, 6300, 9999999, 31,	31,	10,	17,	0.02996, 0, 0.06816, 0.037349],
             [23, 8000, 44.3, 37, 34, 17, 23, 0.042285, 0.02996, 0.07952, 0.037349],
-            [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
+            [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]])
 
     
     #Defining the necessary arrays for the calculation
-    nsteps  = len(SPL)
-    SPL_noy = np.zeros((nsteps,24))
-    PNL     = np.zeros(nsteps)
+    SPL     = np.asarray(SPL)
+    SPL_noy = np.zeros(SPL.shape)
     
     #-------------------------------------------
     #STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------
     
-    for j in range(0,nsteps):
+    SPL_band = SPL[...,:23]
+    noy      = noy[:23].T
+    noy_band = np.zeros(SPL_band.shape)
     
-        for i in range(0,23):
-            if SPL[j][i]>=noy[1][2]:
-                SPL_noy[j][i] = 10**(noy[i][8]*(SPL[j][i]-noy[i][4]))
-                
-            if SPL[j][i]>=noy[i][3] and SPL[j][i]<noy[i][2]:
-                SPL_noy[j][i] = 10**(noy[i][7]*(SPL[j][i]-noy[i][3]))
-                
-            if SPL[j][i]>=noy[i][6] and SPL[j][i]<noy[i][3]:
-                SPL_noy[j][i] = 0.3*(10**(noy[i][10]*(SPL[j][i]-noy[i][6])))
-                
-            if SPL[j][i]>=noy[i][5] and SPL[j][i]<noy[i][6]:
-                SPL_noy[j][i] = 0.1*(10**(noy[i][9]*(SPL[j][i]-noy[i][5])))
-            
-        #-------------------------------------------  
-        #STEP 2 - Combine perceived noiseness values  
-        #-------------------------------------------
-        max_noy = np.max(SPL_noy[j][:])            
-        Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][:])
+    #The upper range starts at the threshold of the 63 Hz band for all the bands
+    noy_band = np.where(SPL_band>=noy[2][1], 10**(noy[8]*(SPL_band-noy[4])), noy_band)
+    
+    noy_band = np.where(np.logical_and(SPL_band>=noy[3], SPL_band<noy[2]), 10**(noy[7]*(SPL_band-noy[3])), noy_band)
+    
+    noy_band = np.where(np.logical_and(SPL_band>=noy[6], SPL_band<noy[3]), 0.3*(10**(noy[10]*(SPL_band-noy[6]))), noy_band)
+    
+    noy_band = np.where(np.logical_and(SPL_band>=noy[5], SPL_band<noy[6]), 0.1*(10**(noy[9]*(SPL_band-noy[5]))), noy_band)
+    
+    SPL_noy[...,:23] = noy_band
         
-        #-----------------------------------------------------------------
-        #STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-        #------------------------------------------------------------------    
-        if Perceived_noisinees==0:
-            Perceived_noisinees = 0.0625
-        PNL[j] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+    #-------------------------------------------  
+    #STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy = np.max(SPL_noy,axis=-1)
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=-1)
+    
+    #-----------------------------------------------------------------
+    #STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees = np.where(Perceived_noisinees==0, 0.0625, Perceived_noisinees)
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
         
-    return (PNL)
\ No newline at end of file
+    return (PNL)
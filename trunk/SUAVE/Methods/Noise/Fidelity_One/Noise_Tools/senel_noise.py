@@ -2,6 +2,7 @@
 # senel_noise.py
 # 
 # Created:  Jul 2015, C. Ilario
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -15,50 +16,42 @@ import numpy as np
 
 ## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
 def senel_noise(SPLt_dBA_max):
-    """This method calculates de effective perceived noise level (EPNL) based on a time history PNLT
-     (Perceived Noise Level with Tone Correction).
+    """This method calculates the Single Event Noise Exposure Level (SENEL) based on a time history
+     of the maximum A-weighted sound level.
 
         Inputs:
-                    PNLT                     - Perceived Noise Level with Tone Correction
+                    SPLt_dBA_max             - Maximum A-weighted Sound Pressure Level, the last axis is the
+                                               time history and the other axes (microphones) are kept
 
                 Outputs: 
-                    EPNL                     - Effective Perceived Noise Level in EPNdB"""
+                    SENEL                    - Single Event Noise Exposure Level in dBA"""
                     
                     
-    #Maximum PNLT on the time history data    
-    dBA_max = np.max(SPLt_dBA_max)
+    #Maximum dBA on the time history data    
+    SPLt_dBA_max = np.asarray(SPLt_dBA_max)
+    dBA_max      = np.max(SPLt_dBA_max,axis=-1)
     
     #Calculates the number of discrete points on the trajectory
-    nsteps   = len(SPLt_dBA_max)    
-    
-    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(SPLt_dBA_max==0):
-        SENEL = 0
-        return(SENEL)
+    nsteps   = SPLt_dBA_max.shape[-1]
+    step     = np.arange(nsteps)
+    limit    = np.expand_dims(dBA_max-10,-1)
 
-    #Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while SPLt_dBA_max[i]<=(dBA_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
+    #Finding the time duration for the noise history where dBA is higher than the maximum dBA - 10 dB
+    t1 = np.argmax(SPLt_dBA_max>limit,axis=-1) #t1 is the first time interval
 
-    #Correction for PNLTM-10 when it falls outside the limit of the data
-    if SPLt_dBA_max[nsteps-1]>=(dBA_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and SPLt_dBA_max[i]>=(dBA_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval
-                
-    #The time duration where the noise is higher than the maximum PNLT - 10 dB is:
-    time_interval = (t2-t1)*0.5
+    #Correction for dBA max - 10 when it falls outside the limit of the data
+    below = np.logical_and(SPLt_dBA_max<limit,step>np.expand_dims(t1,-1))
+    t2    = np.where(SPLt_dBA_max[...,-1]>=limit[...,0], nsteps-2, np.argmax(below,axis=-1)-1) #t2 is the last time interval
     
-    #Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(SPLt_dBA_max[i]/10)+sumation
+    #Calculates the integral of the dBA which between t1 and t2 points, starting from the point before t1
+    t1       = np.expand_dims(t1,-1)
+    interval = np.logical_and(step>=t1-1,step<=np.expand_dims(t2,-1))
+    interval = np.logical_or(interval,np.logical_and(t1==0,step==nsteps-1))
+    sumation = np.sum(np.where(interval,10**(SPLt_dBA_max/10),0.),axis=-1)
         
     SENEL = 10*np.log10(sumation)
     
-    return (SENEL)    
\ No newline at end of file
+    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    SENEL = np.where(np.all(SPLt_dBA_max==0,axis=-1),0.,SENEL)[()]
+    
+    return (SENEL)
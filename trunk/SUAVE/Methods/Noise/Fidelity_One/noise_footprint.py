@@ -0,0 +1,109 @@
+## @ingroup Methods-Noise-Fidelity_One
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+
+# ----------------------------------------------------------------------
+#  Noise Footprint
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Fidelity_One
+def noise_footprint(config,analyses,noise_segment,microphone_locations,chunk_size=None,engine_flag=1):
+    """Computes the EPNL and SENEL of a flight segment at a set of microphones on the ground, such
+    as a grid for a noise footprint contour. The geometry, the attenuation and the airframe and
+    engine noise of a chunk of microphones are evaluated together as arrays of microphones by time
+    steps by frequency bands, so the size of the chunk bounds the memory used.
+
+    Assumptions:
+    The airframe and engine noise levels are added as incoherent sources, as for the
+    certification points.
+
+    Source:
+    N/A
+
+    Inputs:
+    config                                   [vehicle]
+    analyses.atmosphere                      [analysis]
+    analyses.noise.settings.footprint_chunk_size [int]
+    noise_segment                            [segment results]
+    microphone_locations                     x, altitude and lateral position, one row per microphone [m]
+    chunk_size                               microphones evaluated together, from the settings if not given [int]
+    engine_flag                              include the engine noise, the engine levels are zero if not [int]
+
+    Outputs:
+    footprint.
+      microphone_locations                   [m]
+      EPNL                                   one per microphone [EPNdB]
+      SENEL                                  one per microphone [dBA]
+      airframe.EPNL, airframe.SENEL          [EPNdB], [dBA]
+      engine.EPNL, engine.SENEL              [EPNdB], [dBA]
+
+    Properties Used:
+    N/A
+    """
+
+    turbofan = config.propulsors['turbofan']
+
+    microphone_locations = np.atleast_2d(np.array(microphone_locations,dtype=float))
+    n_mics               = len(microphone_locations)
+
+    if chunk_size is None:
+        chunk_size = analyses.noise.settings.footprint_chunk_size
+
+    airframe_EPNL  = np.zeros(n_mics)
+    airframe_SENEL = np.zeros(n_mics)
+    engine_EPNL    = np.zeros(n_mics)
+    engine_SENEL   = np.zeros(n_mics)
+
+    # the geometry of the segment is replaced chunk by chunk
+    geometry = [noise_segment.get(key,None) for key in ['dist','theta','phi']]
+
+    try:
+        for start in range(0,n_mics,chunk_size):
+            chunk = slice(start,min(start+chunk_size,n_mics))
+            noise_counterplot(noise_segment,analyses,config,microphone_locations[chunk])
+
+            airframe_noise = noise_airframe_Fink(config,analyses,noise_segment)
+            airframe_EPNL[chunk]  = airframe_noise[0]
+            airframe_SENEL[chunk] = airframe_noise[2]
+
+            # the engine levels are left at zero without the engine noise
+            if engine_flag:
+                engine_noise = noise_SAE(turbofan,noise_segment,config,analyses)
+                engine_EPNL[chunk]  = engine_noise[0]
+                engine_SENEL[chunk] = engine_noise[2]
+
+    finally:
+        # restore the geometry of the segment
+        for key, value in zip(['dist','theta','phi'],geometry):
+            if value is None:
+                if key in noise_segment:
+                    del noise_segment[key]
+            else:
+                noise_segment[key] = value
+
+    # pack
+    footprint = Data()
+    footprint.microphone_locations = microphone_locations
+    footprint.EPNL     = 10. * np.log10(10**(airframe_EPNL/10) + engine_flag*10**(engine_EPNL/10))
+    footprint.SENEL    = 10. * np.log10(10**(airframe_SENEL/10) + engine_flag*10**(engine_SENEL/10))
+    footprint.airframe = Data()
+    footprint.airframe.EPNL  = airframe_EPNL
+    footprint.airframe.SENEL = airframe_SENEL
+    footprint.engine   = Data()
+    footprint.engine.EPNL    = engine_EPNL
+    footprint.engine.SENEL   = engine_SENEL
+
+    return footprint
@@ -13,6 +13,8 @@ from .scramjet_sizing import scramjet_sizing
 from .fm_id import fm_id
 from .fm_solver import fm_solver
 from .rayleigh import rayleigh
+from .rotor_forward_flight_inflow import rotor_forward_flight_inflow
+from .solve_mach_number import solve_mach_number
 from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
 from . import electric_motor_sizing
 from .liquid_rocket_sizing import liquid_rocket_sizing
\ No newline at end of file
@@ -3,13 +3,14 @@
 #
 # Created:  Sep 2017, P Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from scipy.optimize import fsolve
+from SUAVE.Methods.Propulsion.solve_mach_number import solve_mach_number
 
 # ----------------------------------------------------------------------
 #  fm_solver
@@ -28,7 +29,7 @@ def fm_solver(area_ratio, M0, gamma):
     area_ratio  [-]
 
     Outputs:
-    M1          [-]
+    M1          [-]  shaped like the inputs broadcast together, at least 1-D
 
     Source:
     https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
@@ -36,20 +37,13 @@ def fm_solver(area_ratio, M0, gamma):
     # Area-Mach Function
     func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
 
-    # Initializing the array
-    M1_guess = np.ones_like(M0)
-
     # Separating supersonic and subsonic solutions
-    i_low = M0 < 1.0
-    i_high = M0 >= 1.0
-
-    # Subsonic solution initialization
-    M1_guess[i_low]= 0.1
+    i_low = np.atleast_1d(M0 < 1.0)
 
-    # Supersonic solution initialization
-    M1_guess[i_high]= 1.1
+    # Subsonic and supersonic solution initialization
+    M1_guess = np.where(i_low,0.1,1.1)
 
     # Solving
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1 = solve_mach_number(func,M1_guess,i_low)
 
     return M1
@@ -2,10 +2,10 @@
 # nozzle_calculations.py
 # 
 # Created:  Sep 2017, P. Goncalves
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 import numpy as np
-from scipy.optimize import fsolve
+from SUAVE.Methods.Propulsion.solve_mach_number import solve_mach_number
 
 # ----------------------------------------------------------------------
 #  nozzle calculations
@@ -30,18 +30,16 @@ def exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
     P0            [Pascals]
     
     Outputs:
-    Me            [dimensionless]      
+    Me            [dimensionless] shaped like the inputs broadcast together, at least 1-D
     
     """
     func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
 
     #Initializing the array
-    Me_initial_guess = np.ones_like(Pt_out) 
-    i_sol = Me_initial_guess < 10.0
-    Me_initial_guess[i_sol] = 0.1
+    Me_initial_guess = 0.1*np.ones_like(Pt_out)
 
     # Solving for Me
-    Me = fsolve(func,Me_initial_guess)
+    Me = solve_mach_number(func,np.atleast_1d(Me_initial_guess))
         
     return Me
         
@@ -61,16 +59,16 @@ def mach_area(area_ratio, gamma, subsonic):
     subsonic      [Boolean]
     
     Outputs:
-    Me            [dimensionless]  
+    Me            [dimensionless] shaped like area_ratio and gamma broadcast together, at least 1-D
     
     """
-    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
+    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))
     if subsonic:
         Me_initial_guess = 0.01
     else:
         Me_initial_guess = 2.0         
         
-    Me = fsolve(func,Me_initial_guess, factor = 0.1)
+    Me = solve_mach_number(func,np.atleast_1d(Me_initial_guess),subsonic)
 
     return Me
 
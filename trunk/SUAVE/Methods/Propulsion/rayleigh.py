@@ -3,10 +3,11 @@
 # 
 # Created:  Aug 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 import numpy as np
 
-from scipy.optimize import fsolve
+from SUAVE.Methods.Propulsion.solve_mach_number import solve_mach_number
 
 # ----------------------------------------------------------------------
 #  rayleigh
@@ -26,28 +27,21 @@ def rayleigh(gamma, M0, TtR):
     Ttr     [dimensionless]
     
     Outputs:
-    M1      [dimensionless]
+    M1      [dimensionless] shaped like the inputs broadcast together, at least 1-D
     Ptr     [dimensionless]
     
     """
 
     func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
 
-    #Initializing the array
-    M1_guess = np.ones_like(M0)
-    
     # Separating supersonic and subsonic solutions
-    i_low = M0 <= 1.0
-    i_high = M0 > 1.0
+    i_low = np.atleast_1d(M0 <= 1.0)
 
-    #--Subsonic solution Guess
-    M1_guess[i_low]= .01
-    
-    #--Supersonic solution Guess
-    M1_guess[i_high]= 1.1
+    #--Subsonic and supersonic solution guess
+    M1_guess = np.where(i_low,.01,1.1)
 
     # Find Mach number
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1 = solve_mach_number(func,M1_guess,i_low)
     
     #Calculate stagnation pressure ratio
     Ptr = ((1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.)))
@@ -0,0 +1,78 @@
+## @ingroup Methods-Propulsion
+# rotor_forward_flight_inflow.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.optimize import fsolve
+
+# ----------------------------------------------------------------------
+#  rotor_forward_flight_inflow
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def rotor_forward_flight_inflow(V_inf,Vh,tol=1e-12,max_iterations=50):
+    """Solves the momentum theory induced velocity of a rotor in forward flight,
+
+        vi - Vh**2/sqrt(Vz**2 + (Vx + vi)**2) = 0,
+
+    for all control points at once with a Newton iteration. Each point starts from
+    its axial velocity and stops iterating once its step is below the tolerance.
+    Points that do not converge are solved with fsolve.
+
+    Assumptions:
+    Momentum theory
+
+    Source:
+    Leishman, J. G., "Principles of Helicopter Aerodynamics", 2006
+
+    Inputs:
+    V_inf            freestream velocity in the thrust frame   [m/s]
+    Vh               induced hover velocity                    [m/s]
+    tol              relative tolerance on the Newton step     [-]
+    max_iterations                                             [-]
+
+    Outputs:
+    vi               induced velocity, one per row of V_inf    [m/s]
+
+    Properties Used:
+    N/A
+    """
+
+    V_inf = np.atleast_2d(V_inf)
+    Vx    = V_inf[:,0]
+    Vz    = V_inf[:,2]
+    Vh2   = Vh*Vh
+
+    vi     = np.array(Vx,dtype=float)
+    active = np.arange(len(vi))
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+        for _ in range(max_iterations):
+            if not len(active):
+                break
+
+            Vxa = Vx[active] + vi[active]
+            s   = np.sqrt(Vz[active]**2 + Vxa**2)
+            f   = vi[active] - Vh2/s
+            df  = 1. + Vh2*Vxa/(s*s*s)
+            dv  = f/df
+
+            vi[active] = vi[active] - dv
+
+            done   = np.abs(dv) <= tol*(1. + np.abs(vi[active]))
+            done   = np.logical_or(done,np.logical_not(np.isfinite(dv)))
+            active = active[np.logical_not(done)]
+
+    # fall back to the scalar solver where the iteration failed
+    failed = np.logical_not(np.isfinite(vi))
+    failed[active] = True
+    for i in np.where(failed)[0]:
+        func  = lambda v: v - Vh2/(np.sqrt(Vz[i]**2 + (Vx[i] + v)**2))
+        vi[i] = fsolve(func,Vx[i])[0]
+
+    return vi
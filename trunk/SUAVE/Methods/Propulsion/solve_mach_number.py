@@ -0,0 +1,105 @@
+## @ingroup Methods-Propulsion
+# solve_mach_number.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# smallest and largest Mach numbers bracketing a solution
+Mach_min = 1e-9
+Mach_max = 100.
+
+# ----------------------------------------------------------------------
+#  solve_mach_number
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def solve_mach_number(func, M_guess, subsonic=None, tol=1e-12, max_iterations=100):
+    """Solves a set of independent compressible flow relations func(M) = 0 for the
+    Mach number of each element. The relations do not depend on each other, so every
+    element takes its own Newton step with a finite difference derivative of its own
+    residual. The cost is linear in the number of elements.
+
+    The subsonic flag selects the branch of the solution. Subsonic elements are
+    bracketed by (0,1] and supersonic elements by [1,100]. If no flag is given the
+    whole (0,100] range is used. Newton steps that leave the bracket are replaced by
+    bisection. Elements whose bracket does not contain a sign change take plain
+    Newton steps from the guess.
+
+    Assumptions:
+    func is elementwise and vectorized
+
+    Source:
+    Press, W. H., et al., "Numerical Recipes", 3rd ed., 2007, sec. 9.4 (rtsafe)
+
+    Inputs:
+    func            residual of the relations          [function]
+    M_guess         initial Mach numbers               [-]
+    subsonic        branch of each solution            [Boolean]
+    tol             relative tolerance on the step     [-]
+    max_iterations                                     [-]
+
+    Outputs:
+    M               Mach numbers                       [-]
+
+    Properties Used:
+    N/A
+    """
+
+    with np.errstate(all='ignore'):
+        M = np.array(M_guess,dtype=float)
+        if subsonic is None:
+            lower = Mach_min
+            upper = Mach_max
+        else:
+            lower = np.where(subsonic,Mach_min,1.)
+            upper = np.where(subsonic,1.,Mach_max)
+
+        # the relations may broadcast against their own inputs
+        f_lower = func(lower + 0.*M)
+        f_upper = func(upper + 0.*M)
+        shape   = np.broadcast(M,f_lower,f_upper).shape
+        M       = np.broadcast_to(M,shape).copy()
+        lower   = np.broadcast_to(lower,shape).copy()
+        upper   = np.broadcast_to(upper,shape).copy()
+        f_lower = np.broadcast_to(f_lower,shape)
+
+        bracketed = np.sign(f_lower)*np.sign(f_upper) < 0.
+        M[bracketed] = np.clip(M,lower,upper)[bracketed]
+        active    = np.ones(shape,dtype=bool)
+
+        for _ in range(max_iterations):
+            f  = func(M)
+            h  = 1e-7*np.abs(M) + 1e-12
+            df = (func(M + h) - f)/h
+
+            # shrink the brackets around the roots
+            below = np.logical_and(bracketed,np.sign(f) == np.sign(f_lower))
+            above = np.logical_and(bracketed,np.logical_not(below))
+            lower[below] = M[below]
+            upper[above] = M[above]
+
+            # Newton step, bisecting where it leaves the bracket
+            M_new  = M - f/df
+            inside = np.logical_and(M_new >= lower,M_new <= upper)
+            bisect = np.logical_and(bracketed,np.logical_not(inside))
+            M_new[bisect] = 0.5*(lower[bisect] + upper[bisect])
+
+            # unbracketed Mach numbers stay positive
+            negative = np.logical_and(np.logical_not(bracketed),np.logical_not(M_new > 0.))
+            M_new[negative] = 0.5*M[negative]
+
+            # exact roots are kept
+            M_new[f == 0.] = M[f == 0.]
+
+            step      = np.abs(M_new - M)
+            M[active] = M_new[active]
+            active    = np.logical_and(active,step > tol*np.abs(M))
+            if not np.any(active):
+                break
+
+    return M
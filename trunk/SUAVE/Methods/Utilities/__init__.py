@@ -6,4 +6,5 @@ from . import Chebyshev
 from . import soft_max
 #import Utilities
 from . import latin_hypercube_sampling
-from . import Cubic_Spline_Blender
\ No newline at end of file
+from . import Cubic_Spline_Blender
+from . import hash_data
\ No newline at end of file
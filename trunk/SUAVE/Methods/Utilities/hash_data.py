@@ -0,0 +1,95 @@
+## @ingroup Methods-Utilities
+# hash_data.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import hashlib
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  hash_data Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def hash_data(*items):
+    """Computes a content hash of SUAVE data structures. Two structures with the same
+    keys and values give the same hash, so it can be used to detect changes to a geometry.
+
+    Assumptions:
+    Hidden keys (starting with '_') are skipped. Functions and other objects only
+    contribute their type name.
+
+    Source:
+    N/A
+
+    Inputs:
+    items   [Data, arrays, numbers, strings, lists]
+
+    Outputs:
+    key     [string] hex digest
+
+    Properties Used:
+    N/A
+    """
+
+    sha = hashlib.sha1()
+    for item in items:
+        update_hash(sha,item)
+
+    return sha.hexdigest()
+
+## @ingroup Methods-Utilities
+def update_hash(sha,v):
+    """Recursively feeds a value into a hash.
+
+    Assumptions:
+    Keys are sorted so the hash does not depend on the order of a dict
+
+    Source:
+    N/A
+
+    Inputs:
+    sha     [hashlib hash]
+    v       [any]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    if isinstance(v,dict):
+        sha.update(b'{')
+        for k in sorted(v.keys(),key=str):
+            if isinstance(k,str) and k.startswith('_'):
+                continue
+            sha.update(str(k).encode())
+            sha.update(b':')
+            update_hash(sha,v[k])
+        sha.update(b'}')
+    elif isinstance(v,np.ndarray):
+        sha.update(str(v.dtype).encode())
+        sha.update(str(v.shape).encode())
+        if v.dtype == object:
+            for x in v.ravel():
+                update_hash(sha,x)
+        else:
+            sha.update(np.ascontiguousarray(v).tobytes())
+    elif isinstance(v,(list,tuple)):
+        sha.update(b'[')
+        for x in v:
+            update_hash(sha,x)
+            sha.update(b',')
+        sha.update(b']')
+    elif v is None or isinstance(v,(bool,int,float,complex,str,bytes,np.generic)):
+        sha.update(type(v).__name__.encode())
+        sha.update(repr(v).encode())
+    else:
+        sha.update(type(v).__name__.encode())
+
+    return
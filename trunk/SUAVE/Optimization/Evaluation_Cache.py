@@ -0,0 +1,243 @@
+## @ingroup Optimization
+# Evaluation_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import numpy as np
+from collections import OrderedDict
+
+from SUAVE.Methods.Utilities.hash_data import hash_data
+
+# ----------------------------------------------------------------------
+#  Evaluation_Cache Class
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+class Evaluation_Cache(object):
+    """Keeps the outcome of the most recent evaluations of a nexus, so design points that an
+        optimizer comes back to are not run through the procedure again. Entries are keyed on the
+        input values and the fidelity level and the least recently used entries are dropped once
+        there are more than size of them. If a directory is given, dropped entries are written
+        there and read back when they are needed again. The cache is off until size is set, as
+        each stored and each restored evaluation copies the results and the summary.
+
+        This is a plain object rather than a Data, so printing or archiving a nexus skips it.
+
+        Assumptions:
+        The outcome of an evaluation only depends on the inputs and the fidelity level
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,size=0,directory=None):
+        """Creates an empty cache
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            size               [int]
+            directory          [str]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.size      = size
+        self.directory = directory
+        self.entries   = OrderedDict()
+        self.spilled   = set()
+        self.current   = None
+        self.hits      = 0
+        self.misses    = 0
+
+    def key(self,inputs,fidelity_level):
+        """Hashes the input values and the fidelity level of an evaluation
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            inputs             [array] the inputs table of the optimization problem
+            fidelity_level     [int]
+
+            Outputs:
+            key                [str]
+
+            Properties Used:
+            None
+        """
+        values = np.array(inputs[:,1],dtype=float)
+
+        return hash_data(values,fidelity_level)
+
+    def get(self,key):
+        """Looks up an evaluation and counts the hit or the miss
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                [str]
+
+            Outputs:
+            entry              [Data] or None
+
+            Properties Used:
+            self.entries
+            self.spilled
+        """
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if key in self.spilled:
+            with open(self.filename(key),'rb') as f:
+                entry = pickle.load(f)
+            self.hits += 1
+            self.store(key,entry)
+            return entry
+
+        self.misses += 1
+
+        return None
+
+    def store(self,key,entry):
+        """Adds an evaluation, dropping or spilling the least recently used ones
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                [str]
+            entry              [Data]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.size
+            self.directory
+        """
+
+        if self.size <= 0:
+            return
+
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.size:
+            old_key, old_entry = self.entries.popitem(last=False)
+            if self.directory is not None and not old_key in self.spilled:
+                self.spill(old_key,old_entry)
+
+        return
+
+    def spill(self,key,entry):
+        """Writes an evaluation to the cache directory
+
+            Assumptions:
+            Processes sharing the directory write the same entry for the same key
+
+            Source:
+            N/A
+
+            Inputs:
+            key                [str]
+            entry              [Data]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.directory
+        """
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        filename = self.filename(key)
+        temporary_filename = filename + '.' + str(os.getpid())
+        with open(temporary_filename,'wb') as f:
+            pickle.dump(entry,f,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_filename,filename)
+
+        self.spilled.add(key)
+
+        return
+
+    def filename(self,key):
+        """The file of a spilled evaluation
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                [str]
+
+            Outputs:
+            filename           [str]
+
+            Properties Used:
+            self.directory
+        """
+
+        return os.path.join(self.directory,key + '.pkl')
+
+    def clear(self):
+        """Forgets all the evaluations, removing the spilled ones, and resets the counters
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        for key in self.spilled:
+            filename = self.filename(key)
+            if os.path.isfile(filename):
+                os.remove(filename)
+
+        self.entries.clear()
+        self.spilled.clear()
+        self.current = None
+        self.hits   = 0
+        self.misses = 0
+
+        return
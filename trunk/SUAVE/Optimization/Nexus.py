@@ -5,6 +5,7 @@
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
 #           Jul 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,8 @@ from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Process
 from copy import deepcopy
 from . import helper_functions as help_fun
+from .Evaluation_Cache import Evaluation_Cache
+from SUAVE.Methods.Missions.Segments.Common.Sub_Segments import Process_Pool
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -69,13 +72,22 @@ class Nexus(Data):
         self.last_fidelity          = None
         self.evaluation_count       = 0
         self.force_evaluate         = False
+        
+        # design points of evaluate_batch are evaluated in parallel if this is more than one
+        self.number_of_processes    = 1
+        self.process_pool           = Process_Pool()
+        
+        # the most recent evaluations, off unless evaluation_cache.size is set, see Evaluation_Cache
+        self.evaluation_cache       = Evaluation_Cache()
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
-            If the last time you ran this the inputs were the same, a cache is used.
+            If the evaluation cache is on and the inputs were run before, the results, the summary
+            and the outputs that were read after that run are taken from the cache instead.
     
             Assumptions:
-            None
+            A cached evaluation leaves the vehicle configurations, the analyses and the missions
+            as the last run left them
     
             Source:
             N/A
@@ -92,16 +104,33 @@ class Nexus(Data):
         
         self.unpack_inputs(x)
         
+        if self.force_evaluate == True:
+            self._really_evaluate()
+            return
+        
+        cache = self.evaluation_cache
+        
         # Check if last call was the same
         if np.all(self.optimization_problem.inputs==self.last_inputs) \
-           and self.last_fidelity == self.fidelity_level \
-           and self.force_evaluate == False:
-            pass
-        else:
+           and self.last_fidelity == self.fidelity_level:
+            if cache.size > 0:
+                cache.hits += 1
+            return
+        
+        # Check if the inputs were run before
+        if cache.size <= 0:
             self._really_evaluate()
+            return
+        
+        key   = cache.key(self.optimization_problem.inputs,self.fidelity_level)
+        entry = cache.get(key)
+        if entry is None:
+            self._really_evaluate(key)
+        else:
+            self.restore_evaluation(entry)
         
     
-    def _really_evaluate(self):
+    def _really_evaluate(self,key = None):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
             This steps through like a process through the nexus, and stores the results.
     
@@ -112,7 +141,7 @@ class Nexus(Data):
             N/A
     
             Inputs:
-            None
+            key     [str] evaluation cache key of the inputs
     
             Outputs:
             None
@@ -125,7 +154,7 @@ class Nexus(Data):
         
         self.evaluation_count += 1
         
-        for key,step in nexus.procedure.items():
+        for key_step,step in nexus.procedure.items():
             if hasattr(step,'evaluate'):
                 self = step.evaluate(nexus)
             else:
@@ -135,6 +164,106 @@ class Nexus(Data):
         # Store to cache
         self.last_inputs   = deepcopy(self.optimization_problem.inputs)
         self.last_fidelity = self.fidelity_level
+        
+        cache = self.evaluation_cache
+        cache.current = None
+        if cache.size > 0:
+            if key is None:
+                key = cache.key(self.optimization_problem.inputs,self.fidelity_level)
+            cache.current = self.evaluation_snapshot()
+            cache.store(key,cache.current)
+            
+    def evaluation_snapshot(self):
+        """Copies the results and the summary after an evaluation. The outputs are added by
+            record_outputs when the objective and the constraints are read.
+    
+            Assumptions:
+            The objective and the constraints only depend on the results, the summary and the 
+            values their aliases point to
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            snapshot           [Data]
+    
+            Properties Used:
+            None
+        """   
+        
+        snapshot = Data()
+        snapshot.results = deepcopy(self.results)
+        snapshot.summary = deepcopy(self.summary)
+        snapshot.outputs = Data()
+        
+        return snapshot
+    
+    def record_outputs(self,table,values):
+        """Adds the objective or constraint values that were just read to the cached evaluation of
+            the last run. Nothing is recorded after a cached evaluation was restored, since the
+            values the aliases point to outside of the results and the summary are stale then.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            table              [array] objective or constraints table
+            values             [vector]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """   
+        
+        snapshot = self.evaluation_cache.current
+        if snapshot is None:
+            return
+        
+        names = np.atleast_2d(table)[:,0]
+        for name, value in zip(names,np.atleast_1d(values)):
+            snapshot.outputs[name] = value
+    
+    def restore_evaluation(self,snapshot):
+        """Puts a cached evaluation back into the nexus, as if the inputs had just been run.
+            Only the results, the summary and the recorded outputs are put back; the vehicle
+            configurations, the analyses and the missions are left as the last run left them.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            snapshot           [Data]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """   
+        
+        self.results = deepcopy(snapshot.results)
+        self.summary = deepcopy(snapshot.summary)
+        
+        if len(snapshot.outputs):
+            names  = np.array(list(snapshot.outputs.keys()),dtype=object).reshape((-1,1))
+            values = np.array(list(snapshot.outputs.values()),dtype=float)
+            help_fun.set_values(self,names,values,self.optimization_problem.aliases)
+        
+        self.last_inputs   = deepcopy(self.optimization_problem.inputs)
+        self.last_fidelity = self.fidelity_level
+        
+        self.evaluation_cache.current = None
           
     
     def objective(self,x = None):
@@ -163,6 +292,7 @@ class Nexus(Data):
         results     = self.results
     
         objective_value  = help_fun.get_values(self,objective,aliases)  
+        self.record_outputs(objective,objective_value)
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective.astype('Float64') 
@@ -205,6 +335,7 @@ class Nexus(Data):
 
             # get constaint values 
             constraint_values = help_fun.get_values(self,iqconstraints,aliases)          
+            self.record_outputs(iqconstraints,constraint_values)
             
             # scale bounds 
             scaled_bnd_constraints  = help_fun.scale_const_bnds(iqconstraints)
@@ -258,6 +389,7 @@ class Nexus(Data):
             scaled_constraints = []
         else:
             constraint_values  = help_fun.get_values(self,eqconstraints,aliases)
+            self.record_outputs(eqconstraints,constraint_values)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values) - help_fun.scale_const_bnds(eqconstraints)
 
         return scaled_constraints   
@@ -288,6 +420,7 @@ class Nexus(Data):
         results     = self.results
     
         constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        self.record_outputs(constraints,constraint_values)
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values) 
 
         return scaled_constraints     
@@ -376,17 +509,12 @@ class Nexus(Data):
         inplen = len(inpu)
         conlen = len(const)
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
+        con2 = (con*np.ones((inplen,conlen)))
         
-        con2 = (con*np.ones_like(jac_con))
+        # perturb one input per design point
+        X = np.asarray(x)*np.ones((inplen,inplen)) + diff_interval*np.eye(inplen)
         
-        for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+        grad_obj, jac_con = self.evaluate_batch(X)
         
         grad_obj = (grad_obj - obj)/diff_interval
         
@@ -397,6 +525,69 @@ class Nexus(Data):
         
         return grad_obj, jac_con
     
+    def evaluate_batch(self,X):
+        """Evaluates the objective and all the constraints at many design points. If
+            number_of_processes is more than one, the points are split between a pool of worker
+            processes. The pool is kept between calls and each worker keeps the copy of the
+            nexus it got when the pool was started, see close_pool. Otherwise the points are
+            evaluated one after the other in this nexus.
+    
+            Assumptions:
+            The procedure does not depend on the order the points are evaluated in. A procedure
+            that writes its results to a file has each worker append to the same file.
+            The workers only take the design vector and the fidelity level from this nexus.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X                  [array] one scaled design vector per row
+    
+            Outputs:
+            objectives         [array] one scaled objective per design vector
+            constraints        [array] scaled constraints, one row per design vector
+    
+            Properties Used:
+            self.number_of_processes
+        """   
+        
+        X = np.atleast_2d(np.asarray(X,dtype=float))
+        
+        number_of_processes = self.number_of_processes
+        if not number_of_processes or number_of_processes <= 1 or len(X) <= 1:
+            outputs = [evaluate_design_point(self,x) for x in X]
+        else:
+            pool    = self.process_pool.get(number_of_processes,initialize_worker,(self,))
+            outputs = pool.map(evaluate_worker_design_point,[(x,self.fidelity_level) for x in X])
+            self.evaluation_count += len(X)
+                
+        objectives  = np.array([output[0] for output in outputs],dtype=float).reshape(len(X))
+        constraints = np.array([output[1] for output in outputs],dtype=float).reshape(len(X),-1)
+        
+        return objectives, constraints
+    
+    def close_pool(self):
+        """Stops the worker processes of evaluate_batch. The next parallel evaluate_batch starts
+            a new pool with a new copy of the nexus, so this is also needed after the nexus is
+            changed other than through the design vector or the fidelity level.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """   
+        
+        self.process_pool.close()
     
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
@@ -439,7 +630,86 @@ class Nexus(Data):
         print(const_table)
         
         return inpu,const_table
-                               
-        
+
+# ----------------------------------------------------------------------
+#  Batch Evaluation Helpers
+# ----------------------------------------------------------------------
+
+# the copy of the nexus in each worker process
+worker_nexus = None
+
+## @ingroup Optimization
+def evaluate_design_point(nexus,x):
+    """Evaluates the objective and all the constraints at one design point
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        nexus              [Nexus()]
+        x                  [vector]
+    
+        Outputs:
+        objective          [float]
+        constraints        [vector]
+    
+        Properties Used:
+        None
+    """   
+    
+    objective   = nexus.objective(x)
+    constraints = nexus.all_constraints(x)
+    
+    return objective, constraints
+
+## @ingroup Optimization
+def initialize_worker(nexus):
+    """Keeps the copy of the nexus a worker process evaluates its design points with
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        nexus              [Nexus()]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        None
+    """   
+    
+    global worker_nexus
+    worker_nexus = nexus
+    
+## @ingroup Optimization
+def evaluate_worker_design_point(point):
+    """Evaluates a design point with the nexus of the worker process
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        point              [tuple] design vector and fidelity level
+    
+        Outputs:
+        objective          [float]
+        constraints        [vector]
+    
+        Properties Used:
+        None
+    """   
+    
+    x, fidelity_level = point
+    worker_nexus.fidelity_level = fidelity_level
     
- 
+    return evaluate_design_point(worker_nexus,x)
@@ -2,6 +2,7 @@
 # particle_swarm_optimization.py
 # 
 # Created:  Sep. 2019, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,11 +11,15 @@
 # suave imports
 import numpy as np
 import scipy as sp
+import multiprocessing
+import pickle
+import warnings
  
 ## @ingroup Optimization-Package_Setups
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, vectorized=False, f_batch=None,
+        number_of_processes=1, seed=None):
     """
     This function perform a particle swarm optimization (PSO)
     
@@ -41,6 +46,16 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        vectorized: If True, the whole swarm is moved at once and then evaluated as a population. The swarm's
+                    best position is updated once per iteration instead of after every particle (Default: False)    [boolean]
+        f_batch   : Returns the objective values and a 2-D array of inequality constraints, one row per particle,
+                    of a population of particles. Only used if vectorized. If f_batch is not given the objective
+                    and the constraints of each particle are evaluated together (Default: None)                     [function]
+        number_of_processes : The number of processes the particles are evaluated over when vectorized and no
+                    f_batch is given. Unless the processes are forked, the functions and their arguments
+                    must be picklable, otherwise the particles are evaluated here (Default: 1)                     [int]
+        seed      : Seed of the random numbers of the search. If None the global numpy random state is used
+                    (Default: None)                                                                                 [int]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -110,10 +125,34 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         check = np.all(cons(x)>=0)
         return check
         
+    # Random numbers of the search
+    if seed is None:
+        random = np.random
+    else:
+        random = np.random.RandomState(seed)
+
+    if vectorized:
+        if f_batch is not None:
+            population = lambda X: f_batch(X, *args, **kwargs)
+            return vectorized_particle_swarm(population, lb, ub, random, swarmsize, omega, phip, phig,
+                                             maxiter, minstep, minfunc, debug)
+        
+        # one pool of processes for the whole search
+        particle = Particle_Function(func, ieqcons, f_ieqcons, args, kwargs)
+        pool     = start_population_pool(particle, number_of_processes)
+        try:
+            population = lambda X: evaluate_population(particle, X, pool)
+            return vectorized_particle_swarm(population, lb, ub, random, swarmsize, omega, phip, phig,
+                                             maxiter, minstep, minfunc, debug)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
     # Initialize the particle swarm ############################################
     S = swarmsize
     D = len(lb)  # the number of dimensions each particle has
-    x = np.random.rand(S, D)  # particle positions
+    x = random.rand(S, D)  # particle positions
     v = np.zeros_like(x)  # particle velocities
     p = np.zeros_like(x)  # best particle positions
     fp = np.zeros(S)  # best particle function values
@@ -142,13 +181,13 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
             g = p[i, :].copy()
        
         # Initialize the particle's velocity
-        v[i, :] = vlow + np.random.rand(D)*(vhigh - vlow)
+        v[i, :] = vlow + random.rand(D)*(vhigh - vlow)
        
     # Iterate until termination criterion met ##################################
     it = 1
     while it<=maxiter:
-        rp = np.random.uniform(size=(S, D))
-        rg = np.random.uniform(size=(S, D))
+        rp = random.uniform(size=(S, D))
+        rg = random.uniform(size=(S, D))
         for i in range(S):
 
             # Update the particle's velocity
@@ -197,3 +236,309 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         print("However, the optimization couldn't find a feasible design. Sorry")
     return g, fg
 
+## @ingroup Optimization-Package_Setups
+def vectorized_particle_swarm(population, lb, ub, random, swarmsize, omega, phip, phig, maxiter,
+                              minstep, minfunc, debug):
+    """
+    This function performs the particle swarm optimization with the whole swarm at once. All
+    the particles are moved with array operations and then evaluated as one population, so the
+    swarm's best position is updated once per iteration.
+
+    Assumptions:
+        The random numbers are drawn in the same order as the particle by particle search
+
+    Source:
+        Pyswarm: https://github.com/tisimst/pyswarm
+
+    Inputs:
+        population : Returns the objective values and inequality constraints of a population         [function]
+        lb         : The lower bounds of the design variable(s)                                      [array]
+        ub         : The upper bounds of the design variable(s)                                      [array]
+        random     : Random number generator                                                        [RandomState]
+        swarmsize, omega, phip, phig, maxiter, minstep, minfunc, debug : see particle_swarm_optimization
+
+    Outputs:
+        g          : The swarm's best known position (optimal design)                                [array]
+        f          : The objective value at ``g``                                                    [float]
+
+    Properties Used:
+        None
+    """
+
+    vhigh = np.abs(ub - lb)
+    vlow  = -vhigh
+
+    def evaluate(X):
+        objectives, constraints = population(X)
+        objectives  = np.asarray(objectives,dtype=float).reshape(len(X))
+        constraints = np.asarray(constraints,dtype=float)
+        if constraints.size:
+            feasible = np.all(constraints.reshape(len(X),-1)>=0, axis=1)
+        else:
+            feasible = np.ones(len(X),dtype=bool)
+        return objectives, feasible
+
+    # Initialize the particle swarm ############################################
+    S = swarmsize
+    D = len(lb)  # the number of dimensions each particle has
+    x = lb + random.rand(S, D)*(ub - lb)  # particle positions
+    p = x.copy()  # best particle positions
+    fp, feasible = evaluate(p)  # best particle function values
+    v = vlow + random.rand(S, D)*(vhigh - vlow)  # particle velocities
+
+    # At the start, there may not be any feasible starting point, so just
+    # give it a temporary "best" point since it's likely to change
+    g  = p[0, :].copy()  # best swarm position
+    fg = 1e100  # artificial best swarm position starting value
+    if np.any(feasible):
+        i  = np.argmin(np.where(feasible, fp, np.inf))
+        if fp[i]<fg:
+            g  = p[i, :].copy()
+            fg = fp[i]
+    found = fg<1e100
+
+    # Iterate until termination criterion met ##################################
+    it = 1
+    while it<=maxiter:
+        rp = random.uniform(size=(S, D))
+        rg = random.uniform(size=(S, D))
+
+        # Update the particles' velocities and positions, correcting lower and
+        # upper bound violations, then update the objective function values
+        v  = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+        x  = np.clip(x + v, lb, ub)
+        fx, feasible = evaluate(x)
+
+        # Compare particles' best positions (if constraints are satisfied)
+        improved = np.logical_and(fx<fp, feasible)
+        p[improved]  = x[improved]
+        fp[improved] = fx[improved]
+
+        # Compare swarm's best position to the best improved particle
+        if np.any(improved):
+            i = np.argmin(np.where(improved, fx, np.inf))
+            if fx[i]<fg:
+                if debug:
+                    print('New best for swarm at iteration {:}: {:} {:}'.format(it, x[i, :], fx[i]))
+
+                tmp = x[i, :].copy()
+                stepsize = np.sqrt(np.sum((g-tmp)**2))
+                if np.abs(fg - fx[i])<=minfunc:
+                    print('Stopping search: Swarm best objective change less than {:}'.format(minfunc))
+                    return tmp, fx[i]
+                elif stepsize<=minstep:
+                    print('Stopping search: Swarm best position change less than {:}'.format(minstep))
+                    return tmp, fx[i]
+                else:
+                    g  = tmp.copy()
+                    fg = fx[i]
+                    found = True
+
+        if debug:
+            print('Best after iteration {:}: {:} {:}'.format(it, g, fg))
+        it += 1
+
+    print('Stopping search: maximum iterations reached --> {:}'.format(maxiter))
+
+    if not found:
+        print("However, the optimization couldn't find a feasible design. Sorry")
+    return g, fg
+
+# ----------------------------------------------------------------------
+#  Population Evaluation
+# ----------------------------------------------------------------------
+
+# the particle function of each worker process
+worker_function = None
+
+## @ingroup Optimization-Package_Setups
+class Particle_Function(object):
+    """
+    The objective and the constraints of a particle, as the particle swarm optimization sees
+    them. This is a class at the module level so that it can be pickled for worker processes
+    whenever the functions and the arguments it keeps can be.
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+    """
+
+    def __init__(self, func, ieqcons, f_ieqcons, args, kwargs):
+        """
+        Keeps the functions and their arguments
+
+        Assumptions:
+            None
+
+        Source:
+            N/A
+
+        Inputs:
+            func, ieqcons, f_ieqcons, args, kwargs : see particle_swarm_optimization
+
+        Outputs:
+            None
+
+        Properties Used:
+            None
+        """
+        self.func      = func
+        self.ieqcons   = ieqcons
+        self.f_ieqcons = f_ieqcons
+        self.args      = args
+        self.kwargs    = kwargs
+
+    def __call__(self, x):
+        """
+        Evaluates a particle
+
+        Assumptions:
+            None
+
+        Source:
+            N/A
+
+        Inputs:
+            x               [array]
+
+        Outputs:
+            objective       [float]
+            constraints     [array]
+
+        Properties Used:
+            None
+        """
+        args   = self.args
+        kwargs = self.kwargs
+
+        objective = self.func(x, *args, **kwargs)
+        if self.f_ieqcons is not None:
+            constraints = np.array(self.f_ieqcons(x, *args, **kwargs))
+        elif len(self.ieqcons):
+            constraints = np.array([y(x, *args, **kwargs) for y in self.ieqcons])
+        else:
+            constraints = np.array([0])
+
+        return objective, constraints
+
+## @ingroup Optimization-Package_Setups
+def start_population_pool(function, number_of_processes):
+    """
+    Starts the pool of processes that evaluates the populations of a search. Without forked
+    processes the function is pickled for the workers, if it can not be the particles are
+    evaluated in this process instead.
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        function            : Returns the objective value and the constraints of a particle   [function]
+        number_of_processes :                                                                 [int]
+
+    Outputs:
+        pool                : None if the particles are evaluated in this process             [multiprocessing.Pool]
+
+    Properties Used:
+        None
+    """
+
+    if number_of_processes is None or number_of_processes <= 1:
+        return None
+
+    if multiprocessing.get_start_method() != 'fork':
+        try:
+            pickle.dumps(function)
+        except Exception:
+            warnings.warn('The particle functions can not be pickled for the worker processes, ' + \
+                          'the particles are evaluated one after the other', Warning)
+            return None
+
+    return multiprocessing.Pool(number_of_processes, initializer=initialize_worker, initargs=(function,))
+
+## @ingroup Optimization-Package_Setups
+def evaluate_population(function, X, pool=None):
+    """
+    Evaluates the objective and the constraints of each particle of a population, spreading
+    the particles over a pool of processes if one is given.
+
+    Assumptions:
+        The workers of the pool were started with the same function by start_population_pool
+
+    Source:
+        N/A
+
+    Inputs:
+        function            : Returns the objective value and the constraints of a particle   [function]
+        X                   : One particle per row                                            [array]
+        pool                :                                                                 [multiprocessing.Pool]
+
+    Outputs:
+        objectives          : One per particle                                                [array]
+        constraints         : One row per particle                                            [array]
+
+    Properties Used:
+        None
+    """
+
+    if pool is None:
+        outputs = [function(x) for x in X]
+    else:
+        outputs = pool.map(evaluate_worker_particle, list(X))
+
+    objectives  = np.array([output[0] for output in outputs], dtype=float).reshape(len(X))
+    constraints = np.array([np.ravel(output[1]) for output in outputs], dtype=float).reshape(len(X),-1)
+
+    return objectives, constraints
+
+## @ingroup Optimization-Package_Setups
+def initialize_worker(function):
+    """
+    Keeps the particle function of a worker process
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        function        [function]
+
+    Outputs:
+        None
+
+    Properties Used:
+        None
+    """
+
+    global worker_function
+    worker_function = function
+
+## @ingroup Optimization-Package_Setups
+def evaluate_worker_particle(x):
+    """
+    Evaluates a particle with the particle function of the worker process
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        x               [array]
+
+    Outputs:
+        objective       [float]
+        constraints     [array]
+
+    Properties Used:
+        None
+    """
+
+    return worker_function(x)
@@ -5,6 +5,7 @@
 # Modified: Feb 2017, M. Vegh
 #           Mar 2020, E. Botero
 #           Jul 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -72,8 +73,15 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, tol
      
     # Finalize problem statement and run
     if solver=='SLSQP':
-        outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
-                                         iter=200, epsilon = sense_step, acc  = tolerance)
+        if problem.get('number_of_processes',1) > 1:
+            # the finite differences are spread over the processes of the nexus
+            gradients = SciPy_Gradients(problem,sense_step)
+            outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
+                                             fprime=gradients.objective,fprime_eqcons=gradients.equality_constraint,\
+                                             fprime_ieqcons=gradients.inequality_constraint,iter=200, epsilon = sense_step, acc  = tolerance)
+        else:
+            outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
+                                             iter=200, epsilon = sense_step, acc  = tolerance)
     elif solver == 'differential_evolution':
         # Define constraints as a tuple of nonlinear constraints 
         scaled_constraints = []
@@ -107,10 +115,22 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, tol
                                                      workers=1,constraints=diff_evo_cons)
         
     elif solver == 'particle_swarm_optimization':
-        outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
-                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
+        if problem.get('number_of_processes',1) > 1:
+            # the swarm is evaluated as one batch over the processes of the nexus
+            population = lambda X:SciPy_Population(problem,X)
+            outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
+                                                  omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,\
+                                                  vectorized=True, f_batch=population, seed=prob_seed)
+        else:
+            outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
+                                                  omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,\
+                                                  seed=prob_seed)    
     else:
         outputs = sp.optimize.minimize(wrapper,x,method=solver)
+        
+    # stop the worker processes of the batch evaluations
+    if problem.get('number_of_processes',1) > 1:
+        problem.close_pool()
     
     return outputs
 
@@ -145,3 +165,168 @@ def SciPy_Problem(problem,x):
     
     return obj
 
+## @ingroup Optimization-Package_Setups
+def SciPy_Population(problem,X):
+    """ Evaluates a population of design points for the population based solvers. The
+        objective and the constraints of every point come from one problem.evaluate_batch.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        problem   [nexus()]
+        X         [array] one scaled design vector per row
+
+        Outputs:
+        obj       [array] scaled objective of each point
+        ieq       [array] inequality constraints of each point, as problem.inequality_constraint
+
+        Properties Used:
+        None
+    """   
+    
+    con = problem.optimization_problem.constraints
+    
+    obj, all_con = problem.evaluate_batch(X)
+    
+    # the same differences to the bounds as problem.inequality_constraint
+    iq  = np.where(con[:,1]!='=')[0]
+    ieq = np.array(all_con[:,iq] - help_fun.scale_const_bnds(con[iq]),dtype=float)
+    ieq[:,con[iq,1]=='<'] = -ieq[:,con[iq,1]=='<']
+    
+    return obj, ieq
+
+## @ingroup Optimization-Package_Setups
+class SciPy_Gradients(object):
+    """ Finite difference gradients of the objective and the constraints for the SciPy solvers.
+        All of them come from one call to problem.finite_difference per design point, which
+        evaluates the perturbed design points with problem.evaluate_batch.
+
+        Assumptions:
+        The gradients of one design point are asked for before those of the next one
+
+        Source:
+        N/A
+    """
+    
+    def __init__(self,problem,sense_step):
+        """ Keeps the problem and the finite difference step
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            problem                   [nexus()]
+            sense_step                [float]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.problem    = problem
+        self.sense_step = sense_step
+        self.last_x     = None
+        self.grad_obj   = None
+        self.jac_con    = None
+        
+        constraints = problem.optimization_problem.constraints
+        signs       = constraints[:,1]
+        self.equality_indices   = np.where(signs=='=')[0]
+        self.inequality_indices = np.where(signs!='=')[0]
+        self.inequality_signs   = np.where(signs[self.inequality_indices]=='<',-1.,1.)
+        
+    def finite_difference(self,x):
+        """ Runs the finite differences unless they were already run at this design point
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            x                         [array]
+
+            Outputs:
+            grad_obj                  [array]
+            jac_con                   [array]
+
+            Properties Used:
+            None
+        """
+        if self.last_x is None or np.any(self.last_x != x):
+            self.grad_obj, self.jac_con = self.problem.finite_difference(x,diff_interval=self.sense_step)
+            self.last_x = np.array(x,dtype=float)
+        return self.grad_obj, self.jac_con
+        
+    def objective(self,x):
+        """ Gradient of the scaled objective
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            x                         [array]
+
+            Outputs:
+            grad_obj                  [array]
+
+            Properties Used:
+            None
+        """
+        grad_obj, jac_con = self.finite_difference(x)
+        return np.ravel(grad_obj)
+    
+    def equality_constraint(self,x):
+        """ Jacobian of the scaled equality constraints
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            x                         [array]
+
+            Outputs:
+            jac_eq                    [array]
+
+            Properties Used:
+            None
+        """
+        grad_obj, jac_con = self.finite_difference(x)
+        return jac_con[self.equality_indices]
+    
+    def inequality_constraint(self,x):
+        """ Jacobian of the scaled inequality constraints, with the constraints that have an
+            upper bound flipped the same way as problem.inequality_constraint
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            x                         [array]
+
+            Outputs:
+            jac_ieq                   [array]
+
+            Properties Used:
+            None
+        """
+        grad_obj, jac_con = self.finite_difference(x)
+        return self.inequality_signs[:,None]*jac_con[self.inequality_indices]
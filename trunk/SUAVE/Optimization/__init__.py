@@ -2,6 +2,7 @@
 # The files that help you setup an optimization problem.
 
 from .Nexus                      import Nexus
+from .Evaluation_Cache           import Evaluation_Cache
 from .read_optimization_outputs  import read_optimization_outputs
 from .write_optimization_outputs import write_optimization_outputs
 from .carpet_plot                import carpet_plot
@@ -3,12 +3,15 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
+import re
 import numpy as np
+from collections import OrderedDict
 from SUAVE.Core import Data
 
 # ----------------------------------------------------------------------        
@@ -43,42 +46,11 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     """      
     
     provided_names = input_dictionary[:,0]
+    accessors      = compile_aliases(aliases)
         
-    # Correspond aliases to inputs
-    pointer = []
     for ii in range(0,len(provided_names)):
-        for jj in range(0,len(aliases)):
-            if provided_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])
-
-    for ii in range(0,len(pointer)):
-        pointers = pointer[ii][:]
-        if isinstance(pointers,str):
-            length = 0
-            if '*' in pointers:
-                newstrings = find_a_star(dictionary,pointer[ii])
-                for jj in range(0,len(newstrings)):
-                    localstrs = newstrings[jj].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])
-                    
-            elif '*' not in pointers:
-                localstrs = pointers.split('.')
-                correctname = '.'.join(localstrs[0:])
-                dictionary.deep_set(correctname,converted_values[ii])              
-        else:
-            for zz in range(1,len(pointers)+1):
-                if '*' in pointers[zz-1]:
-                    newstrings = find_a_star(dictionary,pointer[ii][zz-1])
-                    for jj in range(0,len(newstrings)):
-                        localstrs = newstrings[jj].split('.')
-                        correctname = '.'.join(localstrs[0:])
-                        dictionary.deep_set(correctname,converted_values[ii])
-                        
-                elif '*' not in pointers[zz-1]:
-                    localstrs = pointers[zz-1].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])            
+        for setter in accessors.setters[provided_names[ii]]:
+            setter(dictionary,converted_values[ii])
             
     return dictionary
         
@@ -107,12 +79,9 @@ def find_a_star(dictionary,string):
     splitstring = string.split('.')
     for ii in range(0,len(splitstring)):
         if '*' in splitstring[ii]:
-            if ii==0:
-                newkeys = dictionary.keys()
-            elif ii !=0:
-                strtoeval = 'dictionary.'+'.'.join(splitstring[0:ii])+'.keys()'
-                newkeys = list(eval(strtoeval))
-            lastindex   = ii
+            lastindex = ii
+            
+    newkeys = list(get_path(dictionary,splitstring[0:lastindex]).keys())
             
     newstrings = []
     for ii in range(0,len(newkeys)):
@@ -203,20 +172,13 @@ def get_values(dictionary,outputs,aliases):
     N/A
     """     
     
-    npoutputs   = np.array(outputs)
+    npoutputs    = np.array(outputs)
     output_names = npoutputs[:,0]
-        
-    # Correspond aliases to outputs
-    pointer = []
-    for ii in range(0,len(output_names)):
-        for jj in range(0,len(aliases)):
-            if output_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])    
+    accessors    = compile_aliases(aliases)
                 
     values = np.zeros(len(outputs))
     for ii in range(0,len(outputs)):
-        splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+        values[ii]  = accessors.getters[output_names[ii]](dictionary)
     
     return values
 
@@ -331,3 +293,279 @@ def unscale_const_values(inputs,x):
     scaled =  x*provided_scale/provided_units
     
     return scaled
+
+
+# ----------------------------------------------------------------------        
+#   Compiled aliases
+# ----------------------------------------------------------------------  
+
+# the most recently compiled sets of aliases
+compiled_aliases_cache = OrderedDict()
+compiled_aliases_cache_size = 8
+
+# a key followed by any number of integer indices, like origin[0]
+simple_key = re.compile(r'^([A-Za-z_][A-Za-z_0-9]*)((?:\[-?[0-9]+\])*)$')
+
+## @ingroup Optimization
+def compile_aliases(aliases):
+    """ Builds a getter and a list of setters for every alias. The paths are only split and
+    parsed once, later calls with the same aliases reuse the accessors.
+
+    Assumptions:
+    Aliases with the same names and paths compile to the same accessors
+
+    Source:
+    N/A
+
+    Inputs:
+    aliases          [list of str]
+
+    Outputs:
+    accessors        [Data()]
+      getters        [dict] name -> function(dictionary)
+      setters        [dict] name -> list of function(dictionary,value)
+
+    Properties Used:
+    N/A
+    """  
+    
+    signature = tuple((alias[0],alias[1] if isinstance(alias[1],str) else tuple(alias[1])) for alias in aliases)
+    
+    if signature in compiled_aliases_cache:
+        compiled_aliases_cache.move_to_end(signature)
+        return compiled_aliases_cache[signature]
+    
+    accessors = Data()
+    accessors.getters = dict()
+    accessors.setters = dict()
+    for name, pointers in reversed(signature):
+        if isinstance(pointers,str):
+            pointers = (pointers,)
+        accessors.getters[name] = make_getter(pointers[0])
+        accessors.setters[name] = [make_setter(pointer) for pointer in pointers]
+        
+    compiled_aliases_cache[signature] = accessors
+    while len(compiled_aliases_cache) > compiled_aliases_cache_size:
+        compiled_aliases_cache.popitem(last=False)
+    
+    return accessors
+
+## @ingroup Optimization
+def make_getter(pointer):
+    """ Builds a function that reads the value an alias points to. Paths of plain keys and
+    integer indices are walked directly, anything else is evaluated as an expression that
+    is compiled the first time it is read.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    pointer          [str]
+
+    Outputs:
+    getter           [function(dictionary)]
+
+    Properties Used:
+    N/A
+    """     
+    
+    steps = parse_path(pointer)
+    
+    if steps is None:
+        code = None
+        def getter(dictionary):
+            nonlocal code
+            if code is None:
+                code = compile('dictionary.'+pointer,pointer,'eval')
+            return eval(code,{},{'dictionary':dictionary})
+    else:
+        def getter(dictionary):
+            data = dictionary
+            for key, indices in steps:
+                data = getattr(data,key)
+                for index in indices:
+                    data = data[index]
+            return data
+        
+    return getter
+
+## @ingroup Optimization
+def make_setter(pointer):
+    """ Builds a function that sets the value an alias points to, the same way Data.deep_set
+    does. A path with an asterisk is expanded over the keys at the asterisk, the expansion is
+    kept until those keys change.
+
+    Assumptions:
+    Only the last asterisk in a path is expanded
+
+    Source:
+    N/A
+
+    Inputs:
+    pointer          [str]
+
+    Outputs:
+    setter           [function(dictionary,value)]
+
+    Properties Used:
+    N/A
+    """      
+    
+    splitstring = pointer.split('.')
+    
+    if not '*' in pointer:
+        keys, last_key, indices = split_last_key(splitstring)
+        def setter(dictionary,value):
+            set_path(dictionary,keys,last_key,indices,value)
+        return setter
+    
+    for ii in range(0,len(splitstring)):
+        if '*' in splitstring[ii]:
+            lastindex = ii
+    prefix = splitstring[0:lastindex]
+    keys, last_key, indices = split_last_key(splitstring[lastindex+1:])
+    
+    expanded_keys  = None
+    expanded_paths = []
+    
+    def setter(dictionary,value):
+        nonlocal expanded_keys, expanded_paths
+        container = get_path(dictionary,prefix)
+        newkeys   = list(container.keys())
+        if newkeys != expanded_keys:
+            expanded_keys  = newkeys
+            expanded_paths = [[newkey] + keys for newkey in newkeys]
+        for path in expanded_paths:
+            set_path(container,path,last_key,indices,value)
+            
+    return setter
+
+## @ingroup Optimization
+def parse_path(pointer):
+    """ Splits a path into keys and the integer indices that follow each key
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    pointer          [str]
+
+    Outputs:
+    steps            [list of (str, list of int)] or None if the path is not that simple
+
+    Properties Used:
+    N/A
+    """      
+    
+    steps = []
+    for part in pointer.split('.'):
+        match = simple_key.match(part)
+        if match is None:
+            return None
+        indices = [int(index) for index in re.findall(r'-?[0-9]+',match.group(2))]
+        steps.append((match.group(1),indices))
+        
+    return steps
+
+## @ingroup Optimization
+def split_last_key(splitstring):
+    """ Separates the indices of the last key of a path, the same way Data.deep_set does
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    splitstring      [list of str]
+
+    Outputs:
+    keys             [list of str]
+    last_key         [str]
+    indices          [list of int]
+
+    Properties Used:
+    N/A
+    """      
+    
+    keys     = list(splitstring[:-1])
+    last_key = splitstring[-1]
+    indices  = []
+    if last_key[-1] == ']':
+        splitkey = last_key.split('[')
+        last_key = splitkey[0]
+        indices  = [int(key[:-1]) for key in splitkey[1:]]
+        
+    return keys, last_key, indices
+
+## @ingroup Optimization
+def get_path(dictionary,keys):
+    """ Walks down a list of keys
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    keys             [list of str]
+
+    Outputs:
+    data
+
+    Properties Used:
+    N/A
+    """  
+    
+    data = dictionary
+    for key in keys:
+        data = getattr(data,key)
+        
+    return data
+
+## @ingroup Optimization
+def set_path(dictionary,keys,last_key,indices,value):
+    """ Sets a value at the end of a list of keys, the same way Data.deep_set does
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    keys             [list of str]
+    last_key         [str]
+    indices          [list of int]
+    value
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """  
+    
+    data = dictionary
+    for key in keys:
+        data = data[key]
+        
+    if indices:
+        thing = data[last_key]
+        for index in indices[:-1]:
+            thing = thing[index]
+        thing[indices[-1]] = value
+    else:
+        data[last_key] = value
+        
+    return